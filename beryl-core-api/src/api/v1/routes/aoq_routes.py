@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.api.v1.schemas.aoq_schema import (
     AuditTrailResponse,
@@ -21,8 +21,13 @@ router = APIRouter()
 service = AoqService()
 
 
+def get_aoq_service() -> AoqService:
+    """Default AOQ service dependency; tests swap it via ``app.dependency_overrides``."""
+    return service
+
+
 @router.post("/signals", response_model=SignalResponse, status_code=status.HTTP_201_CREATED)
-def create_signal(request: SignalRequest):
+def create_signal(request: SignalRequest, service: AoqService = Depends(get_aoq_service)):
     try:
         payload = {
             "features": request.features.model_dump(),
@@ -48,7 +53,7 @@ def create_signal(request: SignalRequest):
 
 
 @router.post("/decision", response_model=DecisionResponse)
-def create_decision(request: DecisionRequest):
+def create_decision(request: DecisionRequest, service: AoqService = Depends(get_aoq_service)):
     try:
         decision = service.compute_decision(
             user_id=request.user_id,
@@ -80,18 +85,18 @@ def create_decision(request: DecisionRequest):
 
 
 @router.post("/evaluate", response_model=DecisionResponse)
-def evaluate_decision(request: DecisionRequest):
-    return create_decision(request)
+def evaluate_decision(request: DecisionRequest, service: AoqService = Depends(get_aoq_service)):
+    return create_decision(request, service)
 
 
 @router.get("/rules", response_model=list[RuleResponse])
-def list_rules():
+def list_rules(service: AoqService = Depends(get_aoq_service)):
     rules = service.list_rules()
     return [RuleResponse.model_validate(rule) for rule in rules]
 
 
 @router.post("/rules", response_model=RuleResponse, status_code=status.HTTP_201_CREATED)
-def create_rule(request: RuleSchema):
+def create_rule(request: RuleSchema, service: AoqService = Depends(get_aoq_service)):
     try:
         rule = service.create_rule(request.model_dump())
         return RuleResponse.model_validate(rule)
@@ -103,7 +108,7 @@ def create_rule(request: RuleSchema):
 
 
 @router.get("/decisions/{decision_id}", response_model=DecisionResponse)
-def get_decision(decision_id: UUID):
+def get_decision(decision_id: UUID, service: AoqService = Depends(get_aoq_service)):
     try:
         decision = service.get_decision(decision_id)
         return DecisionResponse(
@@ -125,7 +130,7 @@ def get_decision(decision_id: UUID):
 
 
 @router.get("/audit/{entity_id}", response_model=list[AuditTrailResponse])
-def get_audit(entity_id: str):
+def get_audit(entity_id: str, service: AoqService = Depends(get_aoq_service)):
     try:
         entries = service.get_audit_trail(entity_id)
         return [AuditTrailResponse.model_validate(item) for item in entries]
@@ -5,7 +5,7 @@ Exposes REST endpoints for electric mobility operations.
 Routes orchestrate requests through the mobility workflow.
 """
 
-from fastapi import APIRouter, HTTPException, Header, Request, Security, status
+from fastapi import APIRouter, HTTPException, Header, Request, Response, Security, status
 from fastapi.security import HTTPBearer
 from src.orchestration.mobility.fleet_intelligence import FleetIntelligenceWorkflow
 from src.orchestration.mobility.destination_intelligence import (
@@ -35,7 +35,6 @@ from src.observability.logger import logger
 
 router = APIRouter()
 workflow = FleetIntelligenceWorkflow()
-destination_workflow = DestinationIntelligenceWorkflow()
 ride_lifecycle_service = RideLifecycleService()
 security = HTTPBearer()
 
@@ -215,11 +214,11 @@ async def optimize_fleet_distribution(fleet_id: str, request: FleetDistributionR
             target_locations=request.target_locations
         )
         return FleetDistributionResponse(
-            fleet_id=distribution["fleet_id"],
-            timestamp=distribution["timestamp"],
-            current_state=distribution["current_state"],
-            demand_forecast=distribution["demand_forecast"],
-            recommendations=distribution["recommendations"]
+            fleet_id=distribution.fleet_id,
+            timestamp=distribution.timestamp,
+            current_state=distribution.current_state,
+            demand_forecast=distribution.demand_forecast,
+            recommendations=distribution.recommendations
         )
     except Exception as e:
         logger.error(f"Fleet distribution optimization failed: {str(e)}")
@@ -249,7 +248,7 @@ async def intelligent_destination(request: IntelligentDestinationRequest):
             request.origin,
             request.query,
         )
-        result = destination_workflow.evaluate(
+        result = DestinationIntelligenceWorkflow.evaluate(
             user_id=request.user_id,
             origin=request.origin,
             query=request.query,
@@ -264,13 +263,9 @@ async def intelligent_destination(request: IntelligentDestinationRequest):
         )
         return IntelligentDestinationResponse(
             selected_destination=result.selected_destination,
-            confidence=result.confidence,
+            confidence=round(result.confidence, 4),
             alternatives=[
-                IntelligentDestinationAlternative(
-                    destination=item.destination,
-                    confidence=item.confidence,
-                    score=item.score,
-                )
+                IntelligentDestinationAlternative(**item.to_dict())
                 for item in result.alternatives
             ],
             aoq=IntelligentDestinationAoq(
@@ -356,8 +351,11 @@ async def quote_ride(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     key = _require_idempotency_key(idempotency_key)
+    replay = ride_lifecycle_service.replay_json(action="quote", idempotency_key=key)
+    if replay is not None:
+        return Response(content=replay, media_type="application/json")
     try:
-        quote = ride_lifecycle_service.quote_ride(
+        quote = await ride_lifecycle_service.quote_ride(
             rider_id=payload.rider_id,
             pickup_label=payload.pickup_label,
             dropoff_label=payload.dropoff_label,
@@ -385,8 +383,11 @@ async def book_ride(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     key = _require_idempotency_key(idempotency_key)
+    replay = ride_lifecycle_service.replay_json(action="book", idempotency_key=key)
+    if replay is not None:
+        return Response(content=replay, media_type="application/json")
     try:
-        ride = ride_lifecycle_service.book_ride(
+        ride = await ride_lifecycle_service.book_ride(
             quote_id=payload.quote_id,
             rider_id=payload.rider_id,
             idempotency_key=key,
@@ -412,8 +413,11 @@ async def assign_ride(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     key = _require_idempotency_key(idempotency_key)
+    replay = ride_lifecycle_service.replay_json(action="assign", idempotency_key=key)
+    if replay is not None:
+        return Response(content=replay, media_type="application/json")
     try:
-        ride = ride_lifecycle_service.assign_ride(
+        ride = await ride_lifecycle_service.assign_ride(
             ride_id=payload.ride_id,
             driver_id=payload.driver_id,
             idempotency_key=key,
@@ -438,8 +442,11 @@ async def cancel_ride(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     key = _require_idempotency_key(idempotency_key)
+    replay = ride_lifecycle_service.replay_json(action="cancel", idempotency_key=key)
+    if replay is not None:
+        return Response(content=replay, media_type="application/json")
     try:
-        ride = ride_lifecycle_service.cancel_ride(
+        ride = await ride_lifecycle_service.cancel_ride(
             ride_id=payload.ride_id,
             reason=payload.reason,
             idempotency_key=key,
@@ -456,8 +463,11 @@ async def complete_ride(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     key = _require_idempotency_key(idempotency_key)
+    replay = ride_lifecycle_service.replay_json(action="complete", idempotency_key=key)
+    if replay is not None:
+        return Response(content=replay, media_type="application/json")
     try:
-        ride = ride_lifecycle_service.complete_ride(
+        ride = await ride_lifecycle_service.complete_ride(
             ride_id=payload.ride_id,
             distance_km=payload.distance_km,
             duration_minutes=payload.duration_minutes,
@@ -481,7 +491,7 @@ async def complete_ride(
 @router.get("/ride/{ride_id}", response_model=RideStateResponse)
 async def get_ride(ride_id: str):
     try:
-        ride = ride_lifecycle_service.get_ride(ride_id=ride_id)
+        ride = await ride_lifecycle_service.get_ride(ride_id=ride_id)
         return RideStateResponse.model_validate(ride)
     except RideLifecycleError as exc:
         _raise_lifecycle_error(exc)
@@ -7,7 +7,7 @@ from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import Callable
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from src.bfos.accounting.aoq_accounting_hook import categorize_transaction, risk_signal, suggest_cashflow_improvement
 from src.core.audit import audit_service
@@ -15,6 +15,13 @@ from src.db.models.fintech import FintechTransactionModel
 from src.db.sqlalchemy import Base, SessionLocal, get_engine
 from src.observability.logging.logger import logger
 
+# Built once so every statement period binds into the same cached statement.
+_TRANSACTIONS_IN_WINDOW = select(FintechTransactionModel).where(
+    FintechTransactionModel.actor_id == bindparam("user_id"),
+    FintechTransactionModel.created_at >= bindparam("start_dt"),
+    FintechTransactionModel.created_at <= bindparam("end_dt"),
+)
+
 
 @dataclass(frozen=True)
 class AggregatedTransaction:
@@ -46,15 +53,10 @@ class MerchantAccountingEngine:
         end_dt = datetime.combine(end_date, time.max).replace(tzinfo=timezone.utc)
 
         with self._session_factory() as session:
-            rows = list(
-                session.execute(
-                    select(FintechTransactionModel).where(
-                        FintechTransactionModel.actor_id == user_id,
-                        FintechTransactionModel.created_at >= start_dt,
-                        FintechTransactionModel.created_at <= end_dt,
-                    )
-                ).scalars().all()
-            )
+            rows = session.execute(
+                _TRANSACTIONS_IN_WINDOW,
+                {"user_id": user_id, "start_dt": start_dt, "end_dt": end_dt},
+            ).scalars().all()
 
             aggregated = [
                 AggregatedTransaction(
@@ -24,6 +24,12 @@ from src.db.sqlalchemy import Base, SessionLocal, get_engine
 from src.observability.logging.logger import logger
 from src.observability.metrics.prometheus import metrics
 
+_PERIOD_WINDOWS = {
+    "3m": timedelta(days=90),
+    "6m": timedelta(days=180),
+    "12m": timedelta(days=365),
+}
+
 
 class StatementEngine:
     """Creates immutable certified statements signed by Beryl key material."""
@@ -310,16 +316,11 @@ class StatementEngine:
     @staticmethod
     def _resolve_period(period: str) -> tuple[str, date, date]:
         label = period.strip().lower()
-        end_date = datetime.now(timezone.utc).date()
-        if label == "3m":
-            start_date = end_date - timedelta(days=90)
-        elif label == "6m":
-            start_date = end_date - timedelta(days=180)
-        elif label == "12m":
-            start_date = end_date - timedelta(days=365)
-        else:
+        window = _PERIOD_WINDOWS.get(label)
+        if window is None:
             raise ValueError("period must be one of: 3m, 6m, 12m")
-        return label, start_date, end_date
+        end_date = datetime.now(timezone.utc).date()
+        return label, end_date - window, end_date
 
     @staticmethod
     def _serialize(row: CertifiedStatementModel, *, idempotent: bool) -> dict:
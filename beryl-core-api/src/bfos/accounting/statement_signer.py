@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import hashlib
 from dataclasses import dataclass
+from typing import Iterable
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
@@ -30,18 +31,26 @@ class StatementSigner:
             raw_key = base64.b64decode(b64.encode("utf-8")) if b64 else None
 
         self._private_key = None
+        self._public_key = None
         self._public_key_pem = ""
         self._key_id = ""
+        self._scheme: tuple = ()
 
         if raw_key:
             key = serialization.load_pem_private_key(raw_key, password=None)
             self._private_key = key
-            public_pem = key.public_key().public_bytes(
+            self._public_key = key.public_key()
+            public_pem = self._public_key.public_bytes(
                 encoding=serialization.Encoding.PEM,
                 format=serialization.PublicFormat.SubjectPublicKeyInfo,
             )
             self._public_key_pem = public_pem.decode("utf-8")
             self._key_id = hashlib.sha256(public_pem).hexdigest()[:32]
+            # Padding/hash objects are stateless; resolve the scheme once per key.
+            if isinstance(key, rsa.RSAPrivateKey):
+                self._scheme = (padding.PKCS1v15(), hashes.SHA256())
+            else:
+                self._scheme = (ec.ECDSA(hashes.SHA256()),)
 
     @property
     def algorithm(self) -> str:
@@ -60,33 +69,32 @@ class StatementSigner:
         if self._private_key is None:
             raise RuntimeError("statement signing key is not configured")
 
-        payload = hash_hex.encode("utf-8")
-        if isinstance(self._private_key, rsa.RSAPrivateKey):
-            signature = self._private_key.sign(
-                payload,
-                padding.PKCS1v15(),
-                hashes.SHA256(),
-            )
-        else:
-            signature = self._private_key.sign(payload, ec.ECDSA(hashes.SHA256()))
-
+        signature = self._private_key.sign(hash_hex.encode("utf-8"), *self._scheme)
         encoded = base64.b64encode(signature).decode("utf-8")
         logger.info("event=bfos_statement_hash_signed", key_id=self._key_id, algorithm=self.algorithm)
         return encoded
 
     def verify_signature(self, hash_hex: str, signature: str) -> bool:
-        if self._private_key is None:
+        if self._public_key is None:
             return False
+        return self._verify(hash_hex, signature)
 
+    def verify_batch(self, pairs: Iterable[tuple[str, str]]) -> bool:
+        """Verify many ``(hash_hex, signature)`` pairs; True only if every one is valid.
+
+        Stops at the first invalid signature and reuses the loaded public key
+        across the batch.
+        """
+        if self._public_key is None:
+            return False
+        return all(self._verify(hash_hex, signature) for hash_hex, signature in pairs)
+
+    def _verify(self, hash_hex: str, signature: str) -> bool:
         payload = hash_hex.encode("utf-8")
         raw_signature = base64.b64decode(signature.encode("utf-8"))
-        pub_key = self._private_key.public_key()
 
         try:
-            if isinstance(pub_key, rsa.RSAPublicKey):
-                pub_key.verify(raw_signature, payload, padding.PKCS1v15(), hashes.SHA256())
-            else:
-                pub_key.verify(raw_signature, payload, ec.ECDSA(hashes.SHA256()))
+            self._public_key.verify(raw_signature, payload, *self._scheme)
             return True
         except Exception:  # pragma: no cover
             return False
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Callable
+from typing import Any, Callable, Iterable, Mapping
 from uuid import uuid4
 
 from src.bfos.aoq_hook import optimize_fee
@@ -15,6 +15,11 @@ from src.infrastructure.kafka.compliance.event_signature_verifier import event_s
 from src.observability.logging.logger import logger
 from src.observability.metrics.prometheus import metrics
 
+_DEFAULT_ACTOR = "bfos-fee-engine"
+_NEUTRAL_MULTIPLIER = Decimal("1.00")
+_RATE_QUANTUM = Decimal("0.000001")
+_CENT = Decimal("0.01")
+
 
 @dataclass(frozen=True)
 class FeeComputation:
@@ -25,6 +30,12 @@ class FeeComputation:
     currency: str
 
 
+def compute_commission(amount: Decimal, rate: Decimal) -> Decimal:
+    """Apply ``rate`` to ``amount`` and round to the cent, without side effects."""
+    adjusted_rate = rate.quantize(_RATE_QUANTUM, rounding=ROUND_HALF_UP)
+    return (amount * adjusted_rate).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
 class FeeEngine:
     """Computes regulated BFOS fees with mandatory audit logging."""
 
@@ -42,6 +53,12 @@ class FeeEngine:
         self._diaspora_rate = diaspora_rate or Decimal(str(settings.bfos_diaspora_fee_rate))
         self._certified_statement_rate = certified_statement_rate or Decimal(str(settings.bfos_certified_statement_fee_rate))
         self._tontine_rate = tontine_rate or Decimal(str(settings.bfos_tontine_fee_rate))
+        self._rates = {
+            "internal_transfer": self._internal_transfer_rate,
+            "diaspora": self._diaspora_rate,
+            "certified_statement": self._certified_statement_rate,
+            "tontine": self._tontine_rate,
+        }
 
     def calculate_internal_transfer_fee(self, amount: Decimal, **kwargs) -> FeeComputation:
         return self._calculate("internal_transfer", amount, self._internal_transfer_rate, **kwargs)
@@ -55,6 +72,45 @@ class FeeEngine:
     def calculate_tontine_fee(self, total_pool: Decimal, **kwargs) -> FeeComputation:
         return self._calculate("tontine", total_pool, self._tontine_rate, **kwargs)
 
+    def calculate_many(self, specs: Iterable[Mapping[str, Any]], *, session=None) -> list[FeeComputation]:
+        """Compute several fees and record their audits in one transaction.
+
+        Each spec carries ``fee_type`` and ``amount`` plus any keyword accepted by
+        the single-fee methods (``actor_id``, ``correlation_id``, ...).
+        """
+        if session is None:
+            with self._session_factory() as own_session:
+                with own_session.begin():
+                    return self.calculate_many(specs, session=own_session)
+
+        computations: list[FeeComputation] = []
+        audit_entries: list[dict] = []
+        for spec in specs:
+            options = dict(spec)
+            fee_type = options.pop("fee_type")
+            rate = self._rates.get(fee_type)
+            if rate is None:
+                raise ValueError(f"unsupported fee_type: {fee_type}")
+            amount = options.pop("amount")
+            actor_id = options.pop("actor_id", _DEFAULT_ACTOR)
+            correlation_id = options.pop("correlation_id", None)
+            transaction_id = options.pop("transaction_id", None)
+            computation = self._compute(fee_type, amount, rate, actor_id=actor_id, **options)
+            computations.append(computation)
+            audit_entries.append(
+                self._audit_entry(
+                    computation=computation,
+                    actor_id=actor_id,
+                    correlation_id=correlation_id or str(uuid4()),
+                    transaction_id=transaction_id,
+                )
+            )
+
+        audit_service.record_financial_events(session=session, entries=audit_entries)
+        for computation in computations:
+            self._report(computation)
+        return computations
+
     def _calculate(
         self,
         fee_type: str,
@@ -62,21 +118,43 @@ class FeeEngine:
         rate: Decimal,
         *,
         session=None,
-        actor_id: str = "bfos-fee-engine",
+        actor_id: str = _DEFAULT_ACTOR,
         currency: str = "XOF",
         correlation_id: str | None = None,
         transaction_id: str | None = None,
     ) -> FeeComputation:
-        base_amount = Decimal(str(amount))
+        computation = self._compute(fee_type, amount, rate, actor_id=actor_id, currency=currency)
+        self._record_audit(
+            computation=computation,
+            session=session,
+            actor_id=actor_id,
+            correlation_id=correlation_id or str(uuid4()),
+            transaction_id=transaction_id,
+        )
+        self._report(computation)
+        return computation
+
+    @staticmethod
+    def _compute(
+        fee_type: str,
+        amount: Decimal,
+        rate: Decimal,
+        *,
+        actor_id: str,
+        currency: str = "XOF",
+    ) -> FeeComputation:
+        base_amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
         if base_amount <= 0:
             raise ValueError("amount must be positive")
 
         aoq_profile = optimize_fee({"actor_id": actor_id, "fee_type": fee_type})
-        multiplier = Decimal(str(aoq_profile.get("multiplier", Decimal("1.00"))))
-        adjusted_rate = (rate * multiplier).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
-        fee_amount = (base_amount * adjusted_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        multiplier = aoq_profile.get("multiplier", _NEUTRAL_MULTIPLIER)
+        if not isinstance(multiplier, Decimal):
+            multiplier = Decimal(str(multiplier))
+        adjusted_rate = (rate * multiplier).quantize(_RATE_QUANTUM, rounding=ROUND_HALF_UP)
+        fee_amount = compute_commission(base_amount, adjusted_rate)
 
-        computation = FeeComputation(
+        return FeeComputation(
             fee_type=fee_type,
             base_amount=base_amount,
             fee_amount=fee_amount,
@@ -84,33 +162,30 @@ class FeeEngine:
             currency=currency.upper(),
         )
 
-        self._record_audit(
-            computation=computation,
-            session=session,
-            actor_id=actor_id,
-            correlation_id=correlation_id or str(uuid4()),
-            transaction_id=transaction_id,
+    @staticmethod
+    def _report(computation: FeeComputation) -> None:
+        metrics.record_fee_collected(
+            fee_type=computation.fee_type,
+            currency=computation.currency,
+            amount=float(computation.fee_amount),
         )
-        metrics.record_fee_collected(fee_type=fee_type, currency=computation.currency, amount=float(fee_amount))
         logger.info(
             "event=bfos_fee_computed",
-            fee_type=fee_type,
-            amount=str(base_amount),
-            fee_amount=str(fee_amount),
-            rate=str(adjusted_rate),
+            fee_type=computation.fee_type,
+            amount=str(computation.base_amount),
+            fee_amount=str(computation.fee_amount),
+            rate=str(computation.rate),
             currency=computation.currency,
         )
-        return computation
 
-    def _record_audit(
-        self,
+    @staticmethod
+    def _audit_entry(
         *,
         computation: FeeComputation,
-        session,
         actor_id: str,
         correlation_id: str,
         transaction_id: str | None,
-    ) -> None:
+    ) -> dict:
         payload = {
             "fee_type": computation.fee_type,
             "base_amount": str(computation.base_amount),
@@ -119,30 +194,38 @@ class FeeEngine:
             "transaction_id": transaction_id,
         }
         payload["signature"] = event_signature_verifier.sign(payload)
+        return {
+            "actor_id": actor_id,
+            "action": "BFOS_FEE_CALCULATED",
+            "amount": computation.fee_amount,
+            "currency": computation.currency,
+            "correlation_id": correlation_id,
+            "payload": payload,
+        }
+
+    def _record_audit(
+        self,
+        *,
+        computation: FeeComputation,
+        session,
+        actor_id: str,
+        correlation_id: str,
+        transaction_id: str | None,
+    ) -> None:
+        entry = self._audit_entry(
+            computation=computation,
+            actor_id=actor_id,
+            correlation_id=correlation_id,
+            transaction_id=transaction_id,
+        )
 
         if session is not None:
-            audit_service.record_financial_event(
-                session=session,
-                actor_id=actor_id,
-                action="BFOS_FEE_CALCULATED",
-                amount=computation.fee_amount,
-                currency=computation.currency,
-                correlation_id=correlation_id,
-                payload=payload,
-            )
+            audit_service.record_financial_event(session=session, **entry)
             return
 
         with self._session_factory() as own_session:
             with own_session.begin():
-                audit_service.record_financial_event(
-                    session=own_session,
-                    actor_id=actor_id,
-                    action="BFOS_FEE_CALCULATED",
-                    amount=computation.fee_amount,
-                    currency=computation.currency,
-                    correlation_id=correlation_id,
-                    payload=payload,
-                )
+                audit_service.record_financial_event(session=own_session, **entry)
 
 
 fee_engine = FeeEngine()
@@ -287,12 +287,9 @@ class FxEngine:
         row = self._get_or_seed_rate(session)
         return self._validate_rate_row(row)
 
-    @staticmethod
-    def _validate_rate_row(row: FxRateModel) -> bool:
-        expected_hash = hashlib.sha256(
-            json.dumps(row.payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-        ).hexdigest()
-        if expected_hash != row.rate_hash:
+    @classmethod
+    def _validate_rate_row(cls, row: FxRateModel) -> bool:
+        if cls._hash_payload(row.payload) != row.rate_hash:
             return False
 
         signed_payload = dict(row.payload)
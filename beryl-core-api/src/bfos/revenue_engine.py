@@ -22,6 +22,8 @@ from src.infrastructure.kafka.compliance.event_signature_verifier import event_s
 from src.observability.logging.logger import logger
 from src.observability.metrics.prometheus import metrics
 
+_CENT = Decimal("0.01")
+
 
 class RevenueEngine:
     """Records monetization events with full compliance guarantees."""
@@ -56,7 +58,8 @@ class RevenueEngine:
     ) -> dict:
         normalized_currency = currency.upper().strip()
         normalized_source = source.strip().lower()
-        normalized_amount = Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        base_amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+        normalized_amount = base_amount.quantize(_CENT, rounding=ROUND_HALF_UP)
         if normalized_amount <= 0:
             raise ValueError("revenue amount must be positive")
 
@@ -105,26 +108,27 @@ class RevenueEngine:
             if since is not None:
                 stmt = stmt.where(RevenueRecordModel.created_at >= since)
 
-            rows = list(session.execute(stmt).all())
+            rows = session.execute(stmt).all()
 
+        # GROUP BY already yields one row per (source, currency); no re-keying needed.
         total = Decimal("0.00")
-        by_source: dict[str, dict] = {}
+        items: list[dict] = []
         for row in rows:
-            source = str(row.source)
-            currency = str(row.currency)
-            subtotal = Decimal(str(row.total_amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            subtotal = Decimal(str(row.total_amount)).quantize(_CENT, rounding=ROUND_HALF_UP)
             total += subtotal
-            by_source[f"{source}:{currency}"] = {
-                "source": source,
-                "currency": currency,
-                "amount": str(subtotal),
-                "count": int(row.count),
-            }
+            items.append(
+                {
+                    "source": str(row.source),
+                    "currency": str(row.currency),
+                    "amount": str(subtotal),
+                    "count": int(row.count),
+                }
+            )
 
         return {
             "period": period,
-            "total_amount": str(total.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)),
-            "items": list(by_source.values()),
+            "total_amount": str(total.quantize(_CENT, rounding=ROUND_HALF_UP)),
+            "items": items,
         }
 
     def _record_revenue_txn(
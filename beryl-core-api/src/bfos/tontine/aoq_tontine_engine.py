@@ -2,11 +2,67 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+from decimal import Decimal, ROUND_FLOOR
+from typing import Iterable
 
 from src.bfos.tontine.reputation_engine import reputation_engine
 from src.observability.logging.logger import logger
 
+try:
+    import numpy as np
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - optional acceleration
+    np = None
+    njit = None
+
+_NUMBA_AVAILABLE = njit is not None
+_NUMBA_BATCH_THRESHOLD = 64
+
+# Reputation thresholds, also expressed in hundredths for the integer kernel.
+_DEFAULT_RISK_REPUTATION = Decimal("30")
+_CRITICAL_RISK_REPUTATION = Decimal("20")
+_DEFAULT_RISK_REPUTATION_HUNDREDTHS = 3000
+_CRITICAL_RISK_REPUTATION_HUNDREDTHS = 2000
+_SEVERITIES = ("low", "high", "critical")
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _default_risk_levels_numba(reputation_hundredths, missed_contributions):
+        """Severity index per group; mirrors ``_default_risk_level``."""
+        levels = np.empty(reputation_hundredths.shape[0], dtype=np.int8)
+        for index in range(reputation_hundredths.shape[0]):
+            if reputation_hundredths[index] < _CRITICAL_RISK_REPUTATION_HUNDREDTHS:
+                levels[index] = 2
+            elif missed_contributions[index] > 0 or reputation_hundredths[index] < _DEFAULT_RISK_REPUTATION_HUNDREDTHS:
+                levels[index] = 1
+            else:
+                levels[index] = 0
+        return levels
+
+    _default_risk_levels_numba(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+
+def _default_risk_inputs(context: dict | None) -> tuple[Decimal, int]:
+    payload = context or {}
+    return Decimal(str(payload.get("avg_reputation", "50"))), int(payload.get("missed_contributions", 0))
+
+
+def _default_risk_level(avg_reputation: Decimal, missed_contributions: int) -> tuple[bool, str]:
+    flagged = missed_contributions > 0 or avg_reputation < _DEFAULT_RISK_REPUTATION
+    severity = "critical" if avg_reputation < _CRITICAL_RISK_REPUTATION else ("high" if flagged else "low")
+    return flagged, severity
+
+
+def _default_risk_result(flagged: bool, severity: str) -> dict:
+    return {
+        "signal": "default_risk",
+        "flagged": flagged,
+        "severity": severity,
+        "reason": "aoq_tontine_default_risk_heuristic",
+    }
+
 
 def detect_collusion(context: dict | None = None) -> dict:
     """Detect suspicious coordinated voting behavior."""
@@ -27,21 +83,39 @@ def detect_collusion(context: dict | None = None) -> dict:
 
 def detect_default_risk(context: dict | None = None) -> dict:
     """Detect elevated default risk from contribution/reputation indicators."""
-    payload = context or {}
-    missed_contributions = int(payload.get("missed_contributions", 0))
-    avg_reputation = Decimal(str(payload.get("avg_reputation", "50")))
-    flagged = missed_contributions > 0 or avg_reputation < Decimal("30")
-    severity = "critical" if avg_reputation < Decimal("20") else ("high" if flagged else "low")
-    result = {
-        "signal": "default_risk",
-        "flagged": flagged,
-        "severity": severity,
-        "reason": "aoq_tontine_default_risk_heuristic",
-    }
+    avg_reputation, missed_contributions = _default_risk_inputs(context)
+    result = _default_risk_result(*_default_risk_level(avg_reputation, missed_contributions))
     logger.info("event=tontine_aoq_default_risk_evaluated", result=str(result))
     return result
 
 
+def detect_default_risk_many(contexts: Iterable[dict | None]) -> list[dict]:
+    """Score default risk for many groups at once; same signals as ``detect_default_risk``.
+
+    Large batches run through a compiled kernel on reputations floored to
+    hundredths, which is exact against the integer thresholds.
+    """
+    inputs = [_default_risk_inputs(context) for context in contexts]
+    if _NUMBA_AVAILABLE and len(inputs) >= _NUMBA_BATCH_THRESHOLD:
+        levels = _default_risk_levels_numba(
+            np.fromiter(
+                (int((reputation * 100).to_integral_value(rounding=ROUND_FLOOR)) for reputation, _ in inputs),
+                dtype=np.int64,
+                count=len(inputs),
+            ),
+            np.fromiter((missed for _, missed in inputs), dtype=np.int64, count=len(inputs)),
+        )
+        results = [_default_risk_result(level > 0, _SEVERITIES[level]) for level in levels.tolist()]
+    else:
+        results = [_default_risk_result(*_default_risk_level(*item)) for item in inputs]
+    logger.info(
+        "event=tontine_aoq_default_risk_batch_evaluated",
+        groups=str(len(results)),
+        flagged=str(sum(1 for result in results if result["flagged"])),
+    )
+    return results
+
+
 def detect_schedule_manipulation(context: dict | None = None) -> dict:
     """Detect active-cycle frequency tampering attempts."""
     payload = context or {}
@@ -13,14 +13,14 @@ from src.observability.logging.logger import logger
 
 _CODE_PATTERN = re.compile(r"^\d{5}$")
 _ALGORITHM = "pbkdf2_sha256"
-_ITERATIONS = 200_000
 
 
 class SecurityCodeManager:
     """Manage secure hashing of 5-digit Tontine shared code."""
 
-    def __init__(self, *, pepper: str | None = None) -> None:
+    def __init__(self, *, pepper: str | None = None, iterations: int | None = None) -> None:
         self._pepper = (pepper or settings.bfos_tontine_security_code_pepper).encode("utf-8")
+        self._iterations = iterations or settings.bfos_tontine_security_code_iterations
 
     @staticmethod
     def _validate_code_format(code: str) -> str:
@@ -36,9 +36,9 @@ class SecurityCodeManager:
             "sha256",
             normalized.encode("utf-8"),
             f"{salt}:{self._pepper.decode('utf-8')}".encode("utf-8"),
-            _ITERATIONS,
+            self._iterations,
         ).hex()
-        value = f"{_ALGORITHM}${_ITERATIONS}${salt}${digest}"
+        value = f"{_ALGORITHM}${self._iterations}${salt}${digest}"
         logger.info("event=tontine_security_code_hashed")
         return value
 
@@ -5,10 +5,13 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Callable
+from typing import Callable, Iterator
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from src.bfos.tontine.aoq_tontine_engine import (
     adjust_reputation,
@@ -57,6 +60,7 @@ class TontineEngine:
         self._distributions = distributions or distribution_engine
         self._unanimous = unanimous or unanimous_withdrawal_engine
         self._codes = codes or security_code_manager
+        self._batch_session: ContextVar[Session | None] = ContextVar(f"tontine_batch_{id(self)}", default=None)
         try:
             Base.metadata.create_all(
                 bind=get_engine(),
@@ -76,6 +80,45 @@ class TontineEngine:
         except Exception as exc:  # pragma: no cover
             logger.warning(f"event=tontine_bootstrap_skipped reason={str(exc)}")
 
+    @contextmanager
+    def batch(self) -> Iterator[Session]:
+        """Run a sequence of engine calls on one session and commit them together.
+
+        Each call still runs in its own SAVEPOINT, so a call that raises rolls
+        back on its own; an exception escaping the block rolls back the batch.
+        """
+        if self._batch_session.get() is not None:
+            raise RuntimeError("tontine batch already active")
+        with self._session_factory() as session:
+            with session.begin():
+                token = self._batch_session.set(session)
+                try:
+                    yield session
+                finally:
+                    self._batch_session.reset(token)
+
+    def _session(self):
+        session = self._batch_session.get()
+        return self._session_factory() if session is None else nullcontext(session)
+
+    def _begin(self, session):
+        return self._savepoint(session) if self._batch_session.get() is not None else session.begin()
+
+    @staticmethod
+    @contextmanager
+    def _savepoint(session: Session) -> Iterator[None]:
+        # AuditService caches the chain tip on the session; a rolled-back call must not leave it pointing at a discarded row.
+        audit_tip = session.info.get("audit_last_hash")
+        try:
+            with session.begin_nested():
+                yield
+        except BaseException:
+            if audit_tip is None:
+                session.info.pop("audit_last_hash", None)
+            else:
+                session.info["audit_last_hash"] = audit_tip
+            raise
+
     @staticmethod
     def _parse_uuid(raw_id: str, field_name: str) -> uuid.UUID:
         try:
@@ -205,8 +248,8 @@ class TontineEngine:
         if max_members < 2 or max_members > settings.bfos_tontine_max_members:
             raise ValueError(f"max_members must be between 2 and {settings.bfos_tontine_max_members}")
 
-        with self._session_factory() as session:
-            with session.begin():
+        with self._session() as session:
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=created_by)
                 security_hash = self._codes.hash_security_code(security_code)
                 signature_hash = self._build_signature_hash(
@@ -278,8 +321,8 @@ class TontineEngine:
         idempotency_key: str,
         correlation_id: str,
     ) -> dict:
-        with self._session_factory() as session:
-            with session.begin():
+        with self._session() as session:
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=user_id)
                 group = self._load_group(session=session, tontine_id=tontine_id)
                 if group.status in {"FROZEN", "CLOSED"}:
@@ -326,8 +369,8 @@ class TontineEngine:
         idempotency_key: str,
         correlation_id: str,
     ) -> dict:
-        with self._session_factory() as session:
-            with session.begin():
+        with self._session() as session:
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=user_id)
                 group = self._load_group(session=session, tontine_id=tontine_id)
                 if group.status != "ACTIVE":
@@ -400,8 +443,8 @@ class TontineEngine:
         correlation_id: str,
     ) -> dict:
         normalized_amount = self._normalize_amount(amount)
-        with self._session_factory() as session:
-            with session.begin():
+        with self._session() as session:
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=requested_by)
                 group = self._load_group(session=session, tontine_id=tontine_id)
                 if group.status == "FROZEN":
@@ -450,8 +493,8 @@ class TontineEngine:
         idempotency_key: str,
         correlation_id: str,
     ) -> dict:
-        with self._session_factory() as session:
-            with session.begin():
+        with self._session() as session:
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=user_id)
                 group = self._load_group(session=session, tontine_id=tontine_id)
                 if group.status == "FROZEN":
@@ -525,10 +568,10 @@ class TontineEngine:
         correlation_id: str,
     ) -> dict:
         normalized_request = validate_frequency(requested_frequency)
-        with self._session_factory() as session:
+        with self._session() as session:
             rejection_error: ValueError | None = None
             snapshot: dict | None = None
-            with session.begin():
+            with self._begin(session):
                 self._claim_idempotency(session=session, idempotency_key=idempotency_key, actor_id=actor_id)
                 group = self._load_group(session=session, tontine_id=tontine_id)
                 active_cycle = self._latest_cycle(session=session, group_id=group.id)
@@ -590,7 +633,7 @@ class TontineEngine:
             return snapshot
 
     def get_tontine(self, *, tontine_id: str, security_code: str | None = None) -> dict | None:
-        with self._session_factory() as session:
+        with self._session() as session:
             group_uuid = self._parse_uuid(tontine_id, "tontine_id")
             group = session.execute(select(TontineGroupModel).where(TontineGroupModel.id == group_uuid)).scalar_one_or_none()
             if group is None:
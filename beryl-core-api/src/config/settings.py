@@ -5,6 +5,16 @@ import os
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
+PBKDF2_MIN_ITERATIONS = 100_000
+
+
+def _pbkdf2_iterations() -> int:
+    """PBKDF2 rounds for the 5-digit tontine codes; only the test suite may go below the floor."""
+    iterations = int(os.getenv("BERYL_PBKDF2_ITERATIONS", 200_000))
+    if iterations < PBKDF2_MIN_ITERATIONS and os.getenv("TESTING") != "1":
+        raise ValueError(f"BERYL_PBKDF2_ITERATIONS must be at least {PBKDF2_MIN_ITERATIONS}, got {iterations}")
+    return iterations
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -41,6 +51,7 @@ class Settings(BaseSettings):
     # External APIs
     fintech_api_url: str = os.getenv("FINTECH_API_URL", "https://api.fintech.example.com")
     mobility_api_url: str = os.getenv("MOBILITY_API_URL", "https://api.mobility.example.com")
+    mobility_bulk_demand_enabled: bool = os.getenv("MOBILITY_BULK_DEMAND_ENABLED", "false").lower() == "true"
     esg_api_url: str = os.getenv("ESG_API_URL", "https://api.esg.example.com")
     social_api_url: str = os.getenv("SOCIAL_API_URL", "https://api.social.example.com")
     greenos_model_version: str = os.getenv("GREENOS_MODEL_VERSION", "greenos-co2-v1")
@@ -130,6 +141,7 @@ class Settings(BaseSettings):
     bfos_statement_signing_private_key_b64: str = os.getenv("BFOS_STATEMENT_SIGNING_PRIVATE_KEY_B64", "")
     bfos_tontine_max_members: int = int(os.getenv("BFOS_TONTINE_MAX_MEMBERS", 10))
     bfos_tontine_security_code_pepper: str = os.getenv("BFOS_TONTINE_SECURITY_CODE_PEPPER", "change-me-tontine-pepper")
+    bfos_tontine_security_code_iterations: int = _pbkdf2_iterations()
     bfos_tontine_currency: str = os.getenv("BFOS_TONTINE_CURRENCY", "XOF")
     bfos_tontine_default_reputation_score: float = float(os.getenv("BFOS_TONTINE_DEFAULT_REPUTATION_SCORE", 50.0))
     bfos_tontine_late_penalty_rate: float = float(os.getenv("BFOS_TONTINE_LATE_PENALTY_RATE", 0.01))
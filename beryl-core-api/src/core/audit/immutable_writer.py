@@ -12,3 +12,6 @@ class ImmutableAuditWriter:
 
     def write(self, session, event: AuditEvent):
         return self._repository.append(session=session, event=event)
+
+    def write_many(self, session, events: list[AuditEvent]):
+        return self._repository.append_many(session=session, events=events)
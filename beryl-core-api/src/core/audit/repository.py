@@ -25,7 +25,21 @@ class AuditRepository:
         return latest.current_hash if latest else "GENESIS"
 
     def append(self, session: Session, event: AuditEvent) -> AuditChainEventModel:
-        row = AuditChainEventModel(
+        row = self._to_row(event)
+        session.add(row)
+        session.flush()
+        return row
+
+    def append_many(self, session: Session, events: list[AuditEvent]) -> list[AuditChainEventModel]:
+        """Add already-chained events and flush them as one batched INSERT."""
+        rows = [self._to_row(event) for event in events]
+        session.add_all(rows)
+        session.flush()
+        return rows
+
+    @staticmethod
+    def _to_row(event: AuditEvent) -> AuditChainEventModel:
+        return AuditChainEventModel(
             event_id=event.event_id,
             actor_id=event.actor_id,
             action=event.action,
@@ -38,9 +52,6 @@ class AuditRepository:
             payload=event.payload,
             created_at=event.timestamp,
         )
-        session.add(row)
-        session.flush()
-        return row
 
     def list_paginated(self, session: Session, *, limit: int, offset: int) -> list[AuditChainEventModel]:
         stmt = (
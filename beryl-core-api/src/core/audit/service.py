@@ -6,8 +6,10 @@ import hashlib
 import hmac
 import json
 import time
+from dataclasses import replace
+from datetime import timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Callable
+from typing import Any, Callable, Iterable, Mapping
 
 from sqlalchemy.orm import Session
 
@@ -47,29 +49,13 @@ class AuditService:
         payload: dict,
     ) -> AuditChainEventModel:
         started = time.perf_counter()
-        previous_hash = session.info.get("audit_last_hash")
-        if previous_hash is None:
-            previous_hash = self._repository.get_latest_hash(session)
-        current_hash = self._compute_current_hash(
-            actor_id=actor_id,
-            action=action,
-            amount=amount,
-            currency=currency,
-            correlation_id=correlation_id,
-            previous_hash=previous_hash,
-            payload=payload,
-        )
-        signature = self._sign_current_hash(current_hash)
-
-        event = AuditEvent.build(
+        event = self._chain_event(
+            previous_hash=self._previous_hash(session),
             actor_id=actor_id,
             action=action,
             amount=amount,
             currency=currency,
             correlation_id=correlation_id,
-            previous_hash=previous_hash,
-            current_hash=current_hash,
-            signature=signature,
             payload=payload,
         )
 
@@ -79,6 +65,36 @@ class AuditService:
         metrics.record_audit_write_latency(latency_ms)
         return written
 
+    def record_financial_events(
+        self,
+        *,
+        session: Session,
+        entries: Iterable[Mapping[str, Any]],
+    ) -> list[AuditChainEventModel]:
+        """Chain several events in order and write them with a single flush.
+
+        Each entry carries the keyword arguments of ``record_financial_event``
+        except ``session``.
+        """
+        started = time.perf_counter()
+        previous_hash = self._previous_hash(session)
+        events: list[AuditEvent] = []
+        for entry in entries:
+            event = self._chain_event(previous_hash=previous_hash, **entry)
+            if events and event.timestamp <= events[-1].timestamp:
+                # verify_chain walks rows by created_at; keep the batch strictly ordered.
+                event = replace(event, timestamp=events[-1].timestamp + timedelta(microseconds=1))
+            events.append(event)
+            previous_hash = event.current_hash
+        if not events:
+            return []
+
+        written = self._writer.write_many(session=session, events=events)
+        session.info["audit_last_hash"] = previous_hash
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.record_audit_write_latency(latency_ms)
+        return written
+
     def list_events(self, *, limit: int = 50, offset: int = 0) -> list[AuditChainEventModel]:
         with self._session_factory() as session:
             return self._repository.list_paginated(session, limit=limit, offset=offset)
@@ -90,6 +106,44 @@ class AuditService:
                 metrics.record_audit_integrity_failure(len(issues))
             return ok, issues
 
+    def _previous_hash(self, session: Session) -> str:
+        previous_hash = session.info.get("audit_last_hash")
+        if previous_hash is None:
+            previous_hash = self._repository.get_latest_hash(session)
+        return previous_hash
+
+    def _chain_event(
+        self,
+        *,
+        previous_hash: str,
+        actor_id: str,
+        action: str,
+        amount: Decimal | None,
+        currency: str | None,
+        correlation_id: str,
+        payload: dict,
+    ) -> AuditEvent:
+        current_hash = self._compute_current_hash(
+            actor_id=actor_id,
+            action=action,
+            amount=amount,
+            currency=currency,
+            correlation_id=correlation_id,
+            previous_hash=previous_hash,
+            payload=payload,
+        )
+        return AuditEvent.build(
+            actor_id=actor_id,
+            action=action,
+            amount=amount,
+            currency=currency,
+            correlation_id=correlation_id,
+            previous_hash=previous_hash,
+            current_hash=current_hash,
+            signature=self._sign_current_hash(current_hash),
+            payload=payload,
+        )
+
     def _compute_current_hash(
         self,
         *,
@@ -5,7 +5,9 @@ from __future__ import annotations
 import base64
 import hmac
 import json
+import re
 import secrets
+from enum import Enum
 from hashlib import sha256
 
 from src.config.settings import settings
@@ -21,6 +23,50 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - runtime dependency guard
     AESGCM = None
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - canonical JSON falls back to stdlib
+    orjson = None
+
+# orjson output that could differ from the stdlib canonical form: non-ASCII or
+# DEL bytes (stdlib escapes them), floats below 1e-4 or written with an exponent
+# (repr() switches notation at different bounds) and null (orjson also writes
+# NaN/Infinity as null).
+_ORJSON_DIVERGENT = re.compile(rb"[^\x00-\x7e]|\de|0\.0000|null")
+# Passthrough keeps types the stdlib rejects (datetime, dataclasses, subclasses)
+# on the stdlib path so they still raise TypeError.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None
+    else 0
+)
+
+
+def _contains_plain_enum(value) -> bool:
+    # orjson writes any Enum member as its value and has no passthrough for it;
+    # the stdlib only accepts str/int mixins and must keep raising for the rest.
+    if isinstance(value, dict):
+        return any(_contains_plain_enum(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_plain_enum(item) for item in value)
+    return isinstance(value, Enum) and not isinstance(value, (str, int))
+
+
+def canonical_json_bytes(payload: dict) -> bytes:
+    """Sorted, compact, ASCII-only JSON; byte-identical to the stdlib canonical form."""
+    if orjson is not None and not _contains_plain_enum(payload):
+        try:
+            raw = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+        else:
+            if _ORJSON_DIVERGENT.search(raw) is None:
+                return raw
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
 
 if CryptContext is not None:
     pwd_context = CryptContext(
@@ -79,8 +125,7 @@ class SignatureService:
     """HMAC-SHA256 signing for financial events and webhook verification."""
 
     def sign(self, payload: dict, secret: str) -> str:
-        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-        return hmac.new(secret.encode("utf-8"), canonical.encode("utf-8"), sha256).hexdigest()
+        return hmac.digest(secret.encode("utf-8"), canonical_json_bytes(payload), "sha256").hex()
 
     def verify(self, payload: dict, signature: str, secret: str) -> bool:
         expected = self.sign(payload=payload, secret=secret)
@@ -6,12 +6,36 @@ Handlers must be idempotent and never modify source domain state.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Dict, Any, Callable, Optional, List, Type
 from src.events.base.event import DomainEvent, DomainEventType
 from src.observability.logger import logger
 import asyncio
 
 
+class RecentEventIds:
+    """Bounded idempotency guard: O(1) membership over the newest ``maxlen`` event ids."""
+    
+    def __init__(self, maxlen: int = 4096):
+        self._ids: set = set()
+        self._order: deque = deque()
+        self._maxlen = maxlen
+    
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._ids
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def add(self, event_id: str) -> None:
+        if event_id in self._ids:
+            return
+        self._ids.add(event_id)
+        self._order.append(event_id)
+        if len(self._order) > self._maxlen:
+            self._ids.discard(self._order.popleft())
+
+
 class EventHandler(ABC):
     """Base class for all event handlers."""
     
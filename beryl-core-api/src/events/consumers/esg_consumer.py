@@ -1,15 +1,14 @@
 """ESG domain event consumers."""
 
 from src.events.base.event import DomainEvent, DomainEventType
-from src.events.base.event_handler import EventHandler
+from src.events.base.event_handler import EventHandler, RecentEventIds
 from src.observability.logger import logger
-from typing import Set
 
 
 class EsgScoreComputedConsumer(EventHandler):
     """Consumes EsgScoreComputed events for analytics/reporting."""
     
-    _processed: Set[str] = set()
+    _processed = RecentEventIds()
     
     def can_handle(self, event: DomainEvent) -> bool:
         return event.event_type == DomainEventType.ESG_SCORE_COMPUTED
@@ -1,16 +1,15 @@
 """Fintech domain event consumers (cross-domain listeners)."""
 
 from src.events.base.event import DomainEvent, DomainEventType
-from src.events.base.event_handler import EventHandler
+from src.events.base.event_handler import EventHandler, RecentEventIds
 from src.observability.logger import logger
-from typing import Set
 
 
 class TransactionCompletedConsumer(EventHandler):
     """Consumes TransactionCompleted events from Fintech."""
     
     # Track processed events for idempotency
-    _processed: Set[str] = set()
+    _processed = RecentEventIds()
     handled_events: list = []
     
     def can_handle(self, event: DomainEvent) -> bool:
@@ -47,7 +46,7 @@ class TransactionCompletedConsumer(EventHandler):
 class PaymentFailedConsumer(EventHandler):
     """Consumes PaymentFailed events from Fintech."""
     
-    _processed: Set[str] = set()
+    _processed = RecentEventIds()
     
     def can_handle(self, event: DomainEvent) -> bool:
         return event.event_type == DomainEventType.PAYMENT_FAILED
@@ -1,15 +1,14 @@
 """Mobility domain event consumers."""
 
 from src.events.base.event import DomainEvent, DomainEventType
-from src.events.base.event_handler import EventHandler
+from src.events.base.event_handler import EventHandler, RecentEventIds
 from src.observability.logger import logger
-from typing import Set
 
 
 class RideCompletedConsumer(EventHandler):
     """Consumes RideCompleted events and updates user ESG metrics."""
     
-    _processed: Set[str] = set()
+    _processed = RecentEventIds()
     
     def can_handle(self, event: DomainEvent) -> bool:
         return event.event_type == DomainEventType.RIDE_COMPLETED
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import json
-
-from src.core.security.crypto import signature_service
+from src.core.security.crypto import canonical_json_bytes, signature_service
 from src.core.security.key_management import key_manager
 
 
@@ -30,7 +28,7 @@ class EventSignatureVerifier:
         return signature_service.verify(payload=unsigned, signature=signature, secret=self._secret)
 
     def canonical_payload(self, payload: dict) -> str:
-        return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        return canonical_json_bytes(payload).decode("ascii")
 
 
 event_signature_verifier = EventSignatureVerifier()
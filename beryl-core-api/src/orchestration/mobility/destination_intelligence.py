@@ -12,13 +12,34 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from hashlib import sha256
+from itertools import chain
 from math import ceil
-from typing import Iterable
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
 from src.api.v1.schemas.mobility_schema import DestinationHistoryItem
 from src.observability.logger import logger
 
+try:
+    import numpy as np
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - optional acceleration
+    np = None
+    njit = None
+
+_NUMBA_AVAILABLE = njit is not None
+_NUMBA_BATCH_THRESHOLD = 16
+
+_TRAFFIC_FACTOR: Mapping[str, float] = MappingProxyType({"low": 1.0, "moderate": 1.22, "high": 1.45})
+_MODE_ENERGY: Mapping[str, float] = MappingProxyType({"solo": 0.13, "family": 0.17, "eco": 0.10})
+_TRAFFIC_SCORE: Mapping[str, float] = MappingProxyType({"low": 90.0, "moderate": 72.0, "high": 54.0})
+_TRAFFIC_PENALTY: Mapping[str, float] = MappingProxyType({"moderate": 0.04, "high": 0.10})
+_MORNING_KEYWORDS = ("bureau", "office", "work", "ecole", "school")
+_EVENING_KEYWORDS = ("maison", "home", "residence")
+_RATIONALE_TEMPLATE = "mobility_score=%.2f;esg_score=%.2f;dispatch=%s;traffic=%s;weather=%s"
+
 
 class MobilityDestinationValidationError(ValueError):
     """Raised when destination intelligence request data is invalid."""
@@ -30,6 +51,14 @@ class DestinationAlternativeResult:
     confidence: float
     score: float
 
+    def to_dict(self) -> dict[str, float | str]:
+        """Serialize for the API boundary, rounding scores only here."""
+        return {
+            "destination": self.destination,
+            "confidence": round(self.confidence, 4),
+            "score": round(self.score, 4),
+        }
+
 
 @dataclass(slots=True)
 class DestinationAoqResult:
@@ -40,7 +69,7 @@ class DestinationAoqResult:
     rationale: str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class DestinationSimulationResult:
     route_id: str
     distance_km: float
@@ -60,11 +89,86 @@ class DestinationIntelligenceResult:
     timestamp: datetime
 
 
+@lru_cache(maxsize=8192)
+def _build_simulation_cached(
+    origin: str,
+    destination: str,
+    travel_mode: str,
+    traffic_level: str,
+    low_battery: bool,
+) -> DestinationSimulationResult:
+    """Deterministic route simulation, memoized per route and battery bucket."""
+    seed = f"{origin}|{destination}"
+    digest = int(sha256(seed.encode("utf-8")).hexdigest()[:8], 16)
+    route_id = f"R{digest % 10000:04d}"
+
+    distance_km = round(3.0 + ((digest % 220) / 10.0), 1)
+    traffic_factor = _TRAFFIC_FACTOR[traffic_level]
+    eta_minutes = int(ceil(distance_km * 2.1 * traffic_factor))
+
+    mode_energy_factor = _MODE_ENERGY[travel_mode]
+    if low_battery:
+        mode_energy_factor *= 0.95
+
+    energy_kwh = round(distance_km * mode_energy_factor * (1.1 if traffic_level == "high" else 1.0), 2)
+    estimated_price_xof = int(round(1200 + distance_km * 270 * traffic_factor))
+
+    baseline_thermal_kwh = distance_km * 0.20
+    co2_saved_kg = round(max(0.0, baseline_thermal_kwh - energy_kwh), 2)
+
+    return DestinationSimulationResult(
+        route_id=route_id,
+        distance_km=distance_km,
+        estimated_time_minutes=eta_minutes,
+        estimated_price_xof=estimated_price_xof,
+        energy_kwh=energy_kwh,
+        co2_saved_kg=co2_saved_kg,
+    )
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _score_batch_numba(exact, morning, evening, history, hour, is_recurring, traffic_penalty, weather_penalty):
+        """Numeric core of candidate scoring; mirrors the per-candidate Python path."""
+        scores = np.empty(exact.shape[0], dtype=np.float64)
+        morning_window = 6 <= hour <= 10
+        evening_window = 17 <= hour <= 22
+        for index in range(exact.shape[0]):
+            query_match = 0.42 if exact[index] else 0.28
+            history_score = min(history[index] / 8.0, 1.0) * 0.32
+            recurring_bonus = 0.12 if is_recurring and history[index] >= 2 else 0.0
+            if morning_window and morning[index]:
+                time_bonus = 0.10
+            elif evening_window and evening[index]:
+                time_bonus = 0.10
+            else:
+                time_bonus = 0.03
+            score = query_match + history_score + recurring_bonus + time_bonus - traffic_penalty - weather_penalty
+            scores[index] = max(0.05, min(0.99, score))
+        return scores
+
+    _score_batch_numba(
+        np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=np.int32),
+        0,
+        False,
+        0.0,
+        0.0,
+    )
+
+
 class DestinationIntelligenceWorkflow:
-    """Backend-only AOQ workflow for intelligent mobility destination selection."""
+    """Backend-only AOQ workflow for intelligent mobility destination selection.
 
+    The workflow is stateless: every method is a static method, so callers use
+    the class directly without instantiating it.
+    """
+
+    @staticmethod
     def evaluate(
-        self,
         *,
         user_id: str,
         origin: str,
@@ -86,33 +190,52 @@ class DestinationIntelligenceWorkflow:
             traffic_level,
         )
 
-        candidates = self._collect_candidates(query, candidate_destinations, trip_history)
-        history_counts = self._history_counts(trip_history)
-        hour = datetime.now(UTC).hour if hour_of_day is None else hour_of_day
-
-        scored = [
-            self._score_candidate(
-                query=query,
-                destination=destination,
-                history_count=history_counts.get(destination.lower(), 0),
+        history = [(item.destination.strip(), item.count) for item in trip_history]
+        candidates = DestinationIntelligenceWorkflow._collect_candidates(
+            query,
+            candidate_destinations,
+            (destination for destination, _ in history),
+        )
+        history_counts = DestinationIntelligenceWorkflow._history_counts(history)
+        query_key = query.strip().lower()
+        now = datetime.now(UTC)
+        hour = now.hour if hour_of_day is None else hour_of_day
+
+        if _NUMBA_AVAILABLE and len(candidates) >= _NUMBA_BATCH_THRESHOLD:
+            scored = DestinationIntelligenceWorkflow._score_candidates_batch(
+                query_key=query_key,
+                candidates=candidates,
+                history_counts=history_counts,
                 is_recurring=is_recurring,
                 hour_of_day=hour,
                 traffic_level=traffic_level,
                 weather_risk=weather_risk,
             )
-            for destination in candidates
-        ]
+        else:
+            scored = [
+                DestinationIntelligenceWorkflow._score_candidate(
+                    query_key=query_key,
+                    destination=destination,
+                    destination_key=destination_key,
+                    history_count=history_counts.get(destination_key, 0),
+                    is_recurring=is_recurring,
+                    hour_of_day=hour,
+                    traffic_level=traffic_level,
+                    weather_risk=weather_risk,
+                )
+                for destination, destination_key in candidates
+            ]
         scored.sort(key=lambda item: item.score, reverse=True)
 
         selected = scored[0]
-        simulation = self._build_simulation(
+        simulation = DestinationIntelligenceWorkflow._build_simulation(
             origin=origin,
             destination=selected.destination,
             travel_mode=travel_mode,
             traffic_level=traffic_level,
             battery_level=battery_level,
         )
-        aoq = self._build_aoq_result(
+        aoq = DestinationIntelligenceWorkflow._build_aoq_result(
             confidence=selected.confidence,
             simulation=simulation,
             traffic_level=traffic_level,
@@ -126,98 +249,116 @@ class DestinationIntelligenceWorkflow:
             alternatives=scored[:3],
             aoq=aoq,
             simulation=simulation,
-            timestamp=datetime.now(UTC),
+            timestamp=now,
         )
 
+    @staticmethod
     def _collect_candidates(
-        self,
         query: str,
         candidate_destinations: Iterable[str],
-        trip_history: list[DestinationHistoryItem],
-    ) -> list[str]:
-        ordered: list[str] = []
-        seen: set[str] = set()
-
-        def push(value: str) -> None:
-            normalized = value.strip()
-            if not normalized:
-                return
-            key = normalized.lower()
-            if key in seen:
-                return
-            seen.add(key)
-            ordered.append(normalized)
-
-        push(query)
-        for candidate in candidate_destinations:
-            push(candidate)
-        for item in trip_history:
-            push(item.destination)
+        history_destinations: Iterable[str],
+    ) -> list[tuple[str, str]]:
+        """Return unique ``(display, key)`` pairs, keyed case-insensitively in first-seen order."""
+        candidates = (
+            value.strip()
+            for value in chain((query,), candidate_destinations, history_destinations)
+        )
+        unique: dict[str, str] = {}
+        for candidate in candidates:
+            if candidate:
+                unique.setdefault(candidate.lower(), candidate)
 
+        ordered = [(display, key) for key, display in unique.items()]
         if not ordered:
             raise MobilityDestinationValidationError(
                 "at least one destination candidate must be provided"
             )
         return ordered
 
-    def _history_counts(self, trip_history: list[DestinationHistoryItem]) -> dict[str, int]:
+    @staticmethod
+    def _history_counts(history: Iterable[tuple[str, int]]) -> dict[str, int]:
         counts: dict[str, int] = {}
-        for item in trip_history:
-            key = item.destination.strip().lower()
+        for destination, count in history:
+            key = destination.lower()
             if not key:
                 continue
-            counts[key] = counts.get(key, 0) + int(item.count)
+            counts[key] = counts.get(key, 0) + int(count)
         return counts
 
+    @staticmethod
     def _score_candidate(
-        self,
         *,
-        query: str,
+        query_key: str,
         destination: str,
+        destination_key: str,
         history_count: int,
         is_recurring: bool,
         hour_of_day: int,
         traffic_level: str,
         weather_risk: str,
     ) -> DestinationAlternativeResult:
-        query_key = query.strip().lower()
-        destination_key = destination.strip().lower()
-
         query_match = 0.42 if destination_key == query_key else 0.28
         history_score = min(history_count / 8.0, 1.0) * 0.32
         recurring_bonus = 0.12 if is_recurring and history_count >= 2 else 0.0
-        time_bonus = self._time_affinity_bonus(destination_key, hour_of_day)
-
-        traffic_penalty = 0.0
-        if traffic_level == "high":
-            traffic_penalty = 0.10
-        elif traffic_level == "moderate":
-            traffic_penalty = 0.04
+        time_bonus = DestinationIntelligenceWorkflow._time_affinity_bonus(destination_key, hour_of_day)
 
+        traffic_penalty = _TRAFFIC_PENALTY.get(traffic_level, 0.0)
         weather_penalty = 0.06 if weather_risk == "high" else 0.0
 
         score = query_match + history_score + recurring_bonus + time_bonus - traffic_penalty - weather_penalty
         bounded_score = max(0.05, min(0.99, score))
-        confidence = round(bounded_score, 4)
-        score_value = round(bounded_score, 4)
         return DestinationAlternativeResult(
             destination=destination,
-            confidence=confidence,
-            score=score_value,
+            confidence=bounded_score,
+            score=bounded_score,
         )
 
-    def _time_affinity_bonus(self, destination_key: str, hour_of_day: int) -> float:
-        morning_keywords = ("bureau", "office", "work", "ecole", "school")
-        evening_keywords = ("maison", "home", "residence")
+    @staticmethod
+    def _score_candidates_batch(
+        *,
+        query_key: str,
+        candidates: list[tuple[str, str]],
+        history_counts: dict[str, int],
+        is_recurring: bool,
+        hour_of_day: int,
+        traffic_level: str,
+        weather_risk: str,
+    ) -> list[DestinationAlternativeResult]:
+        keys = [key for _, key in candidates]
+
+        scores = _score_batch_numba(
+            np.fromiter((key == query_key for key in keys), dtype=np.int8, count=len(keys)),
+            np.fromiter(
+                (any(token in key for token in _MORNING_KEYWORDS) for key in keys),
+                dtype=np.int8,
+                count=len(keys),
+            ),
+            np.fromiter(
+                (any(token in key for token in _EVENING_KEYWORDS) for key in keys),
+                dtype=np.int8,
+                count=len(keys),
+            ),
+            np.fromiter((history_counts.get(key, 0) for key in keys), dtype=np.int32, count=len(keys)),
+            hour_of_day,
+            is_recurring,
+            _TRAFFIC_PENALTY.get(traffic_level, 0.0),
+            0.06 if weather_risk == "high" else 0.0,
+        )
+        return [
+            DestinationAlternativeResult(destination=destination, confidence=score, score=score)
+            for (destination, _), score in zip(candidates, scores.tolist())
+        ]
 
-        if 6 <= hour_of_day <= 10 and any(token in destination_key for token in morning_keywords):
+    @staticmethod
+    def _time_affinity_bonus(destination_key: str, hour_of_day: int) -> float:
+        if 6 <= hour_of_day <= 10 and any(token in destination_key for token in _MORNING_KEYWORDS):
             return 0.10
-        if 17 <= hour_of_day <= 22 and any(token in destination_key for token in evening_keywords):
+        if 17 <= hour_of_day <= 22 and any(token in destination_key for token in _EVENING_KEYWORDS):
             return 0.10
         return 0.03
 
+    @staticmethod
     def _build_simulation(
-        self,
         *,
         origin: str,
         destination: str,
@@ -225,35 +366,13 @@ class DestinationIntelligenceWorkflow:
         traffic_level: str,
         battery_level: float | None,
     ) -> DestinationSimulationResult:
-        seed = f"{origin}|{destination}"
-        digest = int(sha256(seed.encode("utf-8")).hexdigest()[:8], 16)
-        route_id = f"R{digest % 10000:04d}"
-
-        distance_km = round(3.0 + ((digest % 220) / 10.0), 1)
-        traffic_factor = {"low": 1.0, "moderate": 1.22, "high": 1.45}[traffic_level]
-        eta_minutes = int(ceil(distance_km * 2.1 * traffic_factor))
-
-        mode_energy_factor = {"solo": 0.13, "family": 0.17, "eco": 0.10}[travel_mode]
-        if battery_level is not None and battery_level < 25:
-            mode_energy_factor *= 0.95
-
-        energy_kwh = round(distance_km * mode_energy_factor * (1.1 if traffic_level == "high" else 1.0), 2)
-        estimated_price_xof = int(round(1200 + distance_km * 270 * traffic_factor))
-
-        baseline_thermal_kwh = distance_km * 0.20
-        co2_saved_kg = round(max(0.0, baseline_thermal_kwh - energy_kwh), 2)
-
-        return DestinationSimulationResult(
-            route_id=route_id,
-            distance_km=distance_km,
-            estimated_time_minutes=eta_minutes,
-            estimated_price_xof=estimated_price_xof,
-            energy_kwh=energy_kwh,
-            co2_saved_kg=co2_saved_kg,
-        )
+        # The simulation only depends on whether the battery is below the
+        # low-charge threshold, so bucket on that flag to maximise cache hits.
+        low_battery = battery_level is not None and battery_level < 25
+        return _build_simulation_cached(origin, destination, travel_mode, traffic_level, low_battery)
 
+    @staticmethod
     def _build_aoq_result(
-        self,
         *,
         confidence: float,
         simulation: DestinationSimulationResult,
@@ -272,7 +391,7 @@ class DestinationIntelligenceWorkflow:
 
         eta_score = max(0.0, 100.0 - (simulation.estimated_time_minutes * 2.0))
         confidence_score = confidence * 100.0
-        traffic_score = {"low": 90.0, "moderate": 72.0, "high": 54.0}[traffic_level]
+        traffic_score = _TRAFFIC_SCORE[traffic_level]
         battery_score = 70.0 if battery_level is None else battery_level
 
         mobility_score = round(
@@ -300,13 +419,7 @@ class DestinationIntelligenceWorkflow:
         else:
             decision = "DEFER"
 
-        rationale = (
-            f"mobility_score={mobility_score:.2f};"
-            f"esg_score={esg_score:.2f};"
-            f"dispatch={dispatch};"
-            f"traffic={traffic_level};"
-            f"weather={weather_risk}"
-        )
+        rationale = _RATIONALE_TEMPLATE % (mobility_score, esg_score, dispatch, traffic_level, weather_risk)
         return DestinationAoqResult(
             mobility_score=mobility_score,
             esg_score=esg_score,
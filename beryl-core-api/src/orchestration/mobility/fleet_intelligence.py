@@ -5,6 +5,8 @@ Orchestrates demand prediction, route optimization, and fleet analysis.
 Coordinates between beryl-core-api and beryl-ai-engine.
 """
 
+import asyncio
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from src.adapters.mobility_ai_engine.client import MobilityAIClient
@@ -16,9 +18,20 @@ from src.adapters.mobility_ai_engine.mapper import (
     VehicleStatus,
     MaintenancePrediction
 )
+from src.config.settings import settings
 from src.observability.logger import logger
 
 
+@dataclass(slots=True)
+class FleetDistributionPlan:
+    """Vehicle distribution plan produced by optimize_fleet_distribution."""
+    fleet_id: str
+    timestamp: str
+    current_state: Dict[str, Any]
+    demand_forecast: List[Dict[str, Any]]
+    recommendations: List[str]
+
+
 class FleetIntelligenceWorkflow:
     """Orchestrates mobility intelligence operations."""
 
@@ -48,7 +61,7 @@ class FleetIntelligenceWorkflow:
         Returns:
             Normalized DemandPrediction
         """
-        logger.info(f"Predicting demand for location: {location}")
+        logger.info("Predicting demand for location: %s", location)
         
         raw_response = await self.client.predict_demand(
             location=location,
@@ -57,10 +70,56 @@ class FleetIntelligenceWorkflow:
         )
         
         prediction = self.mapper.map_demand_response(raw_response)
-        logger.info(f"Demand prediction completed: {prediction.predicted_demand} units")
+        logger.info("Demand prediction completed: %s units", prediction.predicted_demand)
         
         return prediction
 
+    async def predict_demand_many(
+        self,
+        locations: List[str],
+        time_window: str = "hourly",
+        forecast_horizon: int = 24
+    ) -> List[DemandPrediction]:
+        """
+        Predict demand for several locations.
+        
+        Uses the AI engine bulk endpoint when MOBILITY_BULK_DEMAND_ENABLED is set,
+        falling back to concurrent per-location predictions otherwise or if the
+        bulk call fails.
+        
+        Args:
+            locations: Geographic locations
+            time_window: Granularity of prediction
+            forecast_horizon: Hours to forecast
+            
+        Returns:
+            Normalized DemandPrediction list, in the order of locations
+        """
+        if settings.mobility_bulk_demand_enabled and locations:
+            try:
+                raw_responses = await self.client.predict_demand_bulk(
+                    locations=locations,
+                    time_window=time_window,
+                    forecast_horizon=forecast_horizon
+                )
+                predictions = {
+                    prediction.location: prediction
+                    for prediction in map(self.mapper.map_demand_response, raw_responses)
+                }
+                if len(raw_responses) != len(locations) or predictions.keys() != set(locations):
+                    raise ValueError(
+                        f"bulk response covers {sorted(predictions)} for requested locations {sorted(set(locations))}"
+                    )
+                return [predictions[location] for location in locations]
+            except Exception as e:
+                logger.warning("Bulk demand prediction unavailable, falling back to per-location calls: %s", e)
+        
+        return list(
+            await asyncio.gather(
+                *(self.predict_demand(location, time_window, forecast_horizon) for location in locations)
+            )
+        )
+
     async def optimize_route(
         self,
         origin: str,
@@ -88,26 +147,27 @@ class FleetIntelligenceWorkflow:
         Returns:
             Normalized OptimizedRoute with efficiency metrics
         """
-        logger.info(f"Optimizing route from {origin} to {destination}")
+        logger.info("Optimizing route from %s to %s", origin, destination)
         
-        constraints = {}
-        if battery_level is not None:
-            constraints["battery_level"] = battery_level
-        if max_time_minutes is not None:
-            constraints["max_time_minutes"] = max_time_minutes
+        constraints = {
+            key: value
+            for key, value in (("battery_level", battery_level), ("max_time_minutes", max_time_minutes))
+            if value is not None
+        }
         
         raw_response = await self.client.optimize_route(
             origin=origin,
             destination=destination,
             vehicle_type=vehicle_type,
-            constraints=constraints
+            constraints=constraints or None
         )
         
         route = self.mapper.map_route_response(raw_response)
         logger.info(
-            f"Route optimized: {route.distance_km}km, "
-            f"energy: {route.energy_consumption_kwh}kWh, "
-            f"efficiency: {route.efficiency_score}"
+            "Route optimized: %skm, energy: %skWh, efficiency: %s",
+            route.distance_km,
+            route.energy_consumption_kwh,
+            route.efficiency_score,
         )
         
         return route
@@ -133,7 +193,7 @@ class FleetIntelligenceWorkflow:
         Returns:
             Comprehensive FleetAnalysis with insights
         """
-        logger.info(f"Analyzing fleet: {fleet_id}")
+        logger.info("Analyzing fleet: %s", fleet_id)
         
         raw_response = await self.client.analyze_fleet(
             fleet_id=fleet_id,
@@ -144,12 +204,15 @@ class FleetIntelligenceWorkflow:
         
         if analysis.maintenance_alerts:
             logger.warning(
-                f"Fleet {fleet_id} has {len(analysis.maintenance_alerts)} maintenance alerts"
+                "Fleet %s has %s maintenance alerts",
+                fleet_id,
+                len(analysis.maintenance_alerts),
             )
         
         logger.info(
-            f"Fleet analysis complete: {analysis.utilization_rate}% utilization, "
-            f"{analysis.avg_battery_health}% avg battery health"
+            "Fleet analysis complete: %s%% utilization, %s%% avg battery health",
+            analysis.utilization_rate,
+            analysis.avg_battery_health,
         )
         
         return analysis
@@ -172,14 +235,16 @@ class FleetIntelligenceWorkflow:
         Returns:
             Normalized VehicleStatus
         """
-        logger.info(f"Fetching status for vehicle: {vehicle_id}")
+        logger.info("Fetching status for vehicle: %s", vehicle_id)
         
         raw_response = await self.client.get_vehicle_status(vehicle_id)
         status = self.mapper.map_vehicle_status_response(raw_response)
         
         logger.info(
-            f"Vehicle {vehicle_id} status: {status.status}, "
-            f"battery: {status.battery_level}%"
+            "Vehicle %s status: %s, battery: %s%%",
+            vehicle_id,
+            status.status,
+            status.battery_level,
         )
         
         return status
@@ -202,15 +267,16 @@ class FleetIntelligenceWorkflow:
         Returns:
             Normalized MaintenancePrediction
         """
-        logger.info(f"Predicting maintenance for vehicle: {vehicle_id}")
+        logger.info("Predicting maintenance for vehicle: %s", vehicle_id)
         
         raw_response = await self.client.predict_maintenance(vehicle_id)
         prediction = self.mapper.map_maintenance_response(raw_response)
         
         if prediction.maintenance_needed and prediction.priority in ["high", "critical"]:
             logger.warning(
-                f"High priority maintenance needed for {vehicle_id}: "
-                f"{prediction.predicted_failure_component}"
+                "High priority maintenance needed for %s: %s",
+                vehicle_id,
+                prediction.predicted_failure_component,
             )
         
         return prediction
@@ -219,7 +285,7 @@ class FleetIntelligenceWorkflow:
         self,
         fleet_id: str,
         target_locations: List[str]
-    ) -> Dict[str, Any]:
+    ) -> FleetDistributionPlan:
         """
         Optimize vehicle distribution across target locations.
         
@@ -236,31 +302,28 @@ class FleetIntelligenceWorkflow:
         Returns:
             Distribution plan with vehicle reassignments
         """
-        logger.info(f"Optimizing distribution for fleet {fleet_id}")
+        logger.info("Optimizing distribution for fleet %s", fleet_id)
         
         fleet_analysis = await self.analyze_fleet(fleet_id)
-        demand_predictions = []
-        
-        for location in target_locations:
-            demand = await self.predict_demand(location)
-            demand_predictions.append({
-                "location": location,
-                "predicted_demand": demand.predicted_demand
-            })
-        
-        distribution_plan = {
-            "fleet_id": fleet_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "current_state": {
+        demands = await self.predict_demand_many(target_locations)
+        demand_predictions = [
+            {"location": location, "predicted_demand": demand.predicted_demand}
+            for location, demand in zip(target_locations, demands, strict=True)
+        ]
+        
+        distribution_plan = FleetDistributionPlan(
+            fleet_id=fleet_id,
+            timestamp=datetime.utcnow().isoformat(),
+            current_state={
                 "total_vehicles": fleet_analysis.total_vehicles,
                 "active_vehicles": fleet_analysis.active_vehicles,
                 "utilization_rate": fleet_analysis.utilization_rate
             },
-            "demand_forecast": demand_predictions,
-            "recommendations": fleet_analysis.recommendations
-        }
+            demand_forecast=demand_predictions,
+            recommendations=fleet_analysis.recommendations
+        )
         
-        logger.info(f"Distribution plan generated for {fleet_id}")
+        logger.info("Distribution plan generated for %s", fleet_id)
         return distribution_plan
 
     async def close(self):
@@ -2,14 +2,80 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from enum import IntEnum
+from functools import lru_cache
 import hashlib
-from math import atan2, cos, radians, sin, sqrt
+from math import asin, cos, radians, sin, sqrt
+import os
+import re
+import sys
 from threading import Lock
-from typing import Any
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Generic, Mapping, TypeVar
 from uuid import uuid4
 
+import numpy as np
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - replays fall back to the dict path
+    orjson = None
+
+_LOCK_STRIPES = 64
+_STRIPE_MASK = _LOCK_STRIPES - 1
+
+# service tier -> (base fee, per-km fee) in XOF
+_TIER_PRICING: dict[str, tuple[int, int]] = {
+    "standard": (800, 320),
+    "comfort": (1200, 430),
+    "premium": (1800, 560),
+}
+_DEFAULT_TIER_PRICING = _TIER_PRICING["standard"]
+
+# Tiers arrive as fresh strings from request parsing; map known ones onto a
+# single interned instance so every quote and ride record shares it.
+_INTERNED_TIERS = {tier: sys.intern(tier) for tier in _TIER_PRICING}
+
+
+class _RideStatus(IntEnum):
+    BOOKED = 0
+    ASSIGNED = 1
+    CANCELLED = 2
+    COMPLETED = 3
+
+
+_STATUS_NAMES = tuple(status.name for status in _RideStatus)
+
+# action -> bitmask of source statuses the action may leave from
+_ALLOWED_TRANSITIONS = MappingProxyType(
+    {
+        "assign": 1 << _RideStatus.BOOKED,
+        "cancel": (1 << _RideStatus.BOOKED) | (1 << _RideStatus.ASSIGNED),
+        "complete": 1 << _RideStatus.ASSIGNED,
+    }
+)
+
+_TIER_CODES = {"standard": 0, "comfort": 1, "premium": 2}
+_UNKNOWN_TIER_CODE = 255
+
+# "lat,lng" labels with optional whitespace around each number.
+_COORDINATES_RE = re.compile(r"\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*,\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*")
+
+_QUOTE_TTL = timedelta(minutes=10)
+_QUOTE_TTL_NS = int(_QUOTE_TTL.total_seconds()) * 1_000_000_000
+
+# Retained replay window for Idempotency-Key values, and the quote cache bound.
+_IDEMPOTENCY_TTL_SECONDS = 900
+_IDEMPOTENCY_MAX_ENTRIES = 100_000
+_QUOTE_MAX_ENTRIES = 50_000
+
+_V = TypeVar("_V")
+
 
 class RideLifecycleError(RuntimeError):
     """Base ride lifecycle error with HTTP mapping metadata."""
@@ -58,6 +124,173 @@ class QuoteRecord:
     co2_saved_kg: float
     expires_at: datetime
     created_at: datetime
+    # Wall-clock expiry in epoch nanoseconds, checked on the booking hot path;
+    # expires_at is kept for serialization.
+    expires_at_ns: int
+
+
+@dataclass(slots=True)
+class RideRecord:
+    ride_id: str
+    quote_id: str
+    rider_id: str
+    driver_id: str | None
+    status_code: int
+    pickup_label: str
+    dropoff_label: str
+    service_tier: str
+    distance_km: float
+    estimated_eta_minutes: int
+    estimated_price_xof: int
+    final_price_xof: int | None
+    pricing_model_version: str
+    confidence_interval: dict[str, int]
+    explainability: dict[str, Any]
+    co2_saved_kg: float
+    created_at: datetime
+    updated_at: datetime
+    completed_at: datetime | None
+    cancellation_reason: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ride_id": self.ride_id,
+            "quote_id": self.quote_id,
+            "rider_id": self.rider_id,
+            "driver_id": self.driver_id,
+            "status": _STATUS_NAMES[self.status_code],
+            "pickup_label": self.pickup_label,
+            "dropoff_label": self.dropoff_label,
+            "service_tier": self.service_tier,
+            "distance_km": self.distance_km,
+            "estimated_eta_minutes": self.estimated_eta_minutes,
+            "estimated_price_xof": self.estimated_price_xof,
+            "final_price_xof": self.final_price_xof,
+            "pricing_model_version": self.pricing_model_version,
+            "confidence_interval": self.confidence_interval,
+            "explainability": self.explainability,
+            "co2_saved_kg": self.co2_saved_kg,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "completed_at": self.completed_at,
+            "cancellation_reason": self.cancellation_reason,
+        }
+
+
+class _RideColumns:
+    """Structure-of-arrays mirror of ride records for vectorized aggregate scans.
+
+    Rows are append-only and indexed by ride_id. A single lock covers appends,
+    updates and reads because growing the arrays reallocates them.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._lock = Lock()
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self.status: np.ndarray = np.empty(capacity, dtype=np.uint8)
+        self.tier: np.ndarray = np.empty(capacity, dtype=np.uint8)
+        self.final_price_xof: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self.created_ns: np.ndarray = np.zeros(capacity, dtype=np.int64)
+
+    def append(self, *, ride_id: str, status_code: int, service_tier: str, created_ns: int) -> None:
+        with self._lock:
+            if self._size == self.status.shape[0]:
+                self._grow()
+            row = self._size
+            self.status[row] = status_code
+            self.tier[row] = _TIER_CODES.get(service_tier, _UNKNOWN_TIER_CODE)
+            self.final_price_xof[row] = 0
+            self.created_ns[row] = created_ns
+            self._rows[ride_id] = row
+            self._size = row + 1
+
+    def update(self, *, ride_id: str, status_code: int, final_price_xof: int | None = None) -> None:
+        with self._lock:
+            row = self._rows[ride_id]
+            self.status[row] = status_code
+            if final_price_xof is not None:
+                self.final_price_xof[row] = final_price_xof
+
+    def count(self, *, status: str, service_tier: str | None = None) -> int:
+        with self._lock:
+            mask = self.status[: self._size] == _RideStatus[status]
+            if service_tier is not None:
+                mask &= self.tier[: self._size] == _TIER_CODES.get(service_tier, _UNKNOWN_TIER_CODE)
+            return int(np.count_nonzero(mask))
+
+    def completed_revenue_xof(self, *, since_ns: int = 0) -> int:
+        with self._lock:
+            size = self._size
+            mask = (self.status[:size] == _RideStatus.COMPLETED) & (self.created_ns[:size] >= since_ns)
+            return int(self.final_price_xof[:size][mask].sum())
+
+    def _grow(self) -> None:
+        capacity = self.status.shape[0] * 2
+        for name in ("status", "tier", "final_price_xof", "created_ns"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: column.shape[0]] = column
+            setattr(self, name, grown)
+
+
+class _BoundedTTLCache(Generic[_V]):
+    """Size- and age-bounded mapping for the kernel's in-memory caches.
+
+    Every entry lives for the same ``ttl_seconds``, so insertion order is also
+    expiry order: expired entries are shed from the front on writes and on
+    lookups of a stale key, and the oldest entry is evicted when full.
+    """
+
+    def __init__(self, *, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self._ttl_ns = int(ttl_seconds * 1_000_000_000)
+        self._entries: OrderedDict[str, tuple[int, _V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> _V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_ns, value = entry
+        if expires_ns <= time.monotonic_ns():
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return value
+
+    def __getitem__(self, key: str) -> _V:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            self._store(key, value, now_ns)
+
+    def setdefault(self, key: str, value: _V) -> _V:
+        """Store ``value`` unless a live entry exists; return whichever is kept."""
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now_ns:
+                return entry[1]
+            self._store(key, value, now_ns)
+            return value
+
+    def _store(self, key: str, value: _V, now_ns: int) -> None:
+        entries = self._entries
+        while entries and next(iter(entries.values()))[0] <= now_ns:
+            entries.popitem(last=False)
+        entries.pop(key, None)
+        while len(entries) >= self.maxsize:
+            entries.popitem(last=False)
+        entries[key] = (now_ns + self._ttl_ns, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class RideLifecycleService:
@@ -66,12 +299,63 @@ class RideLifecycleService:
     _pricing_model_version = "mobility-pricing-v2.0.0"
 
     def __init__(self) -> None:
-        self._quotes: dict[str, QuoteRecord] = {}
-        self._rides: dict[str, dict[str, Any]] = {}
-        self._idempotency_results: dict[str, dict[str, Any]] = {}
-        self._lock = Lock()
+        self._quotes: _BoundedTTLCache[QuoteRecord] = _BoundedTTLCache(
+            maxsize=_QUOTE_MAX_ENTRIES,
+            ttl_seconds=_QUOTE_TTL.total_seconds(),
+        )
+        self._rides: dict[str, RideRecord] = {}
+        self._ride_columns = _RideColumns()
+        self._idempotency_results: _BoundedTTLCache[dict[str, Any]] = _BoundedTTLCache(
+            maxsize=_IDEMPOTENCY_MAX_ENTRIES,
+            ttl_seconds=_IDEMPOTENCY_TTL_SECONDS,
+        )
+        # JSON bodies of cached responses, so HTTP replays skip re-validation.
+        self._idempotency_payloads: _BoundedTTLCache[bytes] = _BoundedTTLCache(
+            maxsize=_IDEMPOTENCY_MAX_ENTRIES,
+            ttl_seconds=_IDEMPOTENCY_TTL_SECONDS,
+        )
+        # Idempotency keys and rides are guarded by separate stripe sets so a
+        # transition can hold its idempotency stripe while taking the ride stripe.
+        # Stripes are asyncio locks: the service is driven from async handlers and
+        # waiting on a stripe must yield to the event loop, not block its thread.
+        self._idempotency_stripes: list[asyncio.Lock] = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+        self._ride_stripes: list[asyncio.Lock] = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
+
+    async def quote_ride(
+        self,
+        *,
+        rider_id: str,
+        pickup_label: str,
+        dropoff_label: str,
+        service_tier: str,
+        idempotency_key: str,
+    ) -> Mapping[str, Any]:
+        return await self._quote(
+            rider_id=rider_id,
+            pickup_label=pickup_label,
+            dropoff_label=dropoff_label,
+            service_tier=service_tier,
+            idempotency_key=idempotency_key,
+            raw_distance_km=None,
+        )
 
-    def quote_ride(
+    async def quote_rides_batch(self, requests: list[dict[str, str]]) -> list[Mapping[str, Any]]:
+        """Quote several rides; each request holds the keyword arguments of ``quote_ride``.
+
+        Coordinate distances for the whole batch are computed in one vectorized
+        haversine pass; single quotes keep the scalar ``math`` path, which is
+        faster for one point.
+        """
+        raw_distances = self._raw_distances_km(
+            [request["pickup_label"] for request in requests],
+            [request["dropoff_label"] for request in requests],
+        )
+        return [
+            await self._quote(**request, raw_distance_km=raw_distance_km)
+            for request, raw_distance_km in zip(requests, raw_distances)
+        ]
+
+    async def _quote(
         self,
         *,
         rider_id: str,
@@ -79,15 +363,23 @@ class RideLifecycleService:
         dropoff_label: str,
         service_tier: str,
         idempotency_key: str,
-    ) -> dict[str, Any]:
-        with self._lock:
-            cached = self._idempotency_results.get(f"quote:{idempotency_key}")
+        raw_distance_km: float | None,
+    ) -> Mapping[str, Any]:
+        cache_key = f"quote:{idempotency_key}"
+        cached = self._idempotency_results.get(cache_key)
+        if cached is not None:
+            return MappingProxyType(cached)
+        now = datetime.now(tz=UTC)
+        async with self._stripe_for(self._idempotency_stripes, cache_key):
+            cached = self._idempotency_results.get(cache_key)
             if cached is not None:
-                return dict(cached)
+                return MappingProxyType(cached)
 
+            service_tier = _INTERNED_TIERS.get(service_tier, service_tier)
             distance_km, demand_multiplier = self._estimate_distance_and_demand(
                 pickup_label=pickup_label,
                 dropoff_label=dropoff_label,
+                raw_distance_km=raw_distance_km,
             )
             estimated_price_xof = self._estimate_price_xof(
                 distance_km=distance_km,
@@ -111,7 +403,6 @@ class RideLifecycleService:
                 ],
             }
 
-            now = datetime.now(tz=UTC)
             quote = QuoteRecord(
                 quote_id=str(uuid4()),
                 rider_id=rider_id,
@@ -125,8 +416,9 @@ class RideLifecycleService:
                 confidence_interval=confidence_interval,
                 explainability=explainability,
                 co2_saved_kg=round(distance_km * 0.13, 2),
-                expires_at=now + timedelta(minutes=10),
+                expires_at=now + _QUOTE_TTL,
                 created_at=now,
+                expires_at_ns=int(now.timestamp() * 1_000_000_000) + _QUOTE_TTL_NS,
             )
             self._quotes[quote.quote_id] = quote
 
@@ -145,76 +437,109 @@ class RideLifecycleService:
                 "co2_saved_kg": quote.co2_saved_kg,
                 "expires_at": quote.expires_at,
             }
-            self._idempotency_results[f"quote:{idempotency_key}"] = dict(response)
-            return response
+            return MappingProxyType(self._remember(cache_key, response))
 
-    def book_ride(self, *, quote_id: str, rider_id: str, idempotency_key: str) -> dict[str, Any]:
-        return self._transition(
+    async def book_ride(self, *, quote_id: str, rider_id: str, idempotency_key: str) -> Mapping[str, Any]:
+        return await self._transition(
             action="book",
             idempotency_key=idempotency_key,
-            transition_fn=lambda: self._book_internal(quote_id=quote_id, rider_id=rider_id),
+            quote_id=quote_id,
+            rider_id=rider_id,
         )
 
-    def assign_ride(self, *, ride_id: str, driver_id: str | None, idempotency_key: str) -> dict[str, Any]:
-        return self._transition(
+    async def assign_ride(self, *, ride_id: str, driver_id: str | None, idempotency_key: str) -> Mapping[str, Any]:
+        return await self._transition(
             action="assign",
             idempotency_key=idempotency_key,
-            transition_fn=lambda: self._assign_internal(ride_id=ride_id, driver_id=driver_id),
+            ride_id=ride_id,
+            driver_id=driver_id,
         )
 
-    def cancel_ride(self, *, ride_id: str, reason: str, idempotency_key: str) -> dict[str, Any]:
-        return self._transition(
+    async def cancel_ride(self, *, ride_id: str, reason: str, idempotency_key: str) -> Mapping[str, Any]:
+        return await self._transition(
             action="cancel",
             idempotency_key=idempotency_key,
-            transition_fn=lambda: self._cancel_internal(ride_id=ride_id, reason=reason),
+            ride_id=ride_id,
+            reason=reason,
         )
 
-    def complete_ride(
+    async def complete_ride(
         self,
         *,
         ride_id: str,
         distance_km: float | None,
         duration_minutes: int | None,
         idempotency_key: str,
-    ) -> dict[str, Any]:
-        return self._transition(
+    ) -> Mapping[str, Any]:
+        return await self._transition(
             action="complete",
             idempotency_key=idempotency_key,
-            transition_fn=lambda: self._complete_internal(
-                ride_id=ride_id,
-                distance_km=distance_km,
-                duration_minutes=duration_minutes,
-            ),
+            ride_id=ride_id,
+            distance_km=distance_km,
+            duration_minutes=duration_minutes,
         )
 
-    def get_ride(self, *, ride_id: str) -> dict[str, Any]:
-        with self._lock:
+    def count_rides(self, *, status: str, service_tier: str | None = None) -> int:
+        """Count rides in ``status``, optionally restricted to one service tier."""
+        return self._ride_columns.count(status=status, service_tier=service_tier)
+
+    def completed_revenue_xof(self, *, since: datetime | None = None) -> int:
+        """Sum final prices of completed rides booked at or after ``since``."""
+        since_ns = 0 if since is None else int(since.timestamp() * 1_000_000_000)
+        return self._ride_columns.completed_revenue_xof(since_ns=since_ns)
+
+    async def get_ride(self, *, ride_id: str) -> Mapping[str, Any]:
+        async with self._stripe_for(self._ride_stripes, ride_id):
             ride = self._rides.get(ride_id)
             if ride is None:
                 raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
-            return dict(ride)
+            return MappingProxyType(ride.to_dict())
 
-    def _transition(
+    async def _transition(
         self,
         *,
         action: str,
         idempotency_key: str,
-        transition_fn,
-    ) -> dict[str, Any]:
+        **kwargs: Any,
+    ) -> Mapping[str, Any]:
         cache_key = f"{action}:{idempotency_key}"
-        with self._lock:
+        # Replays are the hot path: check before locking and re-check under the
+        # stripe only on a miss, so a transition never runs twice for one key.
+        cached = self._idempotency_results.get(cache_key)
+        if cached is not None:
+            return MappingProxyType(cached)
+        # Read the clock once per transition, before taking any stripe.
+        kwargs["now"] = datetime.now(tz=UTC)
+        async with self._stripe_for(self._idempotency_stripes, cache_key):
             cached = self._idempotency_results.get(cache_key)
             if cached is not None:
-                return dict(cached)
-            response = transition_fn()
-            self._idempotency_results[cache_key] = dict(response)
-            return response
+                return MappingProxyType(cached)
+            # Transitions return a snapshot taken under the ride stripe; it is
+            # never mutated afterwards, so it is cached as-is and shared read-only.
+            response = await self._TRANSITIONS[action](self, **kwargs)
+            return MappingProxyType(self._remember(cache_key, response))
+
+    def replay_json(self, *, action: str, idempotency_key: str) -> bytes | None:
+        """Return the serialized response cached for a replayed request, if any."""
+        return self._idempotency_payloads.get(f"{action}:{idempotency_key}")
+
+    def _remember(self, cache_key: str, response: dict[str, Any]) -> dict[str, Any]:
+        # The payload is written first so a lock-free reader that sees the dict
+        # also finds its bytes. First writer wins; callers return what was kept.
+        if orjson is not None:
+            self._idempotency_payloads.setdefault(cache_key, orjson.dumps(response, option=orjson.OPT_UTC_Z))
+        return self._idempotency_results.setdefault(cache_key, response)
+
+    @staticmethod
+    def _stripe_for(stripes: list[asyncio.Lock], key: str) -> asyncio.Lock:
+        return stripes[hash(key) & _STRIPE_MASK]
 
-    def _book_internal(self, *, quote_id: str, rider_id: str) -> dict[str, Any]:
+    async def _book_internal(self, *, quote_id: str, rider_id: str, now: datetime) -> dict[str, Any]:
         quote = self._quotes.get(quote_id)
         if quote is None:
             raise RideQuoteNotFoundError("Quote not found", {"quote_id": quote_id})
-        if quote.expires_at <= datetime.now(tz=UTC):
+        now_ns = int(now.timestamp() * 1_000_000_000)
+        if quote.expires_at_ns <= now_ns:
             raise RideQuoteNotFoundError("Quote expired", {"quote_id": quote_id})
         if quote.rider_id != rider_id:
             raise RideLifecycleError(
@@ -222,125 +547,179 @@ class RideLifecycleService:
                 {"quote_rider_id": quote.rider_id, "rider_id": rider_id},
             )
 
-        now = datetime.now(tz=UTC)
         ride_id = str(uuid4())
-        ride = {
-            "ride_id": ride_id,
-            "quote_id": quote.quote_id,
-            "rider_id": quote.rider_id,
-            "driver_id": None,
-            "status": "BOOKED",
-            "pickup_label": quote.pickup_label,
-            "dropoff_label": quote.dropoff_label,
-            "service_tier": quote.service_tier,
-            "distance_km": quote.distance_km,
-            "estimated_eta_minutes": quote.estimated_eta_minutes,
-            "estimated_price_xof": quote.estimated_price_xof,
-            "final_price_xof": None,
-            "pricing_model_version": quote.pricing_model_version,
-            "confidence_interval": quote.confidence_interval,
-            "explainability": quote.explainability,
-            "co2_saved_kg": quote.co2_saved_kg,
-            "created_at": now,
-            "updated_at": now,
-            "completed_at": None,
-            "cancellation_reason": None,
-        }
+        ride = RideRecord(
+            ride_id=ride_id,
+            quote_id=quote.quote_id,
+            rider_id=quote.rider_id,
+            driver_id=None,
+            status_code=_RideStatus.BOOKED,
+            pickup_label=quote.pickup_label,
+            dropoff_label=quote.dropoff_label,
+            service_tier=quote.service_tier,
+            distance_km=quote.distance_km,
+            estimated_eta_minutes=quote.estimated_eta_minutes,
+            estimated_price_xof=quote.estimated_price_xof,
+            final_price_xof=None,
+            pricing_model_version=quote.pricing_model_version,
+            confidence_interval=quote.confidence_interval,
+            explainability=quote.explainability,
+            co2_saved_kg=quote.co2_saved_kg,
+            created_at=now,
+            updated_at=now,
+            completed_at=None,
+            cancellation_reason=None,
+        )
         self._rides[ride_id] = ride
-        return dict(ride)
-
-    def _assign_internal(self, *, ride_id: str, driver_id: str | None) -> dict[str, Any]:
-        ride = self._rides.get(ride_id)
-        if ride is None:
-            raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
-        if ride["status"] != "BOOKED":
-            raise RideStateTransitionError(
-                "Ride cannot be assigned from current state",
-                {"ride_id": ride_id, "status": ride["status"]},
-            )
-        ride["driver_id"] = driver_id or f"driver-{uuid4().hex[:8]}"
-        ride["status"] = "ASSIGNED"
-        ride["updated_at"] = datetime.now(tz=UTC)
-        return dict(ride)
-
-    def _cancel_internal(self, *, ride_id: str, reason: str) -> dict[str, Any]:
-        ride = self._rides.get(ride_id)
-        if ride is None:
-            raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
-        if ride["status"] not in {"BOOKED", "ASSIGNED"}:
-            raise RideStateTransitionError(
-                "Ride cannot be cancelled from current state",
-                {"ride_id": ride_id, "status": ride["status"]},
-            )
-        ride["status"] = "CANCELLED"
-        ride["cancellation_reason"] = reason
-        ride["updated_at"] = datetime.now(tz=UTC)
-        return dict(ride)
+        self._ride_columns.append(
+            ride_id=ride_id,
+            status_code=ride.status_code,
+            service_tier=ride.service_tier,
+            created_ns=now_ns,
+        )
+        return ride.to_dict()
 
-    def _complete_internal(
+    async def _assign_internal(self, *, ride_id: str, driver_id: str | None, now: datetime) -> dict[str, Any]:
+        async with self._stripe_for(self._ride_stripes, ride_id):
+            ride = self._rides.get(ride_id)
+            if ride is None:
+                raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
+            if not (1 << ride.status_code) & _ALLOWED_TRANSITIONS["assign"]:
+                raise RideStateTransitionError(
+                    "Ride cannot be assigned from current state",
+                    {"ride_id": ride_id, "status": _STATUS_NAMES[ride.status_code]},
+                )
+            ride.driver_id = driver_id or f"driver-{os.urandom(4).hex()}"
+            ride.status_code = _RideStatus.ASSIGNED
+            ride.updated_at = now
+            self._ride_columns.update(ride_id=ride_id, status_code=ride.status_code)
+            return ride.to_dict()
+
+    async def _cancel_internal(self, *, ride_id: str, reason: str, now: datetime) -> dict[str, Any]:
+        async with self._stripe_for(self._ride_stripes, ride_id):
+            ride = self._rides.get(ride_id)
+            if ride is None:
+                raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
+            if not (1 << ride.status_code) & _ALLOWED_TRANSITIONS["cancel"]:
+                raise RideStateTransitionError(
+                    "Ride cannot be cancelled from current state",
+                    {"ride_id": ride_id, "status": _STATUS_NAMES[ride.status_code]},
+                )
+            ride.status_code = _RideStatus.CANCELLED
+            ride.cancellation_reason = reason
+            ride.updated_at = now
+            self._ride_columns.update(ride_id=ride_id, status_code=ride.status_code)
+            return ride.to_dict()
+
+    async def _complete_internal(
         self,
         *,
         ride_id: str,
         distance_km: float | None,
         duration_minutes: int | None,
+        now: datetime,
     ) -> dict[str, Any]:
-        ride = self._rides.get(ride_id)
-        if ride is None:
-            raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
-        if ride["status"] != "ASSIGNED":
-            raise RideStateTransitionError(
-                "Ride cannot be completed from current state",
-                {"ride_id": ride_id, "status": ride["status"]},
-            )
+        async with self._stripe_for(self._ride_stripes, ride_id):
+            ride = self._rides.get(ride_id)
+            if ride is None:
+                raise RideNotFoundError("Ride not found", {"ride_id": ride_id})
+            if not (1 << ride.status_code) & _ALLOWED_TRANSITIONS["complete"]:
+                raise RideStateTransitionError(
+                    "Ride cannot be completed from current state",
+                    {"ride_id": ride_id, "status": _STATUS_NAMES[ride.status_code]},
+                )
+
+            effective_distance = distance_km if distance_km is not None else ride.distance_km
+            effective_duration = duration_minutes if duration_minutes is not None else ride.estimated_eta_minutes
+            surcharge_multiplier = 1.0 + min(0.20, max(0.0, (effective_duration - ride.estimated_eta_minutes) * 0.01))
+            final_price = int(round(float(ride.estimated_price_xof) * surcharge_multiplier))
+
+            ride.distance_km = round(float(effective_distance), 2)
+            ride.estimated_eta_minutes = max(1, int(effective_duration))
+            ride.status_code = _RideStatus.COMPLETED
+            ride.final_price_xof = max(final_price, ride.estimated_price_xof)
+            ride.updated_at = now
+            ride.completed_at = ride.updated_at
+            self._ride_columns.update(ride_id=ride_id, status_code=ride.status_code, final_price_xof=ride.final_price_xof)
+            return ride.to_dict()
+
+    _TRANSITIONS: Mapping[str, Callable[..., Awaitable[dict[str, Any]]]] = MappingProxyType(
+        {
+            "book": _book_internal,
+            "assign": _assign_internal,
+            "cancel": _cancel_internal,
+            "complete": _complete_internal,
+        }
+    )
 
-        effective_distance = distance_km if distance_km is not None else float(ride["distance_km"])
-        effective_duration = duration_minutes if duration_minutes is not None else int(ride["estimated_eta_minutes"])
-        surcharge_multiplier = 1.0 + min(0.20, max(0.0, (effective_duration - int(ride["estimated_eta_minutes"])) * 0.01))
-        final_price = int(round(float(ride["estimated_price_xof"]) * surcharge_multiplier))
-
-        ride["distance_km"] = round(effective_distance, 2)
-        ride["estimated_eta_minutes"] = max(1, int(effective_duration))
-        ride["status"] = "COMPLETED"
-        ride["final_price_xof"] = max(final_price, int(ride["estimated_price_xof"]))
-        ride["updated_at"] = datetime.now(tz=UTC)
-        ride["completed_at"] = ride["updated_at"]
-        return dict(ride)
-
-    def _estimate_distance_and_demand(self, *, pickup_label: str, dropoff_label: str) -> tuple[float, float]:
-        pickup_coords = self._parse_coordinates(pickup_label)
-        dropoff_coords = self._parse_coordinates(dropoff_label)
-        if pickup_coords is not None and dropoff_coords is not None:
-            distance_km = self._haversine_distance_km(
-                lat1=pickup_coords[0],
-                lon1=pickup_coords[1],
-                lat2=dropoff_coords[0],
-                lon2=dropoff_coords[1],
-            )
-        else:
-            seed = int(
-                hashlib.sha256(f"{pickup_label}|{dropoff_label}".encode("utf-8")).hexdigest()[:8],
-                16,
-            )
-            distance_km = 2.5 + ((seed % 230) / 20.0)
-        distance_km = round(max(1.2, distance_km), 2)
+    def _estimate_distance_and_demand(
+        self,
+        *,
+        pickup_label: str,
+        dropoff_label: str,
+        raw_distance_km: float | None = None,
+    ) -> tuple[float, float]:
+        if raw_distance_km is None:
+            pickup_coords = self._parse_coordinates(pickup_label)
+            dropoff_coords = self._parse_coordinates(dropoff_label)
+            if pickup_coords is not None and dropoff_coords is not None:
+                raw_distance_km = self._haversine_distance_km(
+                    lat1=pickup_coords[0],
+                    lon1=pickup_coords[1],
+                    lat2=dropoff_coords[0],
+                    lon2=dropoff_coords[1],
+                )
+            else:
+                raw_distance_km = self._label_distance_km(pickup_label, dropoff_label)
+        distance_km = round(max(1.2, raw_distance_km), 2)
+        return distance_km, self._demand_multiplier(pickup_label, dropoff_label)
+
+    def _raw_distances_km(self, pickup_labels: list[str], dropoff_labels: list[str]) -> list[float]:
+        distances: list[float] = []
+        geo_rows: list[int] = []
+        geo_points: list[tuple[float, float, float, float]] = []
+        for row, (pickup_label, dropoff_label) in enumerate(zip(pickup_labels, dropoff_labels)):
+            pickup_coords = self._parse_coordinates(pickup_label)
+            dropoff_coords = self._parse_coordinates(dropoff_label)
+            if pickup_coords is not None and dropoff_coords is not None:
+                geo_rows.append(row)
+                geo_points.append((*pickup_coords, *dropoff_coords))
+                distances.append(0.0)
+            else:
+                distances.append(self._label_distance_km(pickup_label, dropoff_label))
+
+        if geo_points:
+            points = np.array(geo_points, dtype=np.float64)
+            geo_distances = self._haversine_km_vec(points[:, 0], points[:, 1], points[:, 2], points[:, 3])
+            for row, distance_km in zip(geo_rows, geo_distances.tolist()):
+                distances[row] = distance_km
+        return distances
+
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _label_distance_km(pickup_label: str, dropoff_label: str) -> float:
+        seed = int(
+            hashlib.sha256(f"{pickup_label}|{dropoff_label}".encode("utf-8")).hexdigest()[:8],
+            16,
+        )
+        return 2.5 + ((seed % 230) / 20.0)
 
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _demand_multiplier(pickup_label: str, dropoff_label: str) -> float:
         demand_seed = int(
             hashlib.sha256(f"demand:{pickup_label}:{dropoff_label}".encode("utf-8")).hexdigest()[:6],
             16,
         )
-        demand_multiplier = round(1.0 + ((demand_seed % 14) / 100.0), 2)
-        return distance_km, demand_multiplier
+        return round(1.0 + ((demand_seed % 14) / 100.0), 2)
 
     @staticmethod
     def _parse_coordinates(label: str) -> tuple[float, float] | None:
-        parts = [part.strip() for part in label.split(",")]
-        if len(parts) != 2:
-            return None
-        try:
-            lat = float(parts[0])
-            lng = float(parts[1])
-        except ValueError:
+        match = _COORDINATES_RE.fullmatch(label)
+        if match is None:
             return None
+        lat = float(match.group(1))
+        lng = float(match.group(2))
         if lat < -90 or lat > 90 or lng < -180 or lng > 180:
             return None
         return lat, lng
@@ -348,27 +727,35 @@ class RideLifecycleService:
     @staticmethod
     def _haversine_distance_km(*, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         r_km = 6371.0
-        d_lat = radians(lat2 - lat1)
+        lat1_rad = radians(lat1)
+        lat2_rad = radians(lat2)
+        d_lat = lat2_rad - lat1_rad
         d_lon = radians(lon2 - lon1)
         a = (
             sin(d_lat / 2.0) ** 2
-            + cos(radians(lat1)) * cos(radians(lat2)) * sin(d_lon / 2.0) ** 2
+            + cos(lat1_rad) * cos(lat2_rad) * sin(d_lon / 2.0) ** 2
         )
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        return r_km * c
+        return 2.0 * r_km * asin(sqrt(min(1.0, a)))
+
+    @staticmethod
+    def _haversine_km_vec(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+        d_lat = np.radians(lat2 - lat1)
+        d_lon = np.radians(lon2 - lon1)
+        a = np.sin(d_lat / 2.0) ** 2 + np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) * np.sin(d_lon / 2.0) ** 2
+        return 2.0 * 6371.0 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
 
     @classmethod
     def _estimate_price_xof(cls, *, distance_km: float, service_tier: str, demand_multiplier: float) -> int:
-        tier = service_tier.lower().strip()
-        base_fee = {
-            "standard": 800,
-            "comfort": 1200,
-            "premium": 1800,
-        }.get(tier, 800)
-        per_km_fee = {
-            "standard": 320,
-            "comfort": 430,
-            "premium": 560,
-        }.get(tier, 320)
-        raw_amount = (base_fee + distance_km * per_km_fee) * demand_multiplier
-        return int(round(max(1200, raw_amount)))
+        # Tiers arrive already normalized from the schema; only fall back to
+        # lower/strip for callers passing free-form values.
+        pricing = _TIER_PRICING.get(service_tier)
+        if pricing is None:
+            pricing = _TIER_PRICING.get(service_tier.lower().strip(), _DEFAULT_TIER_PRICING)
+        base_fee, per_km_fee = pricing
+        # Distances and multipliers are 2-decimal values; scale them to
+        # hundredths of a km and basis points so money stays in integers.
+        # The amount below is in millionths of XOF, rounded half-up.
+        distance_hkm = int(distance_km * 100 + 0.5)
+        demand_bp = int(demand_multiplier * 10_000 + 0.5)
+        raw_amount = (base_fee * 100 + distance_hkm * per_km_fee) * demand_bp
+        return max(1200, (raw_amount + 500_000) // 1_000_000)
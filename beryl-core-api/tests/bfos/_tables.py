@@ -0,0 +1,53 @@
+"""Table groups the BFOS test modules create through ``bfos_tables``.
+
+Built once at import time so every module shares the same tuples.
+"""
+
+from __future__ import annotations
+
+from src.db.models.audit_chain import AuditChainEventModel
+from src.db.models.fintech import FintechTransactionModel
+from src.db.models.fx_rates import FxRateModel, FxTransactionModel
+from src.db.models.idempotency import IdempotencyKeyModel
+from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
+from src.db.models.revenue import RevenueRecordModel
+from src.db.models.statements import CertifiedStatementModel, StatementSignatureModel
+from src.db.models.tontine import (
+    TontineCycleModel,
+    TontineGroupModel,
+    TontineMemberModel,
+    TontineVoteModel,
+    TontineWithdrawRequestModel,
+)
+
+AUDIT_TABLES = (AuditChainEventModel.__table__,)
+
+MERCHANT_TABLES = AUDIT_TABLES + (FintechTransactionModel.__table__,)
+
+LEDGER_TABLES = AUDIT_TABLES + (
+    IdempotencyKeyModel.__table__,
+    LedgerUserModel.__table__,
+    LedgerAccountModel.__table__,
+    LedgerEntryModel.__table__,
+)
+
+REVENUE_TABLES = LEDGER_TABLES + (RevenueRecordModel.__table__,)
+
+FX_TABLES = REVENUE_TABLES + (
+    FxRateModel.__table__,
+    FxTransactionModel.__table__,
+)
+
+STATEMENT_TABLES = REVENUE_TABLES + (
+    FintechTransactionModel.__table__,
+    CertifiedStatementModel.__table__,
+    StatementSignatureModel.__table__,
+)
+
+TONTINE_TABLES = LEDGER_TABLES + (
+    TontineGroupModel.__table__,
+    TontineMemberModel.__table__,
+    TontineCycleModel.__table__,
+    TontineWithdrawRequestModel.__table__,
+    TontineVoteModel.__table__,
+)
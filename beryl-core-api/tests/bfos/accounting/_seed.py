@@ -0,0 +1,12 @@
+"""Row seeding shared by the BFOS accounting test modules."""
+
+from __future__ import annotations
+
+from sqlalchemy import insert
+
+from src.db.models.fintech import FintechTransactionModel
+
+
+def seed_transactions(session, rows) -> None:
+    """Bulk-insert fintech transaction rows in one executemany."""
+    session.execute(insert(FintechTransactionModel), rows)
@@ -0,0 +1,67 @@
+"""Statement-engine fixtures shared by the BFOS accounting tests.
+
+The signing key is generated once per session and the engines are wired once
+per module; ``statement_harness`` still clears tables after every test.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from src.bfos.accounting.merchant_accounting_engine import MerchantAccountingEngine
+from src.bfos.accounting.statement_engine import StatementEngine
+from src.bfos.accounting.statement_signer import StatementSigner
+from src.bfos.fee_engine import FeeEngine
+from src.bfos.revenue_engine import RevenueEngine
+
+_CURVE = ec.SECP256R1()
+
+
+@dataclass(frozen=True)
+class StatementHarness:
+    accounting: MerchantAccountingEngine
+    fees: FeeEngine
+    revenues: RevenueEngine
+    signer: StatementSigner
+    statements: StatementEngine
+
+
+@pytest.fixture(scope="session")
+def statement_signer() -> StatementSigner:
+    # P-256 key generation dominates these tests; one key per session is enough.
+    private_key_pem = ec.generate_private_key(_CURVE).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return StatementSigner(private_key_pem=private_key_pem)
+
+
+@pytest.fixture(scope="module")
+def _statement_engines(bfos_sessionmaker, statement_signer) -> StatementHarness:
+    factory = bfos_sessionmaker
+    accounting = MerchantAccountingEngine(session_factory=factory)
+    fees = FeeEngine(session_factory=factory)
+    revenues = RevenueEngine(session_factory=factory)
+    return StatementHarness(
+        accounting=accounting,
+        fees=fees,
+        revenues=revenues,
+        signer=statement_signer,
+        statements=StatementEngine(
+            session_factory=factory,
+            accounting=accounting,
+            fees=fees,
+            revenues=revenues,
+            signer=statement_signer,
+        ),
+    )
+
+
+@pytest.fixture
+def statement_harness(_statement_engines, session_factory) -> StatementHarness:
+    return _statement_engines
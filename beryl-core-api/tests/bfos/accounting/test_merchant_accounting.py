@@ -4,67 +4,67 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 import uuid
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import select
 
 from src.bfos.accounting.merchant_accounting_engine import MerchantAccountingEngine
 from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.fintech import FintechTransactionModel
-from src.db.sqlalchemy import Base
+from tests.bfos._tables import MERCHANT_TABLES
+from tests.bfos.accounting._seed import seed_transactions
 
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(bind=engine, tables=[AuditChainEventModel.__table__, FintechTransactionModel.__table__])
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return MERCHANT_TABLES
 
 
-def test_merchant_accounting_aggregation_summary_and_cashflow() -> None:
-    factory = _session_factory()
+def test_merchant_accounting_aggregation_summary_and_cashflow(session_factory) -> None:
+    factory = session_factory
     accounting = MerchantAccountingEngine(session_factory=factory)
 
     now = datetime.now(timezone.utc)
     with factory() as session:
         with session.begin():
-            session.add_all(
+            seed_transactions(
+                session,
                 [
-                    FintechTransactionModel(
-                        id=uuid.uuid4(),
-                        actor_id="merchant-1",
-                        amount=Decimal("1000.00"),
-                        currency="XOF",
-                        target_account="wallet-sales",
-                        status="ACCEPTED",
-                        risk_score=Decimal("0"),
-                        aml_flagged=False,
-                        correlation_id="corr-1",
-                        created_at=now - timedelta(days=1),
-                    ),
-                    FintechTransactionModel(
-                        id=uuid.uuid4(),
-                        actor_id="merchant-1",
-                        amount=Decimal("200.00"),
-                        currency="XOF",
-                        target_account="expense-office",
-                        status="ACCEPTED",
-                        risk_score=Decimal("0"),
-                        aml_flagged=False,
-                        correlation_id="corr-2",
-                        created_at=now - timedelta(days=1),
-                    ),
-                    FintechTransactionModel(
-                        id=uuid.uuid4(),
-                        actor_id="merchant-1",
-                        amount=Decimal("300.00"),
-                        currency="XOF",
-                        target_account="wallet-sales",
-                        status="FAILED",
-                        risk_score=Decimal("0"),
-                        aml_flagged=False,
-                        correlation_id="corr-3",
-                        created_at=now - timedelta(days=1),
-                    ),
-                ]
+                    {
+                        "id": uuid.uuid4(),
+                        "actor_id": "merchant-1",
+                        "amount": Decimal("1000.00"),
+                        "currency": "XOF",
+                        "target_account": "wallet-sales",
+                        "status": "ACCEPTED",
+                        "risk_score": Decimal("0"),
+                        "aml_flagged": False,
+                        "correlation_id": "corr-1",
+                        "created_at": now - timedelta(days=1),
+                    },
+                    {
+                        "id": uuid.uuid4(),
+                        "actor_id": "merchant-1",
+                        "amount": Decimal("200.00"),
+                        "currency": "XOF",
+                        "target_account": "expense-office",
+                        "status": "ACCEPTED",
+                        "risk_score": Decimal("0"),
+                        "aml_flagged": False,
+                        "correlation_id": "corr-2",
+                        "created_at": now - timedelta(days=1),
+                    },
+                    {
+                        "id": uuid.uuid4(),
+                        "actor_id": "merchant-1",
+                        "amount": Decimal("300.00"),
+                        "currency": "XOF",
+                        "target_account": "wallet-sales",
+                        "status": "FAILED",
+                        "risk_score": Decimal("0"),
+                        "aml_flagged": False,
+                        "correlation_id": "corr-3",
+                        "created_at": now - timedelta(days=1),
+                    },
+                ],
             )
 
     result = accounting.aggregate_transactions(
@@ -84,5 +84,5 @@ def test_merchant_accounting_aggregation_summary_and_cashflow() -> None:
     assert Decimal(str(cashflow["net_cashflow"])) == Decimal("800.00")
 
     with factory() as session:
-        audits = list(session.execute(select(AuditChainEventModel)).scalars().all())
+        audits = session.execute(select(AuditChainEventModel)).scalars().all()
     assert any(row.action == "BFOS_MERCHANT_ACCOUNTING_AGGREGATED" for row in audits)
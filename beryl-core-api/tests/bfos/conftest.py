@@ -0,0 +1,101 @@
+"""Shared SQLite fixtures for BFOS engine tests.
+
+Each test module declares the tables it needs by overriding ``bfos_tables``.
+The schema is created once per module (or once per directory where a nested
+conftest overrides ``bfos_engine``); rows are cleared after every test.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.schema import sort_tables
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.sqlalchemy import Base
+
+
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return ()
+
+
+@pytest.fixture(scope="session")
+def bfos_engine_builder():
+    """Lets directory conftests build an engine with a wider scope than ``bfos_engine``."""
+    return build_bfos_engine
+
+
+@pytest.fixture(scope="module")
+def bfos_engine(bfos_tables):
+    engine = build_bfos_engine(bfos_tables)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def bfos_sessionmaker(bfos_engine):
+    return sessionmaker(bind=bfos_engine, autocommit=False, autoflush=False, future=True)
+
+
+@pytest.fixture
+def session_factory(bfos_engine, bfos_sessionmaker, bfos_tables):
+    yield bfos_sessionmaker
+    clear_tables(bfos_engine, bfos_tables)
+
+
+def build_bfos_engine(tables):
+    """In-memory SQLite engine with ``tables`` created."""
+    # One shared connection keeps the in-memory database alive across sessions
+    # without per-checkout pool bookkeeping.
+    engine = create_engine(
+        "sqlite+pysqlite://",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", _tune_sqlite)
+    # A new in-memory database is empty; skip the per-table existence probes.
+    Base.metadata.create_all(bind=engine, tables=tables, checkfirst=False)
+    return engine
+
+
+def _tune_sqlite(dbapi_connection, _connection_record) -> None:
+    # Durability settings are irrelevant for a throwaway in-memory database.
+    cursor = dbapi_connection.cursor()
+    for pragma in ("journal_mode=MEMORY", "synchronous=OFF", "temp_store=MEMORY"):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def clear_tables(engine, tables) -> None:
+    """Delete every row from ``tables``, children before parents, in one transaction."""
+    with engine.begin() as connection:
+        for statement in _delete_statements(tuple(tables)):
+            connection.execute(statement)
+
+
+@functools.cache
+def _delete_statements(tables: tuple) -> tuple:
+    # Sorting the full metadata on every teardown is wasted work; each table
+    # group only needs its own dependency order, computed once.
+    return tuple(table.delete() for table in reversed(sort_tables(tables)))
+
+
+_canonical_dumps = functools.partial(json.dumps, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+_sha256 = hashlib.sha256
+
+
+@pytest.fixture(scope="session")
+def canonical_sha256():
+    """Reference hash of the canonical JSON form the BFOS engines sign and store."""
+
+    def _canonical_sha256(payload: dict) -> str:
+        return _sha256(_canonical_dumps(payload).encode("utf-8")).hexdigest()
+
+    return _canonical_sha256
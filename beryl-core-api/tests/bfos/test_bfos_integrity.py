@@ -2,41 +2,24 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import select
 
 from src.bfos.fee_engine import FeeEngine
 from src.bfos.fx_engine import FxEngine
 from src.bfos.revenue_engine import RevenueEngine
 from src.core.audit.service import AuditService
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.fx_rates import FxRateModel, FxTransactionModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.revenue import RevenueRecordModel
-from src.db.sqlalchemy import Base
+from src.db.models.ledger import LedgerEntryModel
+from tests.bfos._tables import FX_TABLES
 
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            RevenueRecordModel.__table__,
-            FxRateModel.__table__,
-            FxTransactionModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return FX_TABLES
 
 
-def test_bfos_integrity_double_entry_audit_signature_idempotency() -> None:
-    factory = _session_factory()
+def test_bfos_integrity_double_entry_audit_signature_idempotency(session_factory) -> None:
+    factory = session_factory
     audit = AuditService(session_factory=factory)
     revenue = RevenueEngine(session_factory=factory)
     fx = FxEngine(session_factory=factory, linked_revenue_engine=revenue)
@@ -81,9 +64,9 @@ def test_bfos_integrity_double_entry_audit_signature_idempotency() -> None:
     assert fx_second["idempotent"] is True
 
     with factory() as session:
-        rev_entries = list(
-            session.execute(select(LedgerEntryModel).where(LedgerEntryModel.reference == "tx-rev-core")).scalars().all()
-        )
+        rev_entries = session.execute(
+            select(LedgerEntryModel).where(LedgerEntryModel.reference == "tx-rev-core")
+        ).scalars().all()
         assert len(rev_entries) == 2
         assert {entry.direction for entry in rev_entries} == {"DEBIT", "CREDIT"}
         assert rev_entries[0].amount == rev_entries[1].amount
@@ -1,43 +1,25 @@
 from __future__ import annotations
 
-import hashlib
-import json
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import select
 
 from src.bfos.fx_engine import FxEngine
 from src.bfos.revenue_engine import RevenueEngine
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.fx_rates import FxRateModel, FxTransactionModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
+from src.db.models.fx_rates import FxTransactionModel
 from src.db.models.revenue import RevenueRecordModel
-from src.db.sqlalchemy import Base
 from src.infrastructure.kafka.compliance.event_signature_verifier import event_signature_verifier
+from tests.bfos._tables import FX_TABLES
 
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            RevenueRecordModel.__table__,
-            FxRateModel.__table__,
-            FxTransactionModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return FX_TABLES
 
 
-def test_fx_rate_integrity_and_transaction_recording() -> None:
-    factory = _session_factory()
+def test_fx_rate_integrity_and_transaction_recording(session_factory, canonical_sha256) -> None:
+    factory = session_factory
     revenue = RevenueEngine(session_factory=factory)
     engine = FxEngine(session_factory=factory, linked_revenue_engine=revenue)
 
@@ -64,8 +46,8 @@ def test_fx_rate_integrity_and_transaction_recording() -> None:
     assert second["idempotent"] is True
 
     with factory() as session:
-        fx_rows = list(session.execute(select(FxTransactionModel)).scalars().all())
-        revenue_rows = list(session.execute(select(RevenueRecordModel)).scalars().all())
+        fx_rows = session.execute(select(FxTransactionModel)).scalars().all()
+        revenue_rows = session.execute(select(RevenueRecordModel)).scalars().all()
 
     assert len(fx_rows) == 1
     assert len(revenue_rows) == 2
@@ -75,7 +57,4 @@ def test_fx_rate_integrity_and_transaction_recording() -> None:
     signed_payload["signature"] = fx_row.signature
     assert event_signature_verifier.verify(signed_payload)
 
-    expected_hash = hashlib.sha256(
-        json.dumps(fx_row.payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    ).hexdigest()
-    assert fx_row.payload_hash == expected_hash
+    assert fx_row.payload_hash == canonical_sha256(fx_row.payload)
@@ -1,39 +1,25 @@
 from __future__ import annotations
 
-import hashlib
-import json
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import select
 
 from src.bfos.revenue_engine import RevenueEngine
 from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
+from src.db.models.ledger import LedgerEntryModel
 from src.db.models.revenue import RevenueRecordModel
-from src.db.sqlalchemy import Base
 from src.infrastructure.kafka.compliance.event_signature_verifier import event_signature_verifier
+from tests.bfos._tables import REVENUE_TABLES
 
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            RevenueRecordModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return REVENUE_TABLES
 
 
-def test_record_revenue_is_idempotent_and_ledgered() -> None:
-    factory = _session_factory()
+def test_record_revenue_is_idempotent_and_ledgered(session_factory, canonical_sha256) -> None:
+    factory = session_factory
     engine = RevenueEngine(session_factory=factory)
 
     first = engine.record_revenue(
@@ -57,9 +43,9 @@ def test_record_revenue_is_idempotent_and_ledgered() -> None:
     assert second["idempotent"] is True
 
     with factory() as session:
-        revenue_rows = list(session.execute(select(RevenueRecordModel)).scalars().all())
-        ledger_rows = list(session.execute(select(LedgerEntryModel)).scalars().all())
-        audit_rows = list(session.execute(select(AuditChainEventModel)).scalars().all())
+        revenue_rows = session.execute(select(RevenueRecordModel)).scalars().all()
+        ledger_rows = session.execute(select(LedgerEntryModel)).scalars().all()
+        audit_rows = session.execute(select(AuditChainEventModel)).scalars().all()
 
     assert len(revenue_rows) == 1
     assert len(ledger_rows) == 2
@@ -70,14 +56,11 @@ def test_record_revenue_is_idempotent_and_ledgered() -> None:
     signed_payload["signature"] = row.signature
     assert event_signature_verifier.verify(signed_payload)
 
-    expected_hash = hashlib.sha256(
-        json.dumps(row.payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
-    ).hexdigest()
-    assert row.payload_hash == expected_hash
+    assert row.payload_hash == canonical_sha256(row.payload)
 
 
-def test_revenue_summary_aggregates_period() -> None:
-    factory = _session_factory()
+def test_revenue_summary_aggregates_period(session_factory) -> None:
+    factory = session_factory
     engine = RevenueEngine(session_factory=factory)
 
     engine.record_revenue("internal_transfer_fee", Decimal("10.00"), "XOF", "tx-a", actor_id="a", correlation_id="c1")
@@ -87,3 +70,7 @@ def test_revenue_summary_aggregates_period() -> None:
     assert summary["period"] == "30d"
     assert Decimal(summary["total_amount"]) == Decimal("30.00")
     assert len(summary["items"]) == 2
+    assert {(item["source"], item["amount"], item["count"]) for item in summary["items"]} == {
+        ("diaspora_fee", "20.00", 1),
+        ("internal_transfer_fee", "10.00", 1),
+    }
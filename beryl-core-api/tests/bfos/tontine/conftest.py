@@ -0,0 +1,24 @@
+"""Tontine tests share one SQLite schema for the whole directory."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.bfos._tables import TONTINE_TABLES
+
+
+@pytest.fixture(scope="session")
+def tontine_engine(bfos_engine_builder):
+    engine = bfos_engine_builder(TONTINE_TABLES)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def bfos_tables():
+    return TONTINE_TABLES
+
+
+@pytest.fixture(scope="module")
+def bfos_engine(tontine_engine):
+    return tontine_engine
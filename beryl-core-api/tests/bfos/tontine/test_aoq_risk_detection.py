@@ -2,14 +2,20 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+import pytest
+
+from src.bfos.tontine import aoq_tontine_engine
 from src.bfos.tontine.aoq_tontine_engine import (
     adjust_reputation,
     detect_collusion,
     detect_default_risk,
+    detect_default_risk_many,
     detect_schedule_manipulation,
     freeze_group_if_needed,
 )
 
+_FIFTY = Decimal("50.00")
+
 
 def test_aoq_detects_default_risk_and_can_freeze_group() -> None:
     signal = detect_default_risk({"avg_reputation": "18", "missed_contributions": 2})
@@ -35,5 +41,31 @@ def test_aoq_detects_schedule_manipulation_and_collusion_placeholders() -> None:
 
 
 def test_aoq_adjust_reputation_applies_penalty() -> None:
-    updated = adjust_reputation(Decimal("50.00"), "fraud_attempt")
-    assert updated < Decimal("50.00")
+    updated = adjust_reputation(_FIFTY, "fraud_attempt")
+    assert updated < _FIFTY
+
+
+def test_aoq_default_risk_batch_matches_single_evaluation(monkeypatch) -> None:
+    pytest.importorskip("numba")
+    assert aoq_tontine_engine._NUMBA_AVAILABLE
+    kernel = aoq_tontine_engine._default_risk_levels_numba
+    kernel_batches = []
+
+    def spy(reputation_hundredths, missed_contributions):
+        kernel_batches.append(len(reputation_hundredths))
+        return kernel(reputation_hundredths, missed_contributions)
+
+    monkeypatch.setattr(aoq_tontine_engine, "_default_risk_levels_numba", spy)
+    reputations = ["50", "30", "29.999", "20", "19.99", "0", "100", "-1"]
+    contexts = [
+        {"avg_reputation": reputation, "missed_contributions": missed}
+        for reputation in reputations
+        for missed in (0, 1)
+    ] * 8
+
+    batch = detect_default_risk_many(contexts)
+
+    assert batch == [detect_default_risk(context) for context in contexts]
+    assert detect_default_risk_many(contexts[:4]) == batch[:4]
+    # Only the full batch crosses the threshold; the short one stays on the Decimal path.
+    assert kernel_batches == [len(contexts)]
@@ -1,55 +1,27 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import case, func, select
 
 from src.bfos.tontine.tontine_engine import TontineEngine
 from src.core.audit.service import AuditService
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.tontine import (
-    TontineCycleModel,
-    TontineGroupModel,
-    TontineMemberModel,
-    TontineVoteModel,
-    TontineWithdrawRequestModel,
-)
-from src.db.sqlalchemy import Base
+from src.db.models.ledger import LedgerEntryModel
 
-
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            TontineGroupModel.__table__,
-            TontineMemberModel.__table__,
-            TontineCycleModel.__table__,
-            TontineWithdrawRequestModel.__table__,
-            TontineVoteModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100.00")
+_FIFTY = Decimal("50.00")
 
 
-def test_tontine_ledger_keeps_double_entry_and_audit_chain_integrity() -> None:
-    factory = _session_factory()
+def test_tontine_ledger_keeps_double_entry_and_audit_chain_integrity(session_factory) -> None:
+    factory = session_factory
     engine = TontineEngine(session_factory=factory)
     audit = AuditService(session_factory=factory)
 
     created = engine.create_tontine(
         community_group_id="community-ledger",
         created_by="ledger-a",
-        contribution_amount=Decimal("100.00"),
+        contribution_amount=_HUNDRED,
         frequency_type="WEEKLY",
         security_code="99999",
         max_members=2,
@@ -65,21 +37,21 @@ def test_tontine_ledger_keeps_double_entry_and_audit_chain_integrity() -> None:
     engine.contribute(
         tontine_id=created["tontine_id"],
         user_id="ledger-a",
-        amount=Decimal("100.00"),
+        amount=_HUNDRED,
         idempotency_key="idem-contrib-ledger-a",
         correlation_id="corr-contrib-ledger-a",
     )
     engine.contribute(
         tontine_id=created["tontine_id"],
         user_id="ledger-b",
-        amount=Decimal("100.00"),
+        amount=_HUNDRED,
         idempotency_key="idem-contrib-ledger-b",
         correlation_id="corr-contrib-ledger-b",
     )
     withdraw = engine.request_withdraw(
         tontine_id=created["tontine_id"],
         requested_by="ledger-a",
-        amount=Decimal("50.00"),
+        amount=_FIFTY,
         security_code="99999",
         idempotency_key="idem-withdraw-ledger",
         correlation_id="corr-withdraw-ledger",
@@ -103,23 +75,25 @@ def test_tontine_ledger_keeps_double_entry_and_audit_chain_integrity() -> None:
         correlation_id="corr-vote-ledger-b",
     )
 
+    is_debit = case((LedgerEntryModel.direction == "DEBIT", 1), else_=0)
     with factory() as session:
-        entries = list(
-            session.execute(
-                select(LedgerEntryModel).where(LedgerEntryModel.reference.like("tontine:%"))
-            ).scalars().all()
-        )
-
-    by_reference: dict[str, list[LedgerEntryModel]] = defaultdict(list)
-    for entry in entries:
-        by_reference[str(entry.reference)].append(entry)
+        groups = session.execute(
+            select(
+                LedgerEntryModel.reference,
+                func.count(),
+                func.sum(is_debit),
+                func.min(LedgerEntryModel.amount),
+                func.max(LedgerEntryModel.amount),
+            )
+            .where(LedgerEntryModel.reference.like("tontine:%"))
+            .group_by(LedgerEntryModel.reference)
+        ).all()
 
-    assert by_reference, "Expected tontine ledger entries to be present"
-    for ref, grouped in by_reference.items():
-        assert len(grouped) == 2, f"{ref} does not have exactly two entries"
-        assert {entry.direction for entry in grouped} == {"DEBIT", "CREDIT"}
-        amounts = {Decimal(str(entry.amount)).quantize(Decimal("0.01")) for entry in grouped}
-        assert len(amounts) == 1, f"{ref} has inconsistent debit/credit amount"
+    assert groups, "Expected tontine ledger entries to be present"
+    for ref, count, debits, low, high in groups:
+        assert count == 2, f"{ref} does not have exactly two entries"
+        assert debits == 1, f"{ref} is not one DEBIT and one CREDIT"
+        assert low.quantize(_CENT) == high.quantize(_CENT), f"{ref} has inconsistent debit/credit amount"
 
     _, issues = audit.verify_integrity()
     invalid_rows = [issue for issue in issues if issue.startswith("invalid_signature_or_hash")]
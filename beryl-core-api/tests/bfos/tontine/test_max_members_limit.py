@@ -3,45 +3,12 @@ from __future__ import annotations
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from src.bfos.tontine.tontine_engine import TontineEngine
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.tontine import (
-    TontineCycleModel,
-    TontineGroupModel,
-    TontineMemberModel,
-    TontineVoteModel,
-    TontineWithdrawRequestModel,
-)
-from src.db.sqlalchemy import Base
 
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            TontineGroupModel.__table__,
-            TontineMemberModel.__table__,
-            TontineCycleModel.__table__,
-            TontineWithdrawRequestModel.__table__,
-            TontineVoteModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
-
-
-def test_max_members_limit_enforced() -> None:
-    factory = _session_factory()
+def test_max_members_limit_enforced(session_factory) -> None:
+    factory = session_factory
     engine = TontineEngine(session_factory=factory)
 
     created = engine.create_tontine(
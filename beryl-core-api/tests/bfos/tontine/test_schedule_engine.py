@@ -11,27 +11,25 @@ from src.bfos.tontine.schedule_engine import (
 )
 
 
-def test_validate_frequency_accepts_only_supported_values() -> None:
-    assert validate_frequency("daily") == "DAILY"
-    assert validate_frequency("WEEKLY") == "WEEKLY"
-    assert validate_frequency("biweekly") == "BIWEEKLY"
-    assert validate_frequency("monthly") == "MONTHLY"
+_ANCHOR = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
 
+_FREQUENCY_DAYS = [("DAILY", 1), ("WEEKLY", 7), ("BIWEEKLY", 14), ("MONTHLY", 30)]
+_FREQUENCY_SPELLINGS = [("daily", "DAILY"), ("WEEKLY", "WEEKLY"), ("biweekly", "BIWEEKLY"), ("monthly", "MONTHLY")]
+
+
+@pytest.mark.parametrize(("raw", "expected"), _FREQUENCY_SPELLINGS)
+def test_validate_frequency_accepts_only_supported_values(raw: str, expected: str) -> None:
+    assert validate_frequency(raw) == expected
+
+
+def test_validate_frequency_rejects_unsupported_values() -> None:
     with pytest.raises(ValueError):
         validate_frequency("YEARLY")
 
 
-def test_calculate_next_distribution_date_from_fixed_anchor() -> None:
-    anchor = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
-    next_daily = calculate_next_distribution_date("DAILY", from_date=anchor)
-    next_weekly = calculate_next_distribution_date("WEEKLY", from_date=anchor)
-    next_biweekly = calculate_next_distribution_date("BIWEEKLY", from_date=anchor)
-    next_monthly = calculate_next_distribution_date("MONTHLY", from_date=anchor)
-
-    assert (next_daily - anchor).days == 1
-    assert (next_weekly - anchor).days == 7
-    assert (next_biweekly - anchor).days == 14
-    assert (next_monthly - anchor).days == 30
+@pytest.mark.parametrize(("frequency", "expected_days"), _FREQUENCY_DAYS)
+def test_calculate_next_distribution_date_from_fixed_anchor(frequency: str, expected_days: int) -> None:
+    assert (calculate_next_distribution_date(frequency, from_date=_ANCHOR) - _ANCHOR).days == expected_days
 
 
 def test_enforce_schedule_lock_rejects_active_cycle_frequency_change() -> None:
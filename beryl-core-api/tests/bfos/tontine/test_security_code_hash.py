@@ -3,55 +3,48 @@ from __future__ import annotations
 from decimal import Decimal
 import uuid
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import select
 
 from src.bfos.tontine.security_code_manager import SecurityCodeManager
 from src.bfos.tontine.tontine_engine import TontineEngine
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.tontine import (
-    TontineCycleModel,
-    TontineGroupModel,
-    TontineMemberModel,
-    TontineVoteModel,
-    TontineWithdrawRequestModel,
-)
-from src.db.sqlalchemy import Base
-
-
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            TontineGroupModel.__table__,
-            TontineMemberModel.__table__,
-            TontineCycleModel.__table__,
-            TontineWithdrawRequestModel.__table__,
-            TontineVoteModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+from src.config import settings as settings_module
+from src.db.models.tontine import TontineGroupModel
 
 
 def test_security_code_is_hashed_and_verified() -> None:
-    manager = SecurityCodeManager(pepper="unit-test-pepper")
+    manager = SecurityCodeManager(pepper="unit-test-pepper", iterations=1)
     hashed = manager.hash_security_code("12345")
     assert "12345" not in hashed
     assert manager.verify_security_code("12345", hashed)
     assert not manager.verify_security_code("54321", hashed)
 
 
-def test_group_never_persists_security_code_in_cleartext() -> None:
-    factory = _session_factory()
-    engine = TontineEngine(session_factory=factory, codes=SecurityCodeManager(pepper="unit-test-pepper-2"))
+def test_security_code_hash_records_its_iteration_count() -> None:
+    manager = SecurityCodeManager(pepper="unit-test-pepper", iterations=1_000)
+    hashed = manager.hash_security_code("12345")
+    assert hashed.startswith("pbkdf2_sha256$1000$")
+    # Verification reads the count from the stored hash, not the manager.
+    assert SecurityCodeManager(pepper="unit-test-pepper", iterations=1).verify_security_code("12345", hashed)
+
+
+def test_pbkdf2_iterations_below_the_floor_are_rejected_outside_tests(monkeypatch) -> None:
+    monkeypatch.delenv("TESTING")
+    monkeypatch.setenv("BERYL_PBKDF2_ITERATIONS", str(settings_module.PBKDF2_MIN_ITERATIONS - 1))
+    with pytest.raises(ValueError, match="BERYL_PBKDF2_ITERATIONS"):
+        settings_module._pbkdf2_iterations()
+
+    monkeypatch.setenv("BERYL_PBKDF2_ITERATIONS", str(settings_module.PBKDF2_MIN_ITERATIONS))
+    assert settings_module._pbkdf2_iterations() == settings_module.PBKDF2_MIN_ITERATIONS
+
+    monkeypatch.setenv("TESTING", "1")
+    monkeypatch.setenv("BERYL_PBKDF2_ITERATIONS", "1")
+    assert settings_module._pbkdf2_iterations() == 1
+
+
+def test_group_never_persists_security_code_in_cleartext(session_factory) -> None:
+    factory = session_factory
+    engine = TontineEngine(session_factory=factory, codes=SecurityCodeManager(pepper="unit-test-pepper-2", iterations=1))
     created = engine.create_tontine(
         community_group_id="community-sec",
         created_by="member-sec",
@@ -2,50 +2,42 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import sessionmaker
+import pytest
+from sqlalchemy import bindparam, select
 
+from src.bfos.fee_engine import compute_commission
 from src.bfos.tontine.tontine_engine import TontineEngine
+from src.config.settings import settings
 from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.tontine import (
-    TontineCycleModel,
-    TontineGroupModel,
-    TontineMemberModel,
-    TontineVoteModel,
-    TontineWithdrawRequestModel,
-)
-from src.db.sqlalchemy import Base
+from src.db.models.ledger import LedgerEntryModel
 
+_THOUSAND = Decimal("1000.00")
+_TEN = Decimal("10.00")
+_TONTINE_RATE = Decimal(str(settings.bfos_tontine_fee_rate))
+_LEDGER_BY_REFERENCE = select(LedgerEntryModel).where(LedgerEntryModel.reference.like(bindparam("reference")))
+_AUDIT_BY_ACTION = select(AuditChainEventModel).where(AuditChainEventModel.action == bindparam("action"))
 
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            TontineGroupModel.__table__,
-            TontineMemberModel.__table__,
-            TontineCycleModel.__table__,
-            TontineWithdrawRequestModel.__table__,
-            TontineVoteModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+
+@pytest.mark.parametrize(
+    ("contribution", "expected_fee"),
+    [
+        (Decimal("1000.00"), Decimal("10.00")),
+        (Decimal("250.50"), Decimal("2.51")),
+        (Decimal("0.49"), Decimal("0.00")),
+    ],
+)
+def test_tontine_commission_math(contribution: Decimal, expected_fee: Decimal) -> None:
+    assert compute_commission(contribution, _TONTINE_RATE) == expected_fee
 
 
-def test_tontine_commission_is_1_percent_and_ledgered() -> None:
-    factory = _session_factory()
+@pytest.mark.integration
+def test_tontine_commission_is_1_percent_and_ledgered(session_factory) -> None:
+    factory = session_factory
     engine = TontineEngine(session_factory=factory)
     created = engine.create_tontine(
         community_group_id="community-fee",
         created_by="member-fee",
-        contribution_amount=Decimal("1000.00"),
+        contribution_amount=_THOUSAND,
         frequency_type="WEEKLY",
         security_code="33333",
         max_members=5,
@@ -56,25 +48,17 @@ def test_tontine_commission_is_1_percent_and_ledgered() -> None:
     contribution = engine.contribute(
         tontine_id=created["tontine_id"],
         user_id="member-fee",
-        amount=Decimal("1000.00"),
+        amount=_THOUSAND,
         idempotency_key="idem-contrib-fee",
         correlation_id="corr-contrib-fee",
     )
-    assert Decimal(contribution["fee_amount"]) == Decimal("10.00")
+    assert Decimal(contribution["fee_amount"]) == _TEN
 
     with factory() as session:
-        commission_entries = list(
-            session.execute(
-                select(LedgerEntryModel).where(LedgerEntryModel.reference.like("%commission%"))
-            ).scalars().all()
-        )
-        fee_audit = list(
-            session.execute(
-                select(AuditChainEventModel).where(AuditChainEventModel.action == "BFOS_FEE_CALCULATED")
-            ).scalars().all()
-        )
+        commission_entries = session.execute(_LEDGER_BY_REFERENCE, {"reference": "%:commission"}).scalars().all()
+        fee_audit = session.execute(_AUDIT_BY_ACTION, {"action": "BFOS_FEE_CALCULATED"}).scalars().all()
 
     assert len(commission_entries) == 2
     assert {entry.direction for entry in commission_entries} == {"DEBIT", "CREDIT"}
-    assert all(Decimal(str(entry.amount)) == Decimal("10.00") for entry in commission_entries)
+    assert all(Decimal(str(entry.amount)) == _TEN for entry in commission_entries)
     assert len(fee_audit) >= 1
@@ -2,127 +2,193 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import pytest
 
 from src.bfos.tontine.tontine_engine import TontineEngine
-from src.db.models.audit_chain import AuditChainEventModel
-from src.db.models.idempotency import IdempotencyKeyModel
-from src.db.models.ledger import LedgerAccountModel, LedgerEntryModel, LedgerUserModel
-from src.db.models.tontine import (
-    TontineCycleModel,
-    TontineGroupModel,
-    TontineMemberModel,
-    TontineVoteModel,
-    TontineWithdrawRequestModel,
-)
-from src.db.sqlalchemy import Base
-
-
-def _session_factory():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(
-        bind=engine,
-        tables=[
-            AuditChainEventModel.__table__,
-            IdempotencyKeyModel.__table__,
-            LedgerUserModel.__table__,
-            LedgerAccountModel.__table__,
-            LedgerEntryModel.__table__,
-            TontineGroupModel.__table__,
-            TontineMemberModel.__table__,
-            TontineCycleModel.__table__,
-            TontineWithdrawRequestModel.__table__,
-            TontineVoteModel.__table__,
-        ],
-    )
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
-
-
-def test_withdraw_requires_unanimous_vote() -> None:
-    factory = _session_factory()
+from src.core.audit.service import AuditService
+
+_HUNDRED = Decimal("100.00")
+_TWENTY = Decimal("20.00")
+
+
+def test_withdraw_requires_unanimous_vote(session_factory) -> None:
+    factory = session_factory
     engine = TontineEngine(session_factory=factory)
 
-    created = engine.create_tontine(
-        community_group_id="community-g2",
-        created_by="member-a",
-        contribution_amount=Decimal("100.00"),
-        frequency_type="WEEKLY",
-        security_code="55555",
-        max_members=2,
-        idempotency_key="idem-create-unanimous",
-        correlation_id="corr-create-unanimous",
-    )
-    engine.join_tontine(
-        tontine_id=created["tontine_id"],
-        user_id="member-b",
-        idempotency_key="idem-join-unanimous",
-        correlation_id="corr-join-unanimous",
-    )
-
-    engine.contribute(
-        tontine_id=created["tontine_id"],
-        user_id="member-a",
-        amount=Decimal("100.00"),
-        idempotency_key="idem-contrib-a",
-        correlation_id="corr-contrib-a",
-    )
-    engine.contribute(
-        tontine_id=created["tontine_id"],
-        user_id="member-b",
-        amount=Decimal("100.00"),
-        idempotency_key="idem-contrib-b",
-        correlation_id="corr-contrib-b",
-    )
-
-    request = engine.request_withdraw(
-        tontine_id=created["tontine_id"],
-        requested_by="member-a",
-        amount=Decimal("100.00"),
-        security_code="55555",
-        idempotency_key="idem-withdraw-request",
-        correlation_id="corr-withdraw-request",
-    )
-    assert request["withdraw_status"] == "PENDING"
-
-    first_vote = engine.vote_withdraw(
-        tontine_id=created["tontine_id"],
-        withdraw_request_id=request["withdraw_request_id"],
-        user_id="member-a",
-        approved=True,
-        security_code="55555",
-        idempotency_key="idem-vote-a",
-        correlation_id="corr-vote-a",
-    )
-    assert first_vote["status"] == "PENDING"
-
-    second_vote = engine.vote_withdraw(
-        tontine_id=created["tontine_id"],
-        withdraw_request_id=request["withdraw_request_id"],
-        user_id="member-b",
-        approved=True,
-        security_code="55555",
-        idempotency_key="idem-vote-b",
-        correlation_id="corr-vote-b",
-    )
-    assert second_vote["status"] == "EXECUTED"
-    assert second_vote["executed"] is True
-
-    rejected_request = engine.request_withdraw(
-        tontine_id=created["tontine_id"],
-        requested_by="member-a",
-        amount=Decimal("20.00"),
-        security_code="55555",
-        idempotency_key="idem-withdraw-request-2",
-        correlation_id="corr-withdraw-request-2",
-    )
-    rejected_vote = engine.vote_withdraw(
-        tontine_id=created["tontine_id"],
-        withdraw_request_id=rejected_request["withdraw_request_id"],
-        user_id="member-a",
-        approved=False,
-        security_code="55555",
-        idempotency_key="idem-vote-reject",
-        correlation_id="corr-vote-reject",
-    )
-    assert rejected_vote["status"] == "REJECTED"
+    with engine.batch():
+        created = engine.create_tontine(
+            community_group_id="community-g2",
+            created_by="member-a",
+            contribution_amount=_HUNDRED,
+            frequency_type="WEEKLY",
+            security_code="55555",
+            max_members=2,
+            idempotency_key="idem-create-unanimous",
+            correlation_id="corr-create-unanimous",
+        )
+        engine.join_tontine(
+            tontine_id=created["tontine_id"],
+            user_id="member-b",
+            idempotency_key="idem-join-unanimous",
+            correlation_id="corr-join-unanimous",
+        )
+
+        engine.contribute(
+            tontine_id=created["tontine_id"],
+            user_id="member-a",
+            amount=_HUNDRED,
+            idempotency_key="idem-contrib-a",
+            correlation_id="corr-contrib-a",
+        )
+        engine.contribute(
+            tontine_id=created["tontine_id"],
+            user_id="member-b",
+            amount=_HUNDRED,
+            idempotency_key="idem-contrib-b",
+            correlation_id="corr-contrib-b",
+        )
+
+        request = engine.request_withdraw(
+            tontine_id=created["tontine_id"],
+            requested_by="member-a",
+            amount=_HUNDRED,
+            security_code="55555",
+            idempotency_key="idem-withdraw-request",
+            correlation_id="corr-withdraw-request",
+        )
+        assert request["withdraw_status"] == "PENDING"
+
+        first_vote = engine.vote_withdraw(
+            tontine_id=created["tontine_id"],
+            withdraw_request_id=request["withdraw_request_id"],
+            user_id="member-a",
+            approved=True,
+            security_code="55555",
+            idempotency_key="idem-vote-a",
+            correlation_id="corr-vote-a",
+        )
+        assert first_vote["status"] == "PENDING"
+
+        second_vote = engine.vote_withdraw(
+            tontine_id=created["tontine_id"],
+            withdraw_request_id=request["withdraw_request_id"],
+            user_id="member-b",
+            approved=True,
+            security_code="55555",
+            idempotency_key="idem-vote-b",
+            correlation_id="corr-vote-b",
+        )
+        assert second_vote["status"] == "EXECUTED"
+        assert second_vote["executed"] is True
+
+        rejected_request = engine.request_withdraw(
+            tontine_id=created["tontine_id"],
+            requested_by="member-a",
+            amount=_TWENTY,
+            security_code="55555",
+            idempotency_key="idem-withdraw-request-2",
+            correlation_id="corr-withdraw-request-2",
+        )
+        rejected_vote = engine.vote_withdraw(
+            tontine_id=created["tontine_id"],
+            withdraw_request_id=rejected_request["withdraw_request_id"],
+            user_id="member-a",
+            approved=False,
+            security_code="55555",
+            idempotency_key="idem-vote-reject",
+            correlation_id="corr-vote-reject",
+        )
+        assert rejected_vote["status"] == "REJECTED"
+
+
+def test_batch_rolls_back_only_the_failing_call(session_factory) -> None:
+    engine = TontineEngine(session_factory=session_factory)
+
+    with engine.batch():
+        created = engine.create_tontine(
+            community_group_id="community-batch",
+            created_by="member-a",
+            contribution_amount=_HUNDRED,
+            frequency_type="WEEKLY",
+            security_code="44444",
+            max_members=2,
+            idempotency_key="idem-create-batch",
+            correlation_id="corr-create-batch",
+        )
+        engine.join_tontine(
+            tontine_id=created["tontine_id"],
+            user_id="member-b",
+            idempotency_key="idem-join-batch-b",
+            correlation_id="corr-join-batch-b",
+        )
+        with pytest.raises(ValueError, match="max members limit reached"):
+            engine.join_tontine(
+                tontine_id=created["tontine_id"],
+                user_id="member-c",
+                idempotency_key="idem-join-batch-c",
+                correlation_id="corr-join-batch-c",
+            )
+
+    assert engine.get_tontine(tontine_id=created["tontine_id"])["member_count"] == 2
+
+
+def test_batch_rollback_after_audit_write_keeps_the_chain_intact(session_factory, monkeypatch) -> None:
+    engine = TontineEngine(session_factory=session_factory)
+
+    def fail_after_audit_write(**kwargs):
+        raise RuntimeError("snapshot failed")
+
+    with engine.batch():
+        created = engine.create_tontine(
+            community_group_id="community-batch-audit",
+            created_by="member-a",
+            contribution_amount=_HUNDRED,
+            frequency_type="WEEKLY",
+            security_code="33333",
+            max_members=2,
+            idempotency_key="idem-create-batch-audit",
+            correlation_id="corr-create-batch-audit",
+        )
+        engine.join_tontine(
+            tontine_id=created["tontine_id"],
+            user_id="member-b",
+            idempotency_key="idem-join-batch-audit",
+            correlation_id="corr-join-batch-audit",
+        )
+        engine.contribute(
+            tontine_id=created["tontine_id"],
+            user_id="member-a",
+            amount=_HUNDRED,
+            idempotency_key="idem-contrib-batch-audit-a",
+            correlation_id="corr-contrib-batch-audit-a",
+        )
+        engine.contribute(
+            tontine_id=created["tontine_id"],
+            user_id="member-b",
+            amount=_HUNDRED,
+            idempotency_key="idem-contrib-batch-audit-b",
+            correlation_id="corr-contrib-batch-audit-b",
+        )
+        with monkeypatch.context() as patch:
+            # request_withdraw serialises its snapshot after the audit event is written.
+            patch.setattr(engine, "_serialize_group", fail_after_audit_write)
+            with pytest.raises(RuntimeError, match="snapshot failed"):
+                engine.request_withdraw(
+                    tontine_id=created["tontine_id"],
+                    requested_by="member-a",
+                    amount=_HUNDRED,
+                    security_code="33333",
+                    idempotency_key="idem-withdraw-batch-audit",
+                    correlation_id="corr-withdraw-batch-audit",
+                )
+        engine.request_withdraw(
+            tontine_id=created["tontine_id"],
+            requested_by="member-a",
+            amount=_HUNDRED,
+            security_code="33333",
+            idempotency_key="idem-withdraw-batch-audit-retry",
+            correlation_id="corr-withdraw-batch-audit-retry",
+        )
+
+    ok, issues = AuditService(session_factory=session_factory).verify_integrity()
+    assert ok, issues
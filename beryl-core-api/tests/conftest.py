@@ -1,51 +1,61 @@
 """Conftest for async fixtures in Beryl Core API tests."""
 
+import asyncio
 import os
 import signal
 import sys
 import pathlib
+from types import MappingProxyType
 
 os.environ["TESTING"] = "1"
+# The tontine tests only check the hash format; one PBKDF2 round is enough.
+os.environ.setdefault("BERYL_PBKDF2_ITERATIONS", "1")
 for flag in ("TRACING_ENABLED", "METRICS_ENABLED", "AUDIT_ENABLED"):
     os.environ.setdefault(flag, "false")
 
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from jose import jwt
 
 project_root = pathlib.Path(__file__).resolve().parents[1]
 if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
+from src.config.settings import settings
 from src.main import app
 
 
-@pytest_asyncio.fixture
-async def async_client():
-    """Async client fixture for FastAPI tests."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+@pytest.fixture(scope="session")
+def async_client():
+    """Async client fixture for FastAPI tests, shared by the whole session.
 
+    ASGITransport holds no pooled connections, so the client is not bound to
+    any test's event loop; routes are stateless and no endpoint sets cookies.
+    """
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def valid_tokens():
-    """Fixture with valid tokens for all domains."""
-    from jose import jwt
-    from src.config.settings import settings
-    return {
-        "fintech": (
-            f"Bearer {jwt.encode({'sub': 'fintech_123', 'scopes': ['fintech'], 'domain': 'fintech'}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)}"
-        ),
-        "mobility": (
-            f"Bearer {jwt.encode({'sub': 'mobility_123', 'scopes': ['mobility'], 'domain': 'mobility'}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)}"
-        ),
-        "esg": (
-            f"Bearer {jwt.encode({'sub': 'esg_123', 'scopes': ['esg'], 'domain': 'esg'}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)}"
-        ),
-        "social": (
-            f"Bearer {jwt.encode({'sub': 'social_123', 'scopes': ['social'], 'domain': 'social'}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)}"
-        ),
-    }
+    """Fixture with valid tokens for all domains.
+
+    The claims are static, so the tokens are signed once per session; the
+    mapping is read-only so no test can leak changes into another.
+    """
+    return MappingProxyType(
+        {
+            domain: "Bearer "
+            + jwt.encode(
+                {"sub": f"{domain}_123", "scopes": [domain], "domain": domain},
+                settings.jwt_secret_key,
+                algorithm=settings.jwt_algorithm,
+            )
+            for domain in ("fintech", "mobility", "esg", "social")
+        }
+    )
 
 
 @pytest.fixture
@@ -72,6 +82,7 @@ async def mock_external_services():
 
 
 PYTEST_TIMEOUT_SIGNAL = getattr(signal, "SIGALRM", None)
+_TIMEOUT_SECONDS = pytest.StashKey[int]()
 
 
 def _timeout_handler(signum, frame):
@@ -82,13 +93,20 @@ def pytest_addoption(parser):
     parser.addini("timeout", "Maximum per-test duration in seconds", default="15")
 
 
-def pytest_runtest_setup(item):
-    timeout_value = int(item.config.getini("timeout") or 0)
-    if PYTEST_TIMEOUT_SIGNAL and timeout_value > 0:
+def pytest_configure(config):
+    # Parse the ini value and install the handler once; each test only arms the alarm.
+    timeout_value = int(config.getini("timeout") or 0) if PYTEST_TIMEOUT_SIGNAL else 0
+    config.stash[_TIMEOUT_SECONDS] = timeout_value
+    if timeout_value > 0:
         signal.signal(PYTEST_TIMEOUT_SIGNAL, _timeout_handler)
+
+
+def pytest_runtest_setup(item):
+    timeout_value = item.config.stash[_TIMEOUT_SECONDS]
+    if timeout_value > 0:
         signal.alarm(timeout_value)
 
 
 def pytest_runtest_teardown(item, nextitem):
-    if PYTEST_TIMEOUT_SIGNAL:
+    if item.config.stash[_TIMEOUT_SECONDS] > 0:
         signal.alarm(0)
@@ -0,0 +1,17 @@
+"""Fixtures shared by the integration route tests."""
+
+import pytest
+
+from src.api.v1.routes.aoq_routes import get_aoq_service
+from src.main import app
+
+
+@pytest.fixture
+def aoq_service():
+    """Install a fake AOQ service for the current test: ``aoq_service(FakeService())``."""
+
+    def _install(fake):
+        app.dependency_overrides[get_aoq_service] = lambda: fake
+
+    yield _install
+    app.dependency_overrides.pop(get_aoq_service, None)
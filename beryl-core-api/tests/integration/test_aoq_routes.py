@@ -10,9 +10,7 @@ from src.orchestration.aoq.service import AoqNotFoundError, AoqValidationError
 
 
 @pytest.mark.asyncio
-async def test_create_signal_returns_201(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_create_signal_returns_201(async_client, valid_tokens, aoq_service):
     signal_id = uuid4()
     fake_signal = SimpleNamespace(
         id=signal_id,
@@ -28,7 +26,7 @@ async def test_create_signal_returns_201(async_client, valid_tokens, monkeypatch
             assert "features" in payload
             return fake_signal
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.post(
         "/api/v1/aoq/signals",
@@ -54,9 +52,7 @@ async def test_create_signal_returns_201(async_client, valid_tokens, monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_create_decision_returns_200(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_create_decision_returns_200(async_client, valid_tokens, aoq_service):
     decision_id = uuid4()
     signal_id = uuid4()
     rule_id = uuid4()
@@ -80,7 +76,7 @@ async def test_create_decision_returns_200(async_client, valid_tokens, monkeypat
             assert features_payload["fintech_score"] == 80
             return fake_decision
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.post(
         "/api/v1/aoq/decision",
@@ -104,9 +100,7 @@ async def test_create_decision_returns_200(async_client, valid_tokens, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_get_and_create_rules(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_get_and_create_rules(async_client, valid_tokens, aoq_service):
     rule_id = uuid4()
     now = datetime.now(timezone.utc)
     fake_rule = SimpleNamespace(
@@ -131,7 +125,7 @@ async def test_get_and_create_rules(async_client, valid_tokens, monkeypatch):
             assert payload["name"] == "risk-v2"
             return SimpleNamespace(**{**fake_rule.__dict__, "name": "risk-v2", "version": 2})
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     list_response = await async_client.get(
         "/api/v1/aoq/rules",
@@ -158,9 +152,7 @@ async def test_get_and_create_rules(async_client, valid_tokens, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_get_decision_by_id(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_get_decision_by_id(async_client, valid_tokens, aoq_service):
     decision_id = uuid4()
     signal_id = uuid4()
     rule_id = uuid4()
@@ -182,7 +174,7 @@ async def test_get_decision_by_id(async_client, valid_tokens, monkeypatch):
             assert incoming_decision_id == decision_id
             return fake_decision
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.get(
         f"/api/v1/aoq/decisions/{decision_id}",
@@ -194,14 +186,12 @@ async def test_get_decision_by_id(async_client, valid_tokens, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_create_decision_validation_error_maps_to_400(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_create_decision_validation_error_maps_to_400(async_client, valid_tokens, aoq_service):
     class FakeService:
         def compute_decision(self, user_id, signal_id, features_payload, metadata):
             raise AoqValidationError("bad payload")
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.post(
         "/api/v1/aoq/decision",
@@ -221,14 +211,12 @@ async def test_create_decision_validation_error_maps_to_400(async_client, valid_
 
 
 @pytest.mark.asyncio
-async def test_get_decision_not_found_maps_to_404(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_get_decision_not_found_maps_to_404(async_client, valid_tokens, aoq_service):
     class FakeService:
         def get_decision(self, decision_id):
             raise AoqNotFoundError("not found")
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.get(
         f"/api/v1/aoq/decisions/{uuid4()}",
@@ -239,9 +227,7 @@ async def test_get_decision_not_found_maps_to_404(async_client, valid_tokens, mo
 
 
 @pytest.mark.asyncio
-async def test_get_audit_trail(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_get_audit_trail(async_client, valid_tokens, aoq_service):
     audit_entry = SimpleNamespace(
         id=uuid4(),
         event_type="AOQ_DECISION_CREATED",
@@ -256,7 +242,7 @@ async def test_get_audit_trail(async_client, valid_tokens, monkeypatch):
             assert entity_id == "dec-1"
             return [audit_entry]
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.get(
         "/api/v1/aoq/audit/dec-1",
@@ -1,21 +1,27 @@
 """PostgreSQL integration test for AOQ rules creation endpoint."""
 
+import functools
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import delete, text
+from sqlalchemy import bindparam, delete, select, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.config.settings import settings
 from src.db.models.aoq import AoqRuleModel
 from src.db.sqlalchemy import SessionLocal
 
+_RULE_WEIGHTS = select(AoqRuleModel.weights).where(AoqRuleModel.name == bindparam("name"))
+_DELETE_RULE = delete(AoqRuleModel).where(AoqRuleModel.name == bindparam("name"))
+
 
 def _is_postgres_database() -> bool:
     return settings.database_url.startswith("postgresql")
 
 
+@functools.cache
 def _postgres_is_reachable() -> bool:
+    # Probe once per process: an unreachable server costs a connect timeout each time.
     try:
         with SessionLocal() as session:
             session.execute(text("SELECT 1"))
@@ -42,10 +48,7 @@ async def test_post_aoq_rules_persists_in_postgres(async_client, valid_tokens):
         "active": True,
     }
 
-    with SessionLocal() as session:
-        session.execute(delete(AoqRuleModel).where(AoqRuleModel.name == unique_name))
-        session.commit()
-
+    # The uuid suffix keeps the name unique, so there is nothing to pre-clean.
     response = await async_client.post(
         "/api/v1/aoq/rules",
         headers={"Authorization": valid_tokens["social"]},
@@ -59,13 +62,13 @@ async def test_post_aoq_rules_persists_in_postgres(async_client, valid_tokens):
     assert body["weight_fintech"] == 0.35
 
     with SessionLocal() as session:
-        persisted = session.query(AoqRuleModel).filter(AoqRuleModel.name == unique_name).one_or_none()
-        assert persisted is not None
-        assert persisted.weights == {
+        # Column-level Core statements: one JSON value back, no ORM instance to hydrate.
+        weights = session.execute(_RULE_WEIGHTS, {"name": unique_name}).scalar_one_or_none()
+        assert weights == {
             "fintech": 0.35,
             "mobility": 0.25,
             "esg": 0.25,
             "social": 0.15,
         }
-        session.execute(delete(AoqRuleModel).where(AoqRuleModel.name == unique_name))
+        session.execute(_DELETE_RULE, {"name": unique_name})
         session.commit()
@@ -39,14 +39,12 @@ async def test_aoq_requires_token(async_client):
 
 
 @pytest.mark.asyncio
-async def test_aoq_accepts_valid_token(async_client, valid_tokens, monkeypatch):
-    import src.api.v1.routes.aoq_routes as aoq_routes
-
+async def test_aoq_accepts_valid_token(async_client, valid_tokens, aoq_service):
     class FakeService:
         def list_rules(self):
             return []
 
-    monkeypatch.setattr(aoq_routes, "service", FakeService())
+    aoq_service(FakeService())
 
     response = await async_client.get(
         "/api/v1/aoq/rules",
@@ -6,17 +6,31 @@ Tests publisher/subscriber pattern with mock event bus.
 
 import pytest
 import asyncio
+from uuid import uuid4
 from src.events.base.event import (
     DomainEvent,
     DomainEventType,
     TransactionCompletedEvent,
     RideCompletedEvent,
 )
+from src.events.base.event_handler import RecentEventIds
 from src.events.bus.event_bus import MockEventBus, EventBusFactory
 from src.events.consumers.fintech_consumer import TransactionCompletedConsumer
 from src.events.consumers.mobility_consumer import RideCompletedConsumer
 
 
+_TX_EVENT = TransactionCompletedEvent(
+    payload={"transaction_id": "tx_123"},
+    metadata={"user_id": "user_456"}
+)
+
+
+@pytest.fixture
+def tx_event():
+    """Validated once at import; a fresh event_id per test because consumers share their processed set."""
+    return _TX_EVENT.model_copy(update={"event_id": str(uuid4())})
+
+
 class TestEventPublishing:
     """Test event publishing."""
     
@@ -45,23 +59,18 @@ class TestEventPublishing:
         await bus.stop()
     
     @pytest.mark.asyncio
-    async def test_event_immutability(self):
+    async def test_event_immutability(self, tx_event):
         """Test that events are immutable."""
-        event = TransactionCompletedEvent(
-            payload={"transaction_id": "tx_123"},
-            metadata={"user_id": "user_456"}
-        )
-        
         # Attempt to modify should fail
         with pytest.raises(Exception):  # Pydantic frozen model
-            event.payload["transaction_id"] = "different"
+            tx_event.payload["transaction_id"] = "different"
 
 
 class TestEventSubscription:
     """Test event subscription and handling."""
     
     @pytest.mark.asyncio
-    async def test_handler_receives_event(self):
+    async def test_handler_receives_event(self, tx_event):
         """Test that handlers receive published events."""
         bus = MockEventBus()
         consumer = TransactionCompletedConsumer()
@@ -69,20 +78,15 @@ class TestEventSubscription:
         await bus.subscribe(DomainEventType.TRANSACTION_COMPLETED, consumer)
         await bus.start()
         
-        event = TransactionCompletedEvent(
-            payload={"transaction_id": "tx_123"},
-            metadata={"user_id": "user_456"}
-        )
-        
-        await bus.publish(event)
+        await bus.publish(tx_event)
         
         # Check that handler processed it
-        assert event.event_id in consumer._processed
+        assert tx_event.event_id in consumer._processed
         
         await bus.stop()
     
     @pytest.mark.asyncio
-    async def test_multiple_consumers(self):
+    async def test_multiple_consumers(self, tx_event):
         """Test multiple consumers processing same event."""
         bus = MockEventBus()
         consumer1 = TransactionCompletedConsumer()
@@ -92,16 +96,11 @@ class TestEventSubscription:
         await bus.subscribe(DomainEventType.TRANSACTION_COMPLETED, consumer2)
         await bus.start()
         
-        event = TransactionCompletedEvent(
-            payload={"transaction_id": "tx_123"},
-            metadata={"user_id": "user_456"}
-        )
-        
-        await bus.publish(event)
+        await bus.publish(tx_event)
         
         # Both consumers should process
-        assert event.event_id in consumer1._processed
-        assert event.event_id in consumer2._processed
+        assert tx_event.event_id in consumer1._processed
+        assert tx_event.event_id in consumer2._processed
         
         await bus.stop()
 
@@ -110,23 +109,28 @@ class TestEventIdempotency:
     """Test idempotent event handling."""
     
     @pytest.mark.asyncio
-    async def test_consumer_idempotency(self):
+    async def test_consumer_idempotency(self, tx_event):
         """Test that consuming same event twice doesn't cause issues."""
         consumer = TransactionCompletedConsumer()
         
-        event = TransactionCompletedEvent(
-            payload={"transaction_id": "tx_123"},
-            metadata={"user_id": "user_456"}
-        )
-        
         # Handle same event twice
-        await consumer.handle(event)
-        await consumer.handle(event)
+        await consumer.handle(tx_event)
+        await consumer.handle(tx_event)
         
         # Should only be in processed set once
-        assert event.event_id in consumer._processed
+        assert tx_event.event_id in consumer._processed
         assert len(consumer.handled_events) == 1
 
+    def test_recent_event_ids_are_bounded(self):
+        """Test the idempotency guard keeps only the newest event ids."""
+        recent = RecentEventIds(maxlen=2)
+        for event_id in ("evt-1", "evt-2", "evt-2", "evt-3"):
+            recent.add(event_id)
+        
+        assert len(recent) == 2
+        assert "evt-1" not in recent
+        assert "evt-2" in recent and "evt-3" in recent
+
 
 class TestCrossDomainEvents:
     """Test cross-domain event communication."""
@@ -170,14 +174,20 @@ class TestEventSerialization:
         assert isinstance(event_dict["timestamp"], str)
 
 
+@pytest.fixture
+def isolated_bus_factory(monkeypatch):
+    """Give the test an empty factory cache; the previous one, app bus included, is restored afterwards."""
+    monkeypatch.setattr(EventBusFactory, "_instances", {})
+    return EventBusFactory
+
+
 class TestEventBusFactory:
     """Test event bus factory."""
     
     @pytest.mark.asyncio
-    async def test_factory_creates_mock_bus(self):
+    async def test_factory_creates_mock_bus(self, isolated_bus_factory):
         """Test factory creates mock bus by default."""
-        EventBusFactory.reset()
-        bus = await EventBusFactory.create(broker_type="mock")
+        bus = await isolated_bus_factory.create(broker_type="mock")
         
         assert bus is not None
         assert bus.broker_type == "mock"
@@ -186,12 +196,10 @@ class TestEventBusFactory:
         await bus.stop()
     
     @pytest.mark.asyncio
-    async def test_factory_caches_instances(self):
+    async def test_factory_caches_instances(self, isolated_bus_factory):
         """Test factory caches bus instances."""
-        EventBusFactory.reset()
-        
-        bus1 = await EventBusFactory.create(broker_type="mock")
-        bus2 = await EventBusFactory.create(broker_type="mock")
+        bus1 = await isolated_bus_factory.create(broker_type="mock")
+        bus2 = await isolated_bus_factory.create(broker_type="mock")
         
         assert bus1 is bus2
 
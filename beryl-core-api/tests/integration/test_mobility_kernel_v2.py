@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import hmac
+import os
 import time
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.config.settings import settings
 
+_SECRET_BYTES = settings.event_hmac_secret.encode("utf-8")
+_PAYLOAD_HASH = hashlib.sha256(b"payload-for-signature").hexdigest()
+_PAYLOAD_HASH_BYTES = _PAYLOAD_HASH.encode("ascii")
+_SIGNED_SCOPE = b"ride.book"
+_ROTATION_WINDOW_SECONDS = max(60, settings.nonce_ttl_seconds)
+
+
+@functools.lru_cache(maxsize=8)
+def _rotated_secret(window: int) -> bytes:
+    return hmac.digest(_SECRET_BYTES, f"signature-window:{window}".encode("utf-8"), "sha256").hex().encode("utf-8")
+
 
 def _secure_headers(authorization: str, idempotency_key: str | None = None) -> dict[str, str]:
+    # One urandom read feeds both version-4 ids.
+    entropy = os.urandom(32)
     headers = {
         "Authorization": authorization,
-        "X-Correlation-ID": str(uuid4()),
-        "X-Nonce": str(uuid4()),
+        "X-Correlation-ID": str(UUID(bytes=entropy[:16], version=4)),
+        "X-Nonce": str(UUID(bytes=entropy[16:], version=4)),
         "X-Timestamp": str(int(time.time())),
     }
     if idempotency_key:
@@ -43,7 +58,7 @@ async def test_token_exchange_success(async_client, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_signature_challenge_verify_and_replay_block(async_client, valid_tokens):
-    payload_hash = hashlib.sha256(b"payload-for-signature").hexdigest()
+    payload_hash = _PAYLOAD_HASH
     challenge_response = await async_client.post(
         "/api/v1/security/signature/challenge",
         headers=_secure_headers(valid_tokens["social"], "sig-challenge-1"),
@@ -52,21 +67,17 @@ async def test_signature_challenge_verify_and_replay_block(async_client, valid_t
     assert challenge_response.status_code == 201
     challenge = challenge_response.json()
 
-    rotation_window_seconds = max(60, settings.nonce_ttl_seconds)
-    window = challenge["timestamp"] // rotation_window_seconds
-    rotated_secret = hmac.new(
-        settings.event_hmac_secret.encode("utf-8"),
-        f"signature-window:{window}".encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    canonical_payload = (
-        f"{challenge['challenge_id']}:{challenge['nonce']}:{challenge['timestamp']}:{payload_hash}:ride.book"
+    window = challenge["timestamp"] // _ROTATION_WINDOW_SECONDS
+    canonical_payload = b":".join(
+        (
+            challenge["challenge_id"].encode("utf-8"),
+            challenge["nonce"].encode("utf-8"),
+            str(challenge["timestamp"]).encode("utf-8"),
+            _PAYLOAD_HASH_BYTES,
+            _SIGNED_SCOPE,
+        )
     )
-    signature = hmac.new(
-        rotated_secret.encode("utf-8"),
-        canonical_payload.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    signature = hmac.digest(_rotated_secret(window), canonical_payload, "sha256").hex()
 
     verify_response = await async_client.post(
         "/api/v1/security/signature/verify",
@@ -4,6 +4,8 @@ Integration tests for mobility routes.
 Tests the complete flow from HTTP request to response normalization.
 """
 
+import inspect
+import json
 import pytest
 from datetime import datetime
 from fastapi import HTTPException
@@ -15,6 +17,53 @@ from src.api.v1.schemas.mobility_schema import (
     FleetAnalysisRequest, FleetAnalysisResponse,
     IntelligentDestinationRequest,
 )
+from src.adapters.mobility_ai_engine.client import MobilityAIClient
+from src.adapters.mobility_ai_engine.mapper import MobilityMapper
+from src.config.settings import settings
+from src.orchestration.mobility.fleet_intelligence import FleetIntelligenceWorkflow
+
+_TIMESTAMP = datetime(2024, 1, 1).isoformat()
+
+_EXPECTED_PATHS = frozenset({
+    "/demand/predict",
+    "/routing/optimize",
+    "/fleet/{fleet_id}/analyze",
+    "/vehicle/{vehicle_id}/status",
+    "/vehicle/{vehicle_id}/maintenance",
+    "/fleet/{fleet_id}/optimize-distribution",
+    "/destination/intelligent",
+})
+_ROUTE_PATHS = frozenset(getattr(r, "path", None) for r in router.routes) - {None}
+
+_WORKFLOW_METHODS = (
+    "predict_demand",
+    "optimize_route",
+    "analyze_fleet",
+    "get_vehicle_status",
+    "predict_maintenance",
+    "optimize_fleet_distribution",
+)
+_MAPPER_METHODS = (
+    "map_demand_response",
+    "map_route_response",
+    "map_fleet_analysis_response",
+    "map_vehicle_status_response",
+    "map_maintenance_response",
+)
+_CLIENT_METHODS = (
+    "predict_demand",
+    "optimize_route",
+    "analyze_fleet",
+    "get_vehicle_status",
+    "predict_maintenance",
+    "close",
+)
+
+
+def _assert_defines(cls, names):
+    # Looked up on the class: instantiating the client or workflow opens an httpx pool.
+    missing = [name for name in names if inspect.getattr_static(cls, name, None) is None]
+    assert not missing, f"{cls.__name__} is missing {missing}"
 
 
 @pytest.fixture
@@ -27,21 +76,18 @@ def demand_request():
     )
 
 
-@pytest.fixture
-def demand_response():
-    """Create a sample demand response."""
-    return {
-        "location": "Paris-Center",
-        "predicted_demand": 150.5,
-        "confidence": 0.92,
-        "time_window": "hourly",
-        "forecast_horizon": 24,
-        "forecast_data": [
-            {"hour": 0, "demand": 45.2},
-            {"hour": 1, "demand": 42.1}
-        ],
-        "timestamp": datetime.utcnow().isoformat()
-    }
+_DEMAND_RESPONSE_JSON = json.dumps({
+    "location": "Paris-Center",
+    "predicted_demand": 150.5,
+    "confidence": 0.92,
+    "time_window": "hourly",
+    "forecast_horizon": 24,
+    "forecast_data": [
+        {"hour": 0, "demand": 45.2},
+        {"hour": 1, "demand": 42.1}
+    ],
+    "timestamp": _TIMESTAMP
+}).encode()
 
 
 @pytest.fixture
@@ -55,24 +101,21 @@ def route_request():
     )
 
 
-@pytest.fixture
-def route_response():
-    """Create a sample route response."""
-    return {
-        "route_id": "route_123",
-        "origin": "Paris-Gare-du-Nord",
-        "destination": "Paris-LaDefense",
-        "vehicle_type": "ebike",
-        "distance_km": 12.5,
-        "estimated_time_minutes": 28,
-        "energy_consumption_kwh": 0.45,
-        "waypoints": [
-            {"lat": 48.8806, "lng": 2.3553},
-            {"lat": 48.8921, "lng": 2.3927}
-        ],
-        "efficiency_score": 0.87,
-        "timestamp": datetime.utcnow().isoformat()
-    }
+_ROUTE_RESPONSE_JSON = json.dumps({
+    "route_id": "route_123",
+    "origin": "Paris-Gare-du-Nord",
+    "destination": "Paris-LaDefense",
+    "vehicle_type": "ebike",
+    "distance_km": 12.5,
+    "estimated_time_minutes": 28,
+    "energy_consumption_kwh": 0.45,
+    "waypoints": [
+        {"lat": 48.8806, "lng": 2.3553},
+        {"lat": 48.8921, "lng": 2.3927}
+    ],
+    "efficiency_score": 0.87,
+    "timestamp": _TIMESTAMP
+}).encode()
 
 
 @pytest.fixture
@@ -84,30 +127,27 @@ def fleet_analysis_request():
     )
 
 
-@pytest.fixture
-def fleet_analysis_response():
-    """Create a sample fleet analysis response."""
-    return {
-        "fleet_id": "fleet_paris_001",
-        "total_vehicles": 250,
-        "active_vehicles": 198,
-        "utilization_rate": 79.2,
-        "avg_battery_health": 89.5,
-        "maintenance_alerts": [
-            {
-                "vehicle_id": "vehicle_123",
-                "component": "battery",
-                "priority": "high"
-            }
-        ],
-        "key_insights": [
-            "Peak demand expected 16:00-19:00"
-        ],
-        "recommendations": [
-            "Reposition 20 vehicles to downtown"
-        ],
-        "timestamp": datetime.utcnow().isoformat()
-    }
+_FLEET_ANALYSIS_RESPONSE_JSON = json.dumps({
+    "fleet_id": "fleet_paris_001",
+    "total_vehicles": 250,
+    "active_vehicles": 198,
+    "utilization_rate": 79.2,
+    "avg_battery_health": 89.5,
+    "maintenance_alerts": [
+        {
+            "vehicle_id": "vehicle_123",
+            "component": "battery",
+            "priority": "high"
+        }
+    ],
+    "key_insights": [
+        "Peak demand expected 16:00-19:00"
+    ],
+    "recommendations": [
+        "Reposition 20 vehicles to downtown"
+    ],
+    "timestamp": _TIMESTAMP
+}).encode()
 
 
 class TestMobilityRoutes:
@@ -134,26 +174,26 @@ class TestMobilityRoutes:
         assert fleet_analysis_request.fleet_id == "fleet_paris_001"
         assert len(fleet_analysis_request.metrics) == 2
 
-    def test_demand_response_normalization(self, demand_response):
+    def test_demand_response_normalization(self):
         """Test demand response normalization."""
-        response = DemandResponse(**demand_response)
+        response = DemandResponse.model_validate_json(_DEMAND_RESPONSE_JSON)
         assert response.location == "Paris-Center"
         assert response.predicted_demand == 150.5
         assert response.confidence == 0.92
         assert len(response.forecast_data) == 2
 
-    def test_route_response_normalization(self, route_response):
+    def test_route_response_normalization(self):
         """Test route response normalization."""
-        response = RouteResponse(**route_response)
+        response = RouteResponse.model_validate_json(_ROUTE_RESPONSE_JSON)
         assert response.route_id == "route_123"
         assert response.distance_km == 12.5
         assert response.energy_consumption_kwh == 0.45
         assert response.efficiency_score == 0.87
         assert len(response.waypoints) == 2
 
-    def test_fleet_analysis_response_normalization(self, fleet_analysis_response):
+    def test_fleet_analysis_response_normalization(self):
         """Test fleet analysis response normalization."""
-        response = FleetAnalysisResponse(**fleet_analysis_response)
+        response = FleetAnalysisResponse.model_validate_json(_FLEET_ANALYSIS_RESPONSE_JSON)
         assert response.fleet_id == "fleet_paris_001"
         assert response.total_vehicles == 250
         assert response.active_vehicles == 198
@@ -163,21 +203,7 @@ class TestMobilityRoutes:
 
     def test_routes_are_registered(self):
         """Verify mobility routes are registered."""
-        routes = router.routes
-        route_paths = [r.path for r in routes if hasattr(r, 'path')]
-        
-        expected_paths = [
-            "/demand/predict",
-            "/routing/optimize",
-            "/fleet/{fleet_id}/analyze",
-            "/vehicle/{vehicle_id}/status",
-            "/vehicle/{vehicle_id}/maintenance",
-            "/fleet/{fleet_id}/optimize-distribution",
-            "/destination/intelligent",
-        ]
-        
-        for path in expected_paths:
-            assert path in route_paths, f"Route {path} not found"
+        assert _EXPECTED_PATHS <= _ROUTE_PATHS, f"Routes not found: {sorted(_EXPECTED_PATHS - _ROUTE_PATHS)}"
 
     def test_demand_request_with_defaults(self):
         """Test demand request with default values."""
@@ -219,44 +245,15 @@ class TestMobilityRoutes:
 
     def test_workflow_integration_exists(self):
         """Verify workflow is properly integrated."""
-        from src.orchestration.mobility.fleet_intelligence import FleetIntelligenceWorkflow
-        
-        workflow = FleetIntelligenceWorkflow()
-        
-        # Verify workflow methods exist
-        assert hasattr(workflow, 'predict_demand')
-        assert hasattr(workflow, 'optimize_route')
-        assert hasattr(workflow, 'analyze_fleet')
-        assert hasattr(workflow, 'get_vehicle_status')
-        assert hasattr(workflow, 'predict_maintenance')
-        assert hasattr(workflow, 'optimize_fleet_distribution')
+        _assert_defines(FleetIntelligenceWorkflow, _WORKFLOW_METHODS)
 
     def test_mapper_integration_exists(self):
         """Verify mapper is properly integrated."""
-        from src.adapters.mobility_ai_engine.mapper import MobilityMapper
-        
-        mapper = MobilityMapper()
-        
-        # Verify mapper methods exist
-        assert hasattr(mapper, 'map_demand_response')
-        assert hasattr(mapper, 'map_route_response')
-        assert hasattr(mapper, 'map_fleet_analysis_response')
-        assert hasattr(mapper, 'map_vehicle_status_response')
-        assert hasattr(mapper, 'map_maintenance_response')
+        _assert_defines(MobilityMapper, _MAPPER_METHODS)
 
     def test_client_integration_exists(self):
         """Verify client is properly integrated."""
-        from src.adapters.mobility_ai_engine.client import MobilityAIClient
-        
-        client = MobilityAIClient()
-        
-        # Verify client methods exist
-        assert hasattr(client, 'predict_demand')
-        assert hasattr(client, 'optimize_route')
-        assert hasattr(client, 'analyze_fleet')
-        assert hasattr(client, 'get_vehicle_status')
-        assert hasattr(client, 'predict_maintenance')
-        assert hasattr(client, 'close')
+        _assert_defines(MobilityAIClient, _CLIENT_METHODS)
 
 
 @pytest.mark.asyncio
@@ -336,5 +333,51 @@ async def test_intelligent_destination_validation_error():
     assert "at least one destination candidate" in str(exc.value.detail)
 
 
+@pytest.mark.asyncio
+async def test_fleet_distribution_uses_bulk_demand_prediction(monkeypatch):
+    monkeypatch.setattr(settings, "mobility_bulk_demand_enabled", True)
+    workflow = FleetIntelligenceWorkflow()
+
+    async def fail_single_prediction(*args, **kwargs):
+        raise AssertionError("bulk path should not fall back to per-location calls")
+
+    monkeypatch.setattr(workflow, "predict_demand", fail_single_prediction)
+
+    plan = await workflow.optimize_fleet_distribution("fleet-1", ["Plateau", "Cocody"])
+
+    assert plan.fleet_id == "fleet-1"
+    assert [item["location"] for item in plan.demand_forecast] == ["Plateau", "Cocody"]
+    assert all(item["predicted_demand"] == 100 for item in plan.demand_forecast)
+    await workflow.close()
+
+
+@pytest.mark.asyncio
+async def test_fleet_distribution_falls_back_when_bulk_response_misses_a_location(monkeypatch):
+    monkeypatch.setattr(settings, "mobility_bulk_demand_enabled", True)
+    workflow = FleetIntelligenceWorkflow()
+    bulk = workflow.client.predict_demand_bulk
+
+    async def drop_last_location(locations, **kwargs):
+        return (await bulk(locations, **kwargs))[:-1]
+
+    monkeypatch.setattr(workflow.client, "predict_demand_bulk", drop_last_location)
+    single_calls = []
+
+    async def record_single_prediction(location, *args):
+        single_calls.append(location)
+        return MobilityMapper.map_demand_response({"location": location, "predicted_demand": 7})
+
+    monkeypatch.setattr(workflow, "predict_demand", record_single_prediction)
+
+    plan = await workflow.optimize_fleet_distribution("fleet-1", ["Plateau", "Cocody"])
+
+    assert single_calls == ["Plateau", "Cocody"]
+    assert plan.demand_forecast == [
+        {"location": "Plateau", "predicted_demand": 7},
+        {"location": "Cocody", "predicted_demand": 7},
+    ]
+    await workflow.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
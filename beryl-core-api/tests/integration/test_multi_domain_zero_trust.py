@@ -6,23 +6,16 @@ logs sécurité, et fallback pour services externes.
 """
 
 import pytest
-import pytest_asyncio
 import json
 import asyncio
-from httpx import AsyncClient, ASGITransport
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
-import sys
-import pathlib
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[2] / "src"))
-from main import app
 
-
-@pytest_asyncio.fixture
-async def test_app():
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+@pytest.fixture
+def test_app(async_client):
+    """The session-wide ASGI client from tests/conftest.py."""
+    return async_client
 
 
 @pytest.fixture
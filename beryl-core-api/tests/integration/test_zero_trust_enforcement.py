@@ -9,26 +9,18 @@ Tests are blocking for production deployment.
 """
 
 import pytest
-import pytest_asyncio
 import json
-import sys
-import pathlib
 from datetime import datetime, date
-from httpx import AsyncClient, ASGITransport
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
 
-sys.path.append(str(pathlib.Path(__file__).resolve().parents[2] / "src"))
-from main import app
 from src.config.settings import settings
 
 
-@pytest_asyncio.fixture
-async def test_app():
-    """Fixture for FastAPI test app with AsyncClient."""
-    # Use the main app for testing
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+@pytest.fixture
+def test_app(async_client):
+    """The session-wide ASGI client from tests/conftest.py."""
+    return async_client
 
 
 @pytest.fixture
@@ -4,6 +4,7 @@ import uuid
 
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.db.models.aoq import (
     AoqAuditTrailModel,
@@ -16,9 +17,13 @@ from src.db.sqlalchemy import Base
 from src.orchestration.aoq.repository import AoqRepository
 
 
-def test_create_decision_creates_ledger_and_audit(tmp_path):
-    db_path = tmp_path / "aoq_decision.sqlite3"
-    engine = create_engine(f"sqlite:///{db_path}", future=True)
+def test_create_decision_creates_ledger_and_audit():
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     SessionLocal = sessionmaker(
         autocommit=False,
         autoflush=False,
@@ -1,9 +1,8 @@
 """Unit tests for AOQ rule persistence against SQLAlchemy models."""
 
-from pathlib import Path
-
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 import src.api.v1.routes.aoq_routes as aoq_routes
 from src.api.v1.schemas.aoq_schema import RuleSchema
@@ -13,9 +12,13 @@ from src.orchestration.aoq.repository import AoqRepository
 from src.orchestration.aoq.service import AoqService
 
 
-def test_create_rule_persists_weights_json(tmp_path: Path):
-    db_path = tmp_path / "aoq_repo.sqlite3"
-    engine = create_engine(f"sqlite:///{db_path}", future=True)
+def test_create_rule_persists_weights_json():
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     TestSessionLocal = sessionmaker(
         autocommit=False,
         autoflush=False,
@@ -56,9 +59,13 @@ def test_create_rule_persists_weights_json(tmp_path: Path):
         }
 
 
-def test_create_rule_handler_persists_rule_in_db(tmp_path: Path):
-    db_path = tmp_path / "aoq_api.sqlite3"
-    engine = create_engine(f"sqlite:///{db_path}", future=True)
+def test_create_rule_handler_persists_rule_in_db():
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     TestSessionLocal = sessionmaker(
         autocommit=False,
         autoflush=False,
@@ -73,7 +80,7 @@ def test_create_rule_handler_persists_rule_in_db(tmp_path: Path):
         def _init_aoq_tables(self) -> None:
             return None
 
-    aoq_routes.service = LocalAoqService(repository=repository)
+    service = LocalAoqService(repository=repository)
 
     payload = RuleSchema(
         name="risk-v4",
@@ -84,7 +91,7 @@ def test_create_rule_handler_persists_rule_in_db(tmp_path: Path):
         weight_social=0.15,
         active=True,
     )
-    response = aoq_routes.create_rule(payload)
+    response = aoq_routes.create_rule(payload, service)
 
     assert response.name == "risk-v4"
     assert response.weight_fintech == 0.35
@@ -0,0 +1,64 @@
+"""Unit tests for the canonical JSON form behind HMAC event signatures."""
+
+import hmac
+import json
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from hashlib import sha256
+
+import pytest
+
+from src.core.security.crypto import canonical_json_bytes, signature_service
+
+
+class _Channel(Enum):
+    MOBILE_MONEY = "mobile_money"
+
+
+class _Tier(IntEnum):
+    GOLD = 2
+
+
+def _stdlib_canonical(payload: dict) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"b": "2500.00", "a": [1, 2, {"d": True, "c": "XOF"}]},
+        {"amount": 12.5, "rate": 655.957, "tiny": 9.29e-05, "huge": 2.95e16},
+        {"merchant": "Société Générale", "memo": "\x7f "},
+        {"optional": None, "nan": float("nan"), "inf": float("-inf")},
+        {"big": 2**70, "note": "1e5 0.00001"},
+        {"payload": "x" * 100_000, "items": list(range(1_000))},
+    ],
+)
+def test_canonical_json_matches_stdlib_bytes(payload):
+    assert canonical_json_bytes(payload) == _stdlib_canonical(payload)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"at": datetime(2026, 1, 1, tzinfo=timezone.utc)},
+        {"channel": _Channel.MOBILE_MONEY},
+        {"legs": [{"channel": _Channel.MOBILE_MONEY}]},
+    ],
+)
+def test_canonical_json_still_rejects_non_json_types(payload):
+    with pytest.raises(TypeError):
+        canonical_json_bytes(payload)
+
+
+def test_canonical_json_keeps_int_enums_on_their_value():
+    payload = {"tier": _Tier.GOLD}
+    assert canonical_json_bytes(payload) == _stdlib_canonical(payload) == b'{"tier":2}'
+
+
+def test_signature_is_unchanged_from_hmac_over_stdlib_json():
+    payload = {"event_id": "evt-1", "amount": "100.00", "currency": "XOF"}
+    expected = hmac.new(b"secret", _stdlib_canonical(payload), sha256).hexdigest()
+
+    assert signature_service.sign(payload=payload, secret="secret") == expected
+    assert signature_service.verify(payload=payload, signature=expected, secret="secret")
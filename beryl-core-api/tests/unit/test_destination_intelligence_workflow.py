@@ -1,7 +1,10 @@
 """Unit tests for mobility destination intelligence workflow."""
 
+import pytest
+
 from src.api.v1.schemas.mobility_schema import DestinationHistoryItem
 from src.orchestration.mobility.destination_intelligence import (
+    DestinationAlternativeResult,
     DestinationIntelligenceWorkflow,
     MobilityDestinationValidationError,
 )
@@ -79,3 +82,114 @@ def test_destination_workflow_raises_for_empty_candidate_pool():
         assert "at least one destination candidate" in str(exc)
     else:
         raise AssertionError("Expected MobilityDestinationValidationError")
+
+
+def test_destination_workflow_reuses_simulation_for_repeat_routes():
+    workflow = DestinationIntelligenceWorkflow()
+    request = dict(
+        user_id="user-4",
+        origin="Plateau",
+        query="Cocody",
+        candidate_destinations=["Cocody"],
+        trip_history=[],
+        travel_mode="eco",
+        traffic_level="low",
+        weather_risk="low",
+        is_recurring=False,
+        hour_of_day=12,
+    )
+
+    first = workflow.evaluate(battery_level=60, **request)
+    second = workflow.evaluate(battery_level=90, **request)
+    low_battery = workflow.evaluate(battery_level=20, **request)
+
+    assert second.simulation is first.simulation
+    assert low_battery.simulation is not first.simulation
+    assert low_battery.simulation.energy_kwh <= first.simulation.energy_kwh
+
+
+def test_destination_alternative_rounds_only_when_serialized():
+    alternative = DestinationAlternativeResult(destination="Cocody", confidence=0.123456, score=0.987654)
+
+    assert alternative.confidence == 0.123456
+    assert alternative.to_dict() == {"destination": "Cocody", "confidence": 0.1235, "score": 0.9877}
+
+
+def test_destination_batch_scoring_matches_python_path():
+    pytest.importorskip("numba")
+    workflow = DestinationIntelligenceWorkflow()
+    names = [f"Zone {index}" for index in range(14)] + ["Bureau Plateau", "Maison Cocody", "Ecole Riviera"]
+    candidates = [(name, name.lower()) for name in names]
+    history_counts = {"zone 1": 3, "bureau plateau": 9, "maison cocody": 1}
+
+    for hour in (8, 19):
+        batch = workflow._score_candidates_batch(
+            query_key="bureau plateau",
+            candidates=candidates,
+            history_counts=history_counts,
+            is_recurring=True,
+            hour_of_day=hour,
+            traffic_level="moderate",
+            weather_risk="high",
+        )
+        single = [
+            workflow._score_candidate(
+                query_key="bureau plateau",
+                destination=destination,
+                destination_key=destination_key,
+                history_count=history_counts.get(destination_key, 0),
+                is_recurring=True,
+                hour_of_day=hour,
+                traffic_level="moderate",
+                weather_risk="high",
+            )
+            for destination, destination_key in candidates
+        ]
+        assert batch == single
+
+
+def test_destination_candidates_are_deduplicated_case_insensitively_in_order():
+    workflow = DestinationIntelligenceWorkflow()
+
+    candidates = workflow._collect_candidates(
+        " Cocody ",
+        ["Marcory", "cocody", "  ", "Aeroport"],
+        ["MARCORY", "Yopougon"],
+    )
+
+    assert candidates == [
+        ("Cocody", "cocody"),
+        ("Marcory", "marcory"),
+        ("Aeroport", "aeroport"),
+        ("Yopougon", "yopougon"),
+    ]
+
+
+def test_destination_aoq_rationale_format():
+    workflow = DestinationIntelligenceWorkflow()
+
+    result = workflow.evaluate(
+        user_id="user-5",
+        origin="Plateau",
+        query="Marcory",
+        candidate_destinations=[],
+        trip_history=[],
+        travel_mode="solo",
+        traffic_level="low",
+        weather_risk="high",
+        battery_level=None,
+        is_recurring=False,
+        hour_of_day=12,
+    )
+
+    assert result.aoq.rationale == (
+        f"mobility_score={result.aoq.mobility_score:.2f};"
+        f"esg_score={result.aoq.esg_score:.2f};"
+        "dispatch=safety_mode;traffic=low;weather=high"
+    )
+
+
+def test_destination_history_counts_merge_case_variants():
+    counts = DestinationIntelligenceWorkflow._history_counts([("Cocody", 3), ("COCODY", 2), ("", 4), ("Marcory", 1)])
+
+    assert counts == {"cocody": 5, "marcory": 1}
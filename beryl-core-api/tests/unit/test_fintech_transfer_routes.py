@@ -7,6 +7,7 @@ import pytest
 from fastapi import HTTPException
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from starlette.requests import Request
 
 import src.api.v1.routes.fintech_routes as fintech_routes
@@ -35,9 +36,13 @@ def _request(path: str) -> Request:
 
 
 @pytest.fixture
-def fintech_transfer_db(monkeypatch, tmp_path):
-    db_path = tmp_path / "fintech_transfer.sqlite3"
-    engine = create_engine(f"sqlite:///{db_path}", future=True)
+def fintech_transfer_db(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     Base.metadata.create_all(
         bind=engine,
         tables=[
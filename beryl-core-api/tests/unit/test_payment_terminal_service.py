@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 import app.payment_terminal.service as payment_terminal_service_module
 from app.payment_terminal.schemas import (
@@ -19,9 +20,13 @@ from src.db.sqlalchemy import Base
 
 
 @pytest.fixture
-def payment_terminal_context(monkeypatch, tmp_path):
-    db_path = tmp_path / "payment_terminal.sqlite3"
-    engine = create_engine(f"sqlite:///{db_path}", future=True)
+def payment_terminal_context(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     Base.metadata.create_all(bind=engine, tables=[OutboxEventModel.__table__], checkfirst=True)
     factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
     monkeypatch.setattr(payment_terminal_service_module, "SessionLocal", factory)
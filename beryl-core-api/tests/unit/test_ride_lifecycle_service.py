@@ -0,0 +1,288 @@
+"""Unit tests for the in-memory mobility ride lifecycle kernel."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+from src.api.v1.schemas.mobility_schema import RideStateResponse
+from src.orchestration.mobility.ride_lifecycle import (
+    RideLifecycleService,
+    RideNotFoundError,
+    RideQuoteNotFoundError,
+    RideStateTransitionError,
+    _BoundedTTLCache,
+)
+
+
+async def _book(service: RideLifecycleService, suffix: str = "1") -> dict:
+    quote = await service.quote_ride(
+        rider_id="rider-1",
+        pickup_label="5.345,-4.024",
+        dropoff_label="5.372,-4.011",
+        service_tier="standard",
+        idempotency_key=f"quote-{suffix}",
+    )
+    return await service.book_ride(quote_id=quote["quote_id"], rider_id="rider-1", idempotency_key=f"book-{suffix}")
+
+
+async def test_ride_lifecycle_book_assign_complete():
+    service = RideLifecycleService()
+
+    ride = await _book(service)
+    assert ride["status"] == "BOOKED"
+
+    assigned = await service.assign_ride(ride_id=ride["ride_id"], driver_id="driver-test-1", idempotency_key="assign-1")
+    assert assigned["status"] == "ASSIGNED"
+    assert assigned["driver_id"] == "driver-test-1"
+
+    completed = await service.complete_ride(
+        ride_id=ride["ride_id"],
+        distance_km=6.4,
+        duration_minutes=22,
+        idempotency_key="complete-1",
+    )
+    assert completed["status"] == "COMPLETED"
+    assert completed["final_price_xof"] >= completed["estimated_price_xof"]
+    assert (await service.get_ride(ride_id=ride["ride_id"]))["status"] == "COMPLETED"
+
+
+async def test_ride_lifecycle_replays_idempotent_requests():
+    service = RideLifecycleService()
+    request = dict(
+        rider_id="rider-1",
+        pickup_label="Cocody",
+        dropoff_label="Plateau",
+        service_tier="comfort",
+        idempotency_key="quote-replay",
+    )
+
+    first = await service.quote_ride(**request)
+    second = await service.quote_ride(**request)
+
+    assert second == first
+
+    ride = await service.book_ride(quote_id=first["quote_id"], rider_id="rider-1", idempotency_key="book-replay")
+    replay = await service.book_ride(quote_id=first["quote_id"], rider_id="rider-1", idempotency_key="book-replay")
+    assert replay["ride_id"] == ride["ride_id"]
+
+
+async def test_ride_lifecycle_rejects_invalid_transitions():
+    service = RideLifecycleService()
+    ride = await _book(service)
+
+    with pytest.raises(RideStateTransitionError):
+        await service.complete_ride(ride_id=ride["ride_id"], distance_km=None, duration_minutes=None, idempotency_key="c-1")
+
+    await service.cancel_ride(ride_id=ride["ride_id"], reason="user_cancelled", idempotency_key="cancel-1")
+    with pytest.raises(RideStateTransitionError):
+        await service.assign_ride(ride_id=ride["ride_id"], driver_id=None, idempotency_key="assign-after-cancel")
+
+    with pytest.raises(RideNotFoundError):
+        await service.get_ride(ride_id="missing-ride")
+
+
+async def test_ride_lifecycle_concurrent_assignments_have_single_winner():
+    service = RideLifecycleService()
+    ride = await _book(service)
+
+    async def assign(index: int) -> str:
+        try:
+            await service.assign_ride(ride_id=ride["ride_id"], driver_id=f"driver-{index}", idempotency_key=f"assign-{index}")
+        except RideStateTransitionError:
+            return "rejected"
+        return "assigned"
+
+    outcomes = await asyncio.gather(*(assign(index) for index in range(32)))
+
+    assert outcomes.count("assigned") == 1
+    assert (await service.get_ride(ride_id=ride["ride_id"]))["status"] == "ASSIGNED"
+
+
+async def test_ride_quote_batch_matches_single_quotes():
+    labels = [
+        ("5.345,-4.024", "5.372,-4.011"),
+        ("Cocody", "Plateau"),
+        ("5.300,-4.000", "5.410,-3.950"),
+    ]
+    requests = [
+        {
+            "rider_id": "rider-1",
+            "pickup_label": pickup,
+            "dropoff_label": dropoff,
+            "service_tier": "premium",
+            "idempotency_key": f"batch-{index}",
+        }
+        for index, (pickup, dropoff) in enumerate(labels)
+    ]
+
+    batch = await RideLifecycleService().quote_rides_batch(requests)
+    single_service = RideLifecycleService()
+    singles = [await single_service.quote_ride(**request) for request in requests]
+
+    assert len(batch) == len(singles)
+    for batch_quote, single_quote in zip(batch, singles):
+        assert batch_quote["distance_km"] == single_quote["distance_km"]
+        assert batch_quote["estimated_price_xof"] == single_quote["estimated_price_xof"]
+        assert batch_quote["estimated_eta_minutes"] == single_quote["estimated_eta_minutes"]
+
+
+def test_ride_price_normalizes_tier_and_defaults_to_standard():
+    price = RideLifecycleService._estimate_price_xof
+
+    assert price(distance_km=5.0, service_tier=" Premium ", demand_multiplier=1.0) == price(
+        distance_km=5.0, service_tier="premium", demand_multiplier=1.0
+    )
+    assert price(distance_km=5.0, service_tier="unknown", demand_multiplier=1.0) == price(
+        distance_km=5.0, service_tier="standard", demand_multiplier=1.0
+    )
+    assert price(distance_km=0.5, service_tier="standard", demand_multiplier=1.0) == 1200
+
+
+def test_ride_price_uses_exact_integer_rounding():
+    price = RideLifecycleService._estimate_price_xof
+
+    assert price(distance_km=5.0, service_tier="standard", demand_multiplier=1.05) == 2520
+    # 1200 + 1.35 * 430 = 1780.5 XOF rounds half-up, not to even.
+    assert price(distance_km=1.35, service_tier="comfort", demand_multiplier=1.0) == 1781
+    assert isinstance(price(distance_km=7.77, service_tier="premium", demand_multiplier=1.13), int)
+
+
+async def test_ride_responses_are_read_only():
+    service = RideLifecycleService()
+    ride = await _book(service)
+
+    with pytest.raises(TypeError):
+        ride["status"] = "COMPLETED"
+    with pytest.raises(TypeError):
+        (await service.get_ride(ride_id=ride["ride_id"]))["status"] = "COMPLETED"
+    assert (await service.get_ride(ride_id=ride["ride_id"]))["status"] == "BOOKED"
+
+
+async def test_ride_assignment_generates_driver_id_when_missing():
+    service = RideLifecycleService()
+    ride = await _book(service)
+
+    assigned = await service.assign_ride(ride_id=ride["ride_id"], driver_id=None, idempotency_key="assign-auto")
+
+    assert assigned["driver_id"].startswith("driver-")
+    assert len(assigned["driver_id"]) == len("driver-") + 8
+
+
+async def test_ride_booking_rejects_expired_quote():
+    service = RideLifecycleService()
+    quote = await service.quote_ride(
+        rider_id="rider-1",
+        pickup_label="Cocody",
+        dropoff_label="Plateau",
+        service_tier="standard",
+        idempotency_key="quote-expired",
+    )
+    service._quotes[quote["quote_id"]].expires_at_ns = 0
+
+    with pytest.raises(RideQuoteNotFoundError, match="Quote expired"):
+        await service.book_ride(quote_id=quote["quote_id"], rider_id="rider-1", idempotency_key="book-expired")
+
+
+async def test_ride_aggregates_scan_column_store():
+    service = RideLifecycleService()
+    rides = [await _book(service, suffix=str(index)) for index in range(1500)]
+    for index, ride in enumerate(rides[:10]):
+        await service.assign_ride(ride_id=ride["ride_id"], driver_id="driver-agg", idempotency_key=f"agg-assign-{index}")
+    completed = [
+        await service.complete_ride(
+            ride_id=ride["ride_id"],
+            distance_km=None,
+            duration_minutes=None,
+            idempotency_key=f"agg-complete-{index}",
+        )
+        for index, ride in enumerate(rides[:4])
+    ]
+    await service.cancel_ride(ride_id=rides[-1]["ride_id"], reason="user_cancelled", idempotency_key="agg-cancel")
+
+    assert service.count_rides(status="BOOKED") == 1500 - 10 - 1
+    assert service.count_rides(status="ASSIGNED", service_tier="standard") == 6
+    assert service.count_rides(status="ASSIGNED", service_tier="premium") == 0
+    assert service.count_rides(status="CANCELLED") == 1
+    assert service.completed_revenue_xof() == sum(ride["final_price_xof"] for ride in completed)
+
+
+async def test_ride_records_share_interned_tier_strings():
+    service = RideLifecycleService()
+    tier = "".join(["prem", "ium"])
+
+    quote = await service.quote_ride(
+        rider_id="rider-1",
+        pickup_label="Cocody",
+        dropoff_label="Plateau",
+        service_tier=tier,
+        idempotency_key="quote-interned",
+    )
+
+    assert quote["service_tier"] is sys.intern("premium")
+
+
+async def test_ride_replay_payload_matches_response_schema():
+    pytest.importorskip("orjson")
+    service = RideLifecycleService()
+    ride = await _book(service)
+    await service.assign_ride(ride_id=ride["ride_id"], driver_id="driver-json", idempotency_key="assign-json")
+    completed = await service.complete_ride(
+        ride_id=ride["ride_id"],
+        distance_km=6,
+        duration_minutes=30,
+        idempotency_key="complete-json",
+    )
+
+    assert service.replay_json(action="quote", idempotency_key="missing") is None
+    assert service.replay_json(action="book", idempotency_key="book-1") == (
+        RideStateResponse.model_validate(ride).model_dump_json().encode()
+    )
+    assert service.replay_json(action="complete", idempotency_key="complete-json") == (
+        RideStateResponse.model_validate(completed).model_dump_json().encode()
+    )
+
+
+def test_ride_caches_are_bounded_and_expire(monkeypatch):
+    cache = _BoundedTTLCache(maxsize=2, ttl_seconds=1)
+    clock = iter([0, 1, 2, 3, 2_000_000_000])
+    monkeypatch.setattr("src.orchestration.mobility.ride_lifecycle.time.monotonic_ns", lambda: next(clock))
+
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache["b"] == 2
+    assert cache.get("c") is None
+    with pytest.raises(KeyError):
+        cache["c"]
+
+
+@pytest.mark.parametrize(
+    ("label", "expected"),
+    [
+        ("5.345,-4.024", (5.345, -4.024)),
+        (" +5.3 , -4. ", (5.3, -4.0)),
+        (".5,4", (0.5, 4.0)),
+        ("Cocody", None),
+        ("5.3,-4.0,1", None),
+        ("nan,nan", None),
+        ("95,0", None),
+    ],
+)
+def test_ride_coordinate_labels_parse(label, expected):
+    assert RideLifecycleService._parse_coordinates(label) == expected
+
+
+def test_ride_cache_setdefault_keeps_first_writer():
+    cache = _BoundedTTLCache(maxsize=4, ttl_seconds=60)
+
+    first = cache.setdefault("k", {"winner": 1})
+    second = cache.setdefault("k", {"winner": 2})
+
+    assert first is second
+    assert cache["k"] == {"winner": 1}